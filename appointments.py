@@ -0,0 +1,140 @@
+"""Appointments in start-time order, with repeating series expanded on demand.
+
+A repeating appointment such as a weekly therapy session is stored as one
+row: its first session, a ``repeat`` interval and an optional ``until``. Its
+sessions are never copied into storage. They are generated from the first
+start and the interval only as far as a query reads.
+
+Each user's index keeps one-off appointments in a list sorted by start time,
+alongside the list of series. A query bisects to the first one-off in range
+and merges it lazily with each series' sessions. Reading the next three
+appointments, or a week or a month of them, therefore touches only what it
+returns (plus one step per series), however many sessions have been
+scheduled.
+
+The index is rebuilt when the appointments collection's version changes.
+"""
+import bisect
+import heapq
+import threading
+from datetime import datetime, timedelta
+from itertools import islice, takewhile
+
+import cache
+import storage
+
+REPEATS = {'Weekly': timedelta(weeks=1), 'Every 2 Weeks': timedelta(weeks=2)}
+MAX_INDEXES = 1024
+
+
+def sessions(record, after):
+    """Start times of ``record`` strictly after ``after``, earliest first"""
+    start = record['datetime']
+    step = REPEATS.get(record.get('repeat'))
+    if step is None:
+        if start > after:
+            yield start
+        return
+    # Jump straight to the first session past ``after``
+    at = start if start > after else start + step * ((after - start) // step + 1)
+    until = record.get('until')
+    while until is None or at <= until:
+        yield at
+        at += step
+
+
+def session(record, start):
+    """``record`` as the session starting at ``start``"""
+    return record if start == record['datetime'] else {**record, 'datetime': start}
+
+
+def _series_stream(rank, record, after):
+    # Ties between streams are broken by rank so records are never compared
+    for at in sessions(record, after):
+        yield at, rank, record
+
+
+class AppointmentIndex:
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._lock = threading.RLock()
+        self._version = None
+        self._starts = []
+        self._one_offs = []
+        self._series = []
+
+    def _sync(self):
+        # Called on a page's script thread, scoped to this user
+        version = storage.version('appointments')
+        if version != self._version:
+            self._load()
+            self._version = version
+
+    def _load(self):
+        # Storage returns appointments in start order from its index
+        self._starts, self._one_offs, self._series = [], [], []
+        for record in storage.fetch('appointments'):
+            self._place(record)
+
+    def _place(self, record):
+        if record.get('repeat') in REPEATS:
+            self._series.append(record)
+            return
+        at = bisect.bisect_right(self._starts, record['datetime'])
+        self._starts.insert(at, record['datetime'])
+        self._one_offs.insert(at, record)
+
+    def _after(self, moment):
+        first = bisect.bisect_right(self._starts, moment)
+        one_offs = ((self._starts[i], i, self._one_offs[i]) for i in range(first, len(self._starts)))
+        series = [_series_stream(-1 - rank, record, moment) for rank, record in enumerate(self._series)]
+        for at, _, record in heapq.merge(one_offs, *series):
+            yield session(record, at)
+
+    # Reads
+
+    def upcoming(self, limit=3, now=None):
+        """The next ``limit`` sessions after ``now``"""
+        with self._lock:
+            self._sync()
+            return list(islice(self._after(now or datetime.now()), limit))
+
+    def between(self, start, end):
+        """Sessions starting after ``start`` and before ``end``, in time order"""
+        with self._lock:
+            self._sync()
+            return list(takewhile(lambda a: a['datetime'] < end, self._after(start)))
+
+    def month(self, year, month):
+        """Every session in a calendar month"""
+        first = datetime(year, month, 1)
+        following = datetime(year + month // 12, month % 12 + 1, 1)
+        return self.between(first - timedelta.resolution, following)
+
+    def active(self, now=None):
+        """Each appointment's session that hasn't ended yet, if any, in time order
+
+        Used to load reminders: one entry per stored row, so a series counts once.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            self._sync()
+            found = []
+            for record in self._series:
+                for at in sessions(record, now - timedelta(days=1)):
+                    if at + timedelta(minutes=record['duration'] or 0) > now:
+                        found.append(session(record, at))
+                        break
+            # Nothing that started more than a day ago is still running
+            first = bisect.bisect_right(self._starts, now - timedelta(days=1))
+            found.extend(r for r in self._one_offs[first:]
+                         if r['datetime'] + timedelta(minutes=r['duration'] or 0) > now)
+            return sorted(found, key=lambda r: r['datetime'])
+
+
+_indexes = cache.PerUser(AppointmentIndex, MAX_INDEXES)
+
+
+def index(user_id=None):
+    """The appointment index for ``user_id``, by default the current user"""
+    return _indexes.get(user_id)
@@ -0,0 +1,67 @@
+"""Stylesheet delivery.
+
+``style.css`` is resolved next to the app, not the working directory. It is
+minified once and fingerprinted with a hash of its content. The result is
+kept per process and rebuilt only when the file's modification time or size
+changes, so edits show up on the next rerun without a restart.
+
+Every rerun emits the same ``<style>`` element byte for byte until the file
+changes. Streamlit's forward-message cache (see ``.streamlit/config.toml``)
+then sends the stylesheet to a browser once per session and only a reference
+to it afterwards.
+"""
+import hashlib
+import logging
+import re
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+STYLE_PATH = Path(__file__).resolve().parent / 'style.css'
+
+Stylesheet = namedtuple('Stylesheet', 'fingerprint css tag')
+
+logger = logging.getLogger(__name__)
+
+_COMMENTS = re.compile(r'/\*.*?\*/', re.S)
+_SPACE = re.compile(r'\s+')
+_AROUND_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+
+_lock = threading.Lock()
+_built = {}
+_missing = set()
+
+
+def minify(css):
+    """Drop comments and whitespace that CSS doesn't need"""
+    css = _COMMENTS.sub('', css)
+    css = _SPACE.sub(' ', css)
+    css = _AROUND_PUNCTUATION.sub(r'\1', css)
+    css = css.replace(': ', ':').replace(';}', '}')
+    return css.strip()
+
+
+def stylesheet(path=STYLE_PATH):
+    """The minified, fingerprinted stylesheet, or None if the file is missing"""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        # Said once, not on every rerun, until the file comes back
+        with _lock:
+            if path not in _missing:
+                _missing.add(path)
+                logger.warning('Stylesheet %s not found; pages will use the default theme', path)
+        return None
+    state = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        _missing.discard(path)
+        cached = _built.get(path)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+    css = minify(path.read_text(encoding='utf-8'))
+    fingerprint = hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+    sheet = Stylesheet(fingerprint, css, f'<style data-asset="{path.name}" data-fingerprint="{fingerprint}">{css}</style>')
+    with _lock:
+        _built[path] = (state, sheet)
+    return sheet
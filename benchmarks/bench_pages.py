@@ -0,0 +1,184 @@
+"""Per-page rerun benchmarks for app.py.
+
+Each dataset scale runs in its own subprocess against a fresh data
+directory, filled with N synthetic records per collection. Every page is
+rerun headlessly with Streamlit's AppTest. The results (p50/p95 wall time
+per rerun and peak traced memory) go to a JSON file.
+
+    python benchmarks/bench_pages.py                       # all pages, 10/1k/10k/100k
+    python benchmarks/bench_pages.py --scales 10 1000 --repeats 5 --output out.json
+    python benchmarks/bench_pages.py --pages "📔 Journal" "👥 Community"
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+APP_PATH = APP_DIR / 'app.py'
+
+PAGES = ["📊 Dashboard", "🏠 Home", "😊 Mood Tracking", "🌟 Coping Strategies", "🎯 Goals",
+         "👥 Community", "📞 Professional Support", "💬 Chat Support", "💊 Medications",
+         "📔 Journal", "📚 Education", "👤 Profile"]
+SCALES = [10, 1_000, 10_000, 100_000]
+
+
+def populate(n, seed=0):
+    """Fill the current data directory with ``n`` records per collection"""
+    sys.path.insert(0, str(APP_DIR))
+    import dose_store
+    import mood_store
+    import storage
+
+    rng = random.Random(seed)
+    now = datetime.now()
+    ids = lambda: str(uuid.UUID(int=rng.getrandbits(128), version=4))
+    # Spread records over n hours back from now so histories look realistic
+    stamps = [now - timedelta(hours=i) for i in range(n)]
+    labels = {1: ('Very Low', '😢'), 2: ('Low', '😔'), 3: ('Okay', '😐'), 4: ('Good', '🙂'), 5: ('Great', '😊')}
+    words = 'today felt calm anxious tired hopeful work therapy walk sleep friend breathing better hard'.split()
+    text = lambda k: ' '.join(rng.choice(words) for _ in range(k))
+
+    moods = []
+    for stamp in stamps:
+        value = rng.randint(1, 5)
+        moods.append({'id': ids(), 'date': stamp.strftime('%Y-%m-%d'), 'datetime': stamp, 'value': value,
+                      'label': labels[value][0], 'emoji': labels[value][1], 'notes': ''})
+    mood_store.add_many(moods)
+    storage.insert_many('goals', [
+        {'id': ids(), 'text': text(6), 'completed': rng.random() < 0.4, 'created': s, 'category': 'Mindfulness'}
+        for s in stamps])
+    storage.insert_many('journal_entries', [
+        {'id': ids(), 'content': text(40), 'timestamp': s, 'mood': rng.randint(1, 5), 'tags': []}
+        for s in stamps])
+    medications = [
+        {'id': ids(), 'name': f'Medication {i}', 'dosage': '10mg', 'time': '08:00 AM',
+         'frequency': rng.choice(['Daily', 'PRN', 'Weekly']), 'purpose': 'N/A', 'created': now - timedelta(days=90)}
+        for i in range(n)]
+    storage.insert_many('medications', medications)
+    # One dose event per record, spread over the medications, so no page falls back to seeding doses
+    dose_store.add_many(dose_store.event(medications[i]['id'], rng.random() < 0.9, s, ids())
+                        for i, s in enumerate(stamps))
+    storage.insert_many('appointments', [
+        {'id': ids(), 'title': 'Therapy Session', 'datetime': now + timedelta(hours=i + 1), 'duration': 50,
+         'type': 'Therapy', 'location': 'Virtual', 'notes': ''}
+        for i in range(n)])
+    storage.insert_many('symptoms', [
+        {'id': ids(), 'name': rng.choice(['Anxiety', 'Sleep Quality', 'Concentration']),
+         'severity': rng.randint(1, 10), 'date': s.strftime('%Y-%m-%d'), 'notes': ''}
+        for s in stamps])
+    storage.insert_many('community_posts', [
+        {'id': ids(), 'author': 'Member', 'content': text(25), 'likes': rng.randint(0, 50), 'timestamp': s, 'tags': []}
+        for s in stamps])
+    storage.insert_many('chat_messages', [
+        {'id': ids(), 'role': 'user' if i % 2 else 'assistant', 'content': text(20), 'timestamp': s}
+        for i, s in enumerate(reversed(stamps))])
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def bench_scale(scale, pages, repeats, timeout):
+    """Worker: populate once, then time every page; returns result rows"""
+    from streamlit.testing.v1 import AppTest
+
+    populate(scale)
+    os.chdir(APP_DIR)
+    results = []
+    for page in pages:
+        row = {'page': page, 'scale': scale, 'runs': 0, 'p50_ms': None, 'p95_ms': None,
+               'peak_memory_kb': None, 'error': None}
+        try:
+            at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+            at.run()
+            at.radio[0].set_value(page).run()  # warm-up: first render of the page
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                at.run()
+                timings.append((time.perf_counter() - start) * 1000)
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+            # Memory is traced in a separate rerun so it doesn't skew timings
+            tracemalloc.start()
+            at.run()
+            row['peak_memory_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            tracemalloc.stop()
+            row.update(runs=len(timings), p50_ms=round(percentile(timings, 50), 2),
+                       p95_ms=round(percentile(timings, 95), 2))
+        except Exception as exc:  # a page that times out or crashes is a result too
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            row['error'] = f'{type(exc).__name__}: {exc}'
+        results.append(row)
+        print(f"  {page:<24} {row['p50_ms']} / {row['p95_ms']} ms  {row['peak_memory_kb']} KB"
+              f"{'  ' + row['error'] if row['error'] else ''}", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES)
+    parser.add_argument('--pages', nargs='+', default=PAGES)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=60, help='seconds allowed per rerun')
+    parser.add_argument('--output', default='benchmarks/results.json')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        json.dump(bench_scale(args.worker, args.pages, args.repeats, args.timeout), sys.stdout)
+        return
+
+    import streamlit
+
+    results = []
+    failed = set()
+    for scale in sorted(args.scales):
+        # A page that already failed at a smaller scale is not retried on more data
+        pages = [p for p in args.pages if p not in failed]
+        results.extend({'page': p, 'scale': scale, 'error': 'skipped: failed at a smaller scale'}
+                       for p in args.pages if p in failed)
+        if not pages:
+            continue
+        print(f'scale {scale}', file=sys.stderr)
+        with tempfile.TemporaryDirectory() as data_dir:
+            env = dict(os.environ, MINDCARE_DATA_DIR=data_dir, PYTHONPATH=str(APP_DIR))
+            proc = subprocess.run(
+                [sys.executable, __file__, '--worker', str(scale), '--repeats', str(args.repeats),
+                 '--timeout', str(args.timeout), '--pages', *pages],
+                env=env, stdout=subprocess.PIPE, text=True)
+            if proc.returncode:
+                rows = [{'page': p, 'scale': scale, 'error': f'worker exited {proc.returncode}'} for p in pages]
+            else:
+                rows = json.loads(proc.stdout)
+            results.extend(rows)
+            failed.update(row['page'] for row in rows if row['error'])
+
+    report = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'repeats': args.repeats,
+        'results': results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    print(f'wrote {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
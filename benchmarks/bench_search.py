@@ -0,0 +1,78 @@
+"""Therapist directory search benchmarks.
+
+Builds a directory of N synthetic providers, drawn from the facet values of
+``content/providers.json`` with a fixed seed, and times ``search`` for a few
+filter sets at shallow and deep result pages.
+
+    python benchmarks/bench_search.py                      # 100k providers
+    python benchmarks/bench_search.py --providers 10000 --pages 0 100 --repeats 50
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+import therapists  # noqa: E402
+
+QUERIES = {
+    'everyone': {},
+    'one specialty': {'specialties': ['Anxiety']},
+    'specialty + cost': {'specialties': ['Anxiety', 'Depression'], 'max_cost': 150},
+}
+
+
+def synthetic_providers(n, seed=0):
+    """Generated providers for load testing the directory"""
+    rng = random.Random(seed)
+    sample = json.loads(therapists.PROVIDERS_PATH.read_text(encoding='utf-8'))
+    options = {facet: sorted({v for p in sample for v in p[facet]}) for facet in therapists.FACETS}
+    cities = sorted({p['city'] for p in sample})
+    providers = []
+    for i in range(n):
+        cost_min = rng.randrange(40, 260, 5)
+        providers.append({
+            'id': f'synthetic-{i}',
+            'name': f'Provider {i}, LCSW',
+            **{facet: rng.sample(values, rng.randint(1, min(4, len(values)))) for facet, values in options.items()},
+            'cost_min': cost_min,
+            'cost_max': cost_min + rng.randrange(0, 60, 5),
+            'rating': round(rng.uniform(3.5, 5.0), 1),
+            'reviews': rng.randint(0, 400),
+            'availability': 'Next available: This week',
+            'credentials': 'Licensed Clinical Social Worker',
+            'experience': f'{rng.randint(1, 30)} years',
+            'city': rng.choice(cities),
+            'location': rng.choice(['Virtual Only', 'Virtual + Office', 'Office']),
+        })
+    return providers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--providers', type=int, default=100_000)
+    parser.add_argument('--pages', type=int, nargs='+', default=[0, 100, 2000])
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    directory = therapists.ProviderDirectory(synthetic_providers(args.providers))
+    print(f'built {args.providers} providers in {time.perf_counter() - start:.2f}s')
+    for name, query in QUERIES.items():
+        for page in args.pages:
+            samples = []
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                results, total = directory.search(page=page, **query)
+                samples.append(time.perf_counter() - start)
+            print(f'  {name:<18} page {page:<6} {len(results)}/{total:<7} '
+                  f'p50 {statistics.median(samples) * 1000:7.2f} ms  max {max(samples) * 1000:7.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
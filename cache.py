@@ -0,0 +1,130 @@
+"""Process-wide memoization keyed on collection data versions.
+
+Results are cached under their call arguments plus the current owner and
+``storage.version()`` of every collection they depend on. A write bumps the
+version, so the next call rebuilds. Reruns that didn't touch the data hit the
+cache. Entries are shared by all sessions and evicted least-recently-used.
+
+Caches are registered under the function's module and qualified name, and
+declaring the same function again returns its existing cache. A builder
+declared in a script that Streamlit re-executes on every rerun (app.py runs
+as ``__main__``) therefore keeps its entries across reruns rather than
+starting empty each time.
+
+``PerUser`` keeps one long-lived object per user (the counters engine, the
+reminder scheduler, the appointment index) in the same kind of bounded LRU.
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+import storage
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class VersionedCache:
+    """Bounded LRU mapping with hit/miss counters"""
+
+    def __init__(self, name, maxsize=64):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+class PerUser:
+    """One object per user, made by ``factory(user_id)`` on first use
+
+    Only the ``maxsize`` most recently used are kept; an evicted one is made
+    again, from storage, on its next use. ``on_create`` is called with each
+    new object.
+    """
+
+    def __init__(self, factory, maxsize=1024, on_create=None):
+        self.factory = factory
+        self.maxsize = maxsize
+        self.on_create = on_create
+        self._objects = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id=None):
+        """The object for ``user_id``, by default the current user"""
+        user_id = user_id or storage.current_user()
+        with self._lock:
+            found = self._objects.get(user_id)
+            if found is not None:
+                self._objects.move_to_end(user_id)
+                return found
+            found = self._objects[user_id] = self.factory(user_id)
+            while len(self._objects) > self.maxsize:
+                self._objects.popitem(last=False)
+        if self.on_create is not None:
+            self.on_create(found)
+        return found
+
+    def values(self):
+        """The objects currently kept, least recently used first"""
+        with self._lock:
+            return list(self._objects.values())
+
+
+def named(name, maxsize=64):
+    """The registered cache called ``name``, created on first use"""
+    with _registry_lock:
+        cache = _registry.get(name)
+        if cache is None:
+            cache = _registry[name] = VersionedCache(name, maxsize)
+        return cache
+
+
+def versioned(*collections, maxsize=64):
+    """Memoize a function until any of ``collections`` is written to
+
+    Cached values are shared between sessions, so callers must treat them as
+    read-only.
+    """
+    def decorator(func):
+        cache = named(f'{func.__module__}.{func.__qualname__}', maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # User-scoped collections are versioned per user, so the owner is
+            # part of the key too
+            versions = tuple((storage.owner(c), storage.version(c)) for c in collections)
+            key = (versions, args, tuple(sorted(kwargs.items())))
+            return cache.get_or_build(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def stats():
+    """Hit/miss counters for every versioned cache, by name"""
+    return {name: cache.stats() for name, cache in _registry.items()}
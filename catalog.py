@@ -0,0 +1,94 @@
+"""Static page content, loaded once per process.
+
+Coping strategies, crisis and support resources, therapist tips, education
+resources and the chat's canned replies live in ``content/catalog.json``.
+They are read on first use, and the widget keys and card HTML each page
+needs are derived once. The result is frozen (read-only mappings and tuples)
+and shared by every session, so a rerun allocates nothing to show it.
+Editing the content is a change to the JSON file, not to the page modules.
+"""
+import json
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+CATALOG_PATH = Path(__file__).resolve().parent / 'content' / 'catalog.json'
+
+STRATEGY_CARD = """
+    <div style='background: white; padding: 25px; border-radius: 15px;
+                border-left: 5px solid {color}; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+        <div style='display: flex; align-items: center; margin-bottom: 10px;'>
+            <span style='font-size: 2em; margin-right: 15px;'>{emoji}</span>
+            <div>
+                <h3 style='margin: 0; color: #1f2937;'>{title}</h3>
+                <span style='background: {color}20; color: {color};
+                             padding: 3px 10px; border-radius: 12px; font-size: 0.75em; font-weight: 600;'>
+                    {category}
+                </span>
+            </div>
+        </div>
+        <p style='color: #4b5563; margin: 15px 0;'>{description}</p>
+    </div>
+"""
+
+EDUCATION_CARD = """
+    <div style='background: white; padding: 25px; border-radius: 15px;
+                box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 20px;'>
+        <div style='display: flex; justify-content: space-between; align-items: start; margin-bottom: 15px;'>
+            <span style='background: {color}20; color: {color};
+                         padding: 5px 12px; border-radius: 15px; font-size: 0.8em; font-weight: 600;'>
+                {type}
+            </span>
+            <span style='color: #9ca3af; font-size: 0.85em;'>{duration}</span>
+        </div>
+        <div style='display: flex; align-items: center; margin-bottom: 10px;'>
+            <span style='font-size: 2.5em; margin-right: 15px;'>{emoji}</span>
+            <h3 style='margin: 0; color: #1f2937;'>{title}</h3>
+        </div>
+        <p style='color: #6b7280; margin-bottom: 15px;'>{description}</p>
+    </div>
+"""
+
+
+def freeze(value):
+    """A read-only copy of nested JSON data: dicts become mappings, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _derive(raw):
+    # Widget keys match the ones the pages have always used
+    for idx, strategy in enumerate(raw['coping_strategies']):
+        strategy['key'] = f"start_{idx}"
+        strategy['card_html'] = STRATEGY_CARD.format(**strategy)
+    for resource in raw['crisis_resources']:
+        resource['key'] = f"contact_{resource['name'].replace(' ', '_')}"
+        resource['icon_html'] = f"<h2 style='margin: 0; color: {resource['color']};'>{resource['icon']}</h2>"
+    for resource in raw['support_resources']:
+        resource['key'] = f"visit_{resource['title'].replace(' ', '_')}"
+        resource['icon_html'] = f"<h3 style='margin: 0; color: {resource['color']};'>{resource['icon']}</h3>"
+    for idx, resource in enumerate(raw['education_resources']):
+        resource['key'] = f"resource_{idx}"
+        resource['action'] = f"{'▶️ Watch' if resource['type'] == 'Video' else '📖 Read'} Now"
+        resource['card_html'] = EDUCATION_CARD.format(**resource)
+    return raw
+
+
+def load(path=CATALOG_PATH):
+    return freeze(_derive(json.loads(Path(path).read_text(encoding='utf-8'))))
+
+
+_lock = threading.Lock()
+_catalog = None
+
+
+def catalog():
+    """The process-wide catalog, loaded on first use"""
+    global _catalog
+    with _lock:
+        if _catalog is None:
+            _catalog = load()
+        return _catalog
@@ -0,0 +1,50 @@
+"""Persisted chat transcript.
+
+Messages are appended to the ``chat_messages`` table. A session keeps only
+the most recent ``WINDOW`` messages in memory, as a bounded deque. Older
+messages are read back from storage one page at a time when the user asks
+for them.
+"""
+import uuid
+from collections import deque
+from datetime import datetime
+
+import storage
+
+WINDOW = 20
+PAGE_SIZE = 20
+
+GREETING = "👋 Hi! I'm MindCare's AI support assistant. I'm here to listen, provide coping strategies, and offer guidance. How are you feeling today?"
+
+
+def append(role, content):
+    return storage.insert('chat_messages', {
+        'id': str(uuid.uuid4()),
+        'role': role,
+        'content': content,
+        'timestamp': datetime.now()
+    })
+
+
+def recent():
+    """A ring buffer holding the latest messages, oldest first"""
+    rows = storage.page('chat_messages', limit=WINDOW)['rows']
+    return deque(reversed(rows), maxlen=WINDOW)
+
+
+def earlier(oldest):
+    """The page of messages just before ``oldest``, oldest first"""
+    cursor = (oldest['timestamp'].isoformat(), oldest['id'])
+    window = storage.page('chat_messages', cursor, 'older', limit=PAGE_SIZE)
+    return list(reversed(window['rows'])), window['older'] is not None
+
+
+def has_earlier(oldest):
+    cursor = (oldest['timestamp'].isoformat(), oldest['id'])
+    return bool(storage.page('chat_messages', cursor, 'older', limit=1)['rows'])
+
+
+def clear():
+    """Drop the whole transcript and start again from the greeting"""
+    storage.clear('chat_messages')
+    append('assistant', GREETING)
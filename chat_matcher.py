@@ -0,0 +1,59 @@
+"""Single-pass keyword classification for chat messages.
+
+All category keyword lists are compiled into one regular expression with a
+named group per category and word boundaries on both sides. One ``finditer``
+scan of a message finds every category it mentions, and a keyword never
+matches inside a longer word (``good`` does not match ``goodbye``).
+"""
+import re
+
+# Checked in this order when choosing a reply; crisis always wins
+CATEGORIES = {
+    'crisis': ['suicide', 'suicidal', 'kill myself', 'end it all', 'not worth living',
+               'better off dead', 'harm myself'],
+    'anxiety': ['anxious', 'anxiety', 'worried', 'panic', 'nervous'],
+    'depression': ['depressed', 'sad', 'hopeless', 'empty', 'worthless'],
+    'stress': ['stressed', 'overwhelmed', 'pressure', 'burnout'],
+    'sleep': ['sleep', 'insomnia', 'tired', 'exhausted'],
+    'positive': ['good', 'better', 'happy', 'grateful', 'thankful'],
+}
+
+# Single words also match their common inflections (sleeping, sadness, ...)
+_SUFFIXES = r'(?:s|es|ed|ing|less|ness|ly)?'
+
+
+def _term_pattern(term):
+    words = term.split()
+    if len(words) == 1:
+        return re.escape(term) + _SUFFIXES
+    return r'\s+'.join(re.escape(w) for w in words)
+
+
+class KeywordMatcher:
+    def __init__(self, categories):
+        self.order = list(categories)
+        groups = []
+        for name, terms in categories.items():
+            # Longest first so multi-word phrases win over their prefixes
+            alternatives = '|'.join(_term_pattern(t) for t in sorted(terms, key=len, reverse=True))
+            groups.append(f'(?P<{name}>{alternatives})')
+        # The lookahead on possible first letters lets the scanner skip most
+        # word starts without trying every alternative
+        initials = ''.join(sorted({t[0] for terms in categories.values() for t in terms}))
+        self.pattern = re.compile(rf'\b(?=[{re.escape(initials)}])(?:' + '|'.join(groups) + r')\b')
+
+    def categories(self, text):
+        """Every category mentioned in ``text``, in priority order"""
+        found = {match.lastgroup for match in self.pattern.finditer(text.lower())}
+        return [name for name in self.order if name in found]
+
+    def first(self, text):
+        """The highest-priority category in ``text``, or None"""
+        found = self.categories(text)
+        return found[0] if found else None
+
+    def classify_many(self, texts):
+        return [self.categories(text) for text in texts]
+
+
+matcher = KeywordMatcher(CATEGORIES)
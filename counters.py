@@ -0,0 +1,167 @@
+"""Incrementally maintained overview metrics for the Dashboard and Home pages.
+
+The counters are loaded from storage once with a handful of aggregate queries.
+After that, the mutation helpers in the page modules apply O(1) deltas, so
+rendering an overview card never rescans a collection. Medications taken are
+counted for the current day, so the first read on a new day reloads.
+
+Each user has their own engine. Only the most recently active users' engines
+are kept in memory; an evicted one is simply reloaded on its next read.
+"""
+import threading
+from collections import deque
+from datetime import date, datetime, timedelta
+
+import cache
+import dose_store
+import storage
+
+MOOD_WINDOW = 7
+MAX_ENGINES = 1024
+
+
+class MetricsEngine:
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._lock = threading.RLock()
+        self._loaded = False
+
+    def _load(self):
+        user = (self.user_id,)
+        with storage.reading() as conn:
+            self.goals_total, self.goals_completed = conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(completed), 0) FROM goals WHERE user_id = ?', user).fetchone()
+            meds = conn.execute('SELECT id, frequency FROM medications WHERE user_id = ?', user).fetchall()
+            recent = conn.execute('SELECT value FROM moods WHERE user_id = ? ORDER BY "datetime" DESC LIMIT ?',
+                                  (*user, MOOD_WINDOW * 2)).fetchall()
+            self.journal_total = conn.execute('SELECT COUNT(*) FROM journal_entries WHERE user_id = ?',
+                                              user).fetchone()[0]
+            journal_days = conn.execute(
+                'SELECT DISTINCT substr("timestamp", 1, 10) AS day FROM journal_entries '
+                'WHERE user_id = ? ORDER BY day DESC', user).fetchall()
+
+        # A medication counts as taken once any dose of its current period
+        # is, and as done once all of them are
+        self.day = datetime.now().date()
+        taken = dose_store.taken_now([{'id': i, 'frequency': f} for i, f in meds], self.day, self.user_id)
+        self.meds_total = len(meds)
+        self.meds_taken = sum(1 for i, _ in meds if taken[i])
+        self.meds_scheduled = sum(1 for _, f in meds if f != 'PRN')
+        self.meds_scheduled_taken = sum(1 for i, f in meds if f != 'PRN' and taken[i] >= dose_store.doses_due(f))
+
+        # Last 14 check-ins, oldest first: the current 7 and the 7 before them
+        self.mood_window = deque((value for (value,) in reversed(recent)), maxlen=MOOD_WINDOW * 2)
+
+        # Walk back from the newest journal day only as far as the streak goes
+        self.journal_last_day = None
+        self.journal_streak = 0
+        for (day,) in journal_days:
+            day = date.fromisoformat(day)
+            if self.journal_last_day is None:
+                self.journal_last_day = day
+                self.journal_streak = 1
+            elif day == self.journal_last_day - timedelta(days=self.journal_streak):
+                self.journal_streak += 1
+            else:
+                break
+        self._loaded = True
+
+    def _ensure(self):
+        # Doses taken are counted per day, so a new day starts from storage
+        if not self._loaded or self.day != datetime.now().date():
+            self._load()
+
+    def invalidate(self):
+        """Drop the counters so they are reloaded from storage on next read"""
+        with self._lock:
+            self._loaded = False
+
+    # Deltas applied by the mutation helpers
+
+    def mood_added(self, value):
+        with self._lock:
+            if self._loaded:
+                self.mood_window.append(value)
+
+    def goal_added(self):
+        with self._lock:
+            if self._loaded:
+                self.goals_total += 1
+
+    def goal_toggled(self, completed):
+        with self._lock:
+            if self._loaded:
+                self.goals_completed += 1 if completed else -1
+
+    def goal_deleted(self, was_completed):
+        with self._lock:
+            if self._loaded:
+                self.goals_total -= 1
+                self.goals_completed -= 1 if was_completed else 0
+
+    def medication_added(self, frequency):
+        with self._lock:
+            if self._loaded:
+                self.meds_total += 1
+                self.meds_scheduled += frequency != 'PRN'
+
+    def dose_taken(self, frequency, taken_before):
+        with self._lock:
+            if self._loaded:
+                self.meds_taken += taken_before == 0
+                if frequency != 'PRN' and taken_before + 1 == dose_store.doses_due(frequency):
+                    self.meds_scheduled_taken += 1
+
+    def dose_undone(self, frequency, taken_before):
+        with self._lock:
+            if self._loaded:
+                self.meds_taken -= taken_before == 1
+                if frequency != 'PRN' and taken_before == dose_store.doses_due(frequency):
+                    self.meds_scheduled_taken -= 1
+
+    def journal_added(self, timestamp):
+        with self._lock:
+            if not self._loaded:
+                return
+            self.journal_total += 1
+            day = timestamp.date()
+            if self.journal_last_day is None or day - self.journal_last_day > timedelta(days=1):
+                self.journal_streak = 1
+            elif day - self.journal_last_day == timedelta(days=1):
+                self.journal_streak += 1
+            self.journal_last_day = max(day, self.journal_last_day or day)
+
+    # Reads
+
+    def snapshot(self):
+        """Current values for the overview cards"""
+        with self._lock:
+            self._ensure()
+            window = list(self.mood_window)
+            current = window[-MOOD_WINDOW:]
+            previous = window[:-MOOD_WINDOW]
+            mood_avg = sum(current) / len(current) if current else None
+            today = datetime.now().date()
+            # A streak survives until a full day passes without an entry
+            streak_alive = self.journal_last_day is not None and today - self.journal_last_day <= timedelta(days=1)
+            return {
+                'mood_avg_7': mood_avg,
+                'mood_avg_delta': mood_avg - sum(previous) / len(previous) if previous and current else None,
+                'goals_total': self.goals_total,
+                'goals_completed': self.goals_completed,
+                'meds_total': self.meds_total,
+                'meds_taken': self.meds_taken,
+                'meds_scheduled': self.meds_scheduled,
+                'meds_scheduled_taken': self.meds_scheduled_taken,
+                'journal_total': self.journal_total,
+                'journal_streak': self.journal_streak if streak_alive else 0,
+                'journal_last_day': self.journal_last_day,
+            }
+
+
+_engines = cache.PerUser(MetricsEngine, MAX_ENGINES)
+
+
+def engine(user_id=None):
+    """The metrics engine for ``user_id``, by default the current user"""
+    return _engines.get(user_id)
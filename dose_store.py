@@ -0,0 +1,145 @@
+"""Medication dose events with pre-aggregated daily rollups.
+
+Marking a medication taken (or taking that back) appends an event to the
+``dose_events`` log. The same transaction folds the event into a per-user,
+per-day, per-medication count in ``dose_daily``. Adherence is read from the
+rollups only, so its cost follows the number of days shown rather than the
+number of doses ever logged.
+
+A scheduled medication's adherence on a day is the share of its doses taken
+in its schedule period ending that day. For example, a weekly medication is
+covered for the seven days after a dose. A day's adherence is the average
+over all scheduled medications, counting each one only from the day it was
+added (``created``). As-needed (PRN) medications are left out.
+
+What counts as taken "now" is read from the same rollups (``taken_now``), so it
+moves on by itself when the day, or a weekly medication's period, does.
+"""
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import rollups
+import storage
+
+# Doses expected per period of this many days
+SCHEDULES = {'Daily': (1, 1), 'Twice Daily': (2, 1), 'Weekly': (1, 7)}
+
+_UPSERT_DAY = (
+    'INSERT INTO dose_daily (user_id, date, medication_id, taken) VALUES (?, ?, ?, ?) '
+    'ON CONFLICT(user_id, date, medication_id) DO UPDATE SET taken = MAX(taken + excluded.taken, 0)'
+)
+
+
+def event(medication_id, taken, timestamp, event_id=None):
+    return {'id': event_id or str(uuid.uuid4()), 'medication_id': medication_id, 'taken': taken,
+            'timestamp': timestamp, 'date': timestamp.strftime('%Y-%m-%d')}
+
+
+def _day_row(user, dose):
+    return (user, dose['date'], dose['medication_id'], 1 if dose['taken'] else -1)
+
+
+ROLLUP = rollups.Rollup(
+    'dose_events', 'dose_daily', ('user_id', 'date', 'medication_id', 'taken'), _UPSERT_DAY, _day_row,
+    'SELECT user_id, date, medication_id, MAX(SUM(CASE WHEN taken THEN 1 ELSE -1 END), 0) '
+    'FROM dose_events WHERE user_id = ? GROUP BY date, medication_id'
+)
+add_many, rebuild, ensure_rollups = ROLLUP.add_many, ROLLUP.rebuild, ROLLUP.ensure
+
+
+def record(medication_id, taken, timestamp=None):
+    """Log one dose taken (or taken back) and update its day's rollup"""
+    return ROLLUP.add(event(medication_id, taken, timestamp or datetime.now()))
+
+
+def undo(medication, today=None):
+    """Take back the latest dose of ``medication`` counted now; returns its event, or None with none to undo"""
+    now = datetime.now()
+    today = today or now.date()
+    period = SCHEDULES.get(medication['frequency'], (1, 1))[1]
+    days = [date.fromisoformat(day) for day, medication_id, count
+            in _read_days(today - timedelta(days=period - 1), today)
+            if medication_id == medication['id'] and count > 0]
+    if not days:
+        return None
+    # The event goes on the day the dose was counted, so that day's rollup is the one lowered
+    day = max(days)
+    timestamp = datetime.combine(day, now.time()) if day == today else datetime.combine(day, time(23, 59, 59))
+    return record(medication['id'], False, timestamp)
+
+
+def _read_days(first, last, user_id=None):
+    # (date, medication_id, taken) rollup rows from ``first`` to ``last``
+    with storage.reading() as conn:
+        return conn.execute(
+            'SELECT date, medication_id, taken FROM dose_daily WHERE user_id = ? AND date >= ? AND date <= ?',
+            (user_id or storage.current_user(), first.isoformat(), last.isoformat())
+        ).fetchall()
+
+
+def doses_due(frequency):
+    """Doses expected per schedule period, or 1 for an as-needed medication"""
+    return SCHEDULES.get(frequency, (1, 1))[0]
+
+
+def taken_now(medications, today=None, user_id=None):
+    """Doses of each medication taken in its schedule period ending ``today`` (as-needed ones: that day)"""
+    today = today or datetime.now().date()
+    periods = {m['id']: SCHEDULES.get(m['frequency'], (1, 1))[1] for m in medications}
+    first = today - timedelta(days=max(periods.values(), default=1) - 1)
+    counts = dict.fromkeys(periods, 0)
+    for day, medication_id, count in _read_days(first, today, user_id):
+        if medication_id in periods and (today - date.fromisoformat(day)).days < periods[medication_id]:
+            counts[medication_id] += count
+    return counts
+
+
+def _first_days(medications, today):
+    # The day each medication was added. Ones imported without it start at
+    # their first recorded dose, or today if they have none
+    first = {m['id']: m['created'].date() for m in medications if m.get('created')}
+    unknown = [m['id'] for m in medications if m['id'] not in first]
+    if unknown:
+        with storage.reading() as conn:
+            rows = conn.execute(
+                'SELECT medication_id, MIN(date) FROM dose_daily WHERE user_id = ? AND taken > 0 '
+                f'AND medication_id IN ({", ".join("?" * len(unknown))}) GROUP BY medication_id',
+                (storage.current_user(), *unknown)).fetchall()
+        found = {medication_id: date.fromisoformat(day) for medication_id, day in rows}
+        first.update({medication_id: found.get(medication_id, today) for medication_id in unknown})
+    return first
+
+
+def history(medications, days, today=None):
+    """Daily adherence (0-1, or None with nothing scheduled) for the last ``days`` days, oldest first"""
+    today = today or datetime.now().date()
+    medications = [m for m in medications if m['frequency'] in SCHEDULES]
+    scheduled = {m['id']: SCHEDULES[m['frequency']] for m in medications}
+    added = _first_days(medications, today)
+    # Read far enough back to cover the longest schedule period of the first day
+    lookback = max((period for _, period in scheduled.values()), default=1) - 1
+    first = today - timedelta(days=days - 1)
+    taken_on = {}
+    for day, medication_id, count in _read_days(first - timedelta(days=lookback), today):
+        if medication_id in scheduled:
+            taken_on[(day, medication_id)] = count
+
+    result = []
+    for offset in range(days):
+        day = first + timedelta(days=offset)
+        rates = []
+        for medication_id, (doses, period) in scheduled.items():
+            # Nothing was expected before the medication was added
+            if day < added[medication_id]:
+                continue
+            count = sum(taken_on.get(((day - timedelta(days=back)).isoformat(), medication_id), 0)
+                        for back in range(period))
+            rates.append(min(count / doses, 1.0))
+        result.append({'date': day.isoformat(), 'adherence': sum(rates) / len(rates) if rates else None})
+    return result
+
+
+def adherence(medications, days, today=None):
+    """Average daily adherence over the last ``days`` days, or None"""
+    rates = [d['adherence'] for d in history(medications, days, today) if d['adherence'] is not None]
+    return sum(rates) / len(rates) if rates else None
@@ -0,0 +1,94 @@
+"""Community feed ranking, paging and likes.
+
+Posts are read through two indexes: (timestamp, id) for the newest-first
+feed and ``likes`` for the best like count anywhere. The newest feed is a
+keyset page over the time index.
+
+The top feed ranks posts by likes decayed with age. It scans the time index
+newest first, keeping the best ``limit`` candidates in a min-heap. The scan
+stops as soon as even the most-liked post could not reach the heap at that
+age, so a busy feed only reads its recent tail. Scores are computed at a
+fixed ``now`` so pages stay consistent while the user scrolls.
+
+A like is a (post, user) row plus an atomic counter update on the post, in
+one transaction. Liking again takes the like back.
+"""
+import heapq
+from datetime import datetime
+
+import storage
+
+PAGE_SIZE = 10
+GRAVITY = 1.5
+
+
+def score(likes, timestamp, now):
+    """Likes decayed by age in hours; new posts get a head start"""
+    age_hours = max(0.0, (now - timestamp).total_seconds() / 3600)
+    return (likes + 1) / (age_hours + 2) ** GRAVITY
+
+
+def newest(cursor=None, limit=PAGE_SIZE):
+    """One page of posts, newest first, and the cursor for the next page"""
+    window = storage.page('community_posts', cursor, 'older', limit=limit)
+    return window['rows'], window['older']
+
+
+def top(now, after=None, limit=PAGE_SIZE):
+    """The best-scoring posts ranked below ``after``, and the next page's cursor
+
+    A cursor is the (score, id) of the last post on the previous page.
+    """
+    with storage.reading() as conn:
+        best_likes = conn.execute('SELECT MAX(likes) FROM community_posts').fetchone()[0]
+        if best_likes is None:
+            return [], None
+        heap = []
+        rows = conn.execute('SELECT id, "timestamp", likes FROM community_posts '
+                            'ORDER BY "timestamp" DESC, id DESC')
+        for post_id, timestamp, likes in rows:
+            timestamp = datetime.fromisoformat(timestamp)
+            # Everything from here on is older, so this is the most any of it can score
+            if len(heap) == limit and score(best_likes, timestamp, now) <= heap[0][0]:
+                break
+            key = (score(likes, timestamp, now), post_id)
+            if after is not None and key >= tuple(after):
+                continue
+            if len(heap) < limit:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+    ranked = sorted(heap, reverse=True)
+    if not ranked:
+        return [], None
+    ids = [post_id for _, post_id in ranked]
+    found = {post['id']: post for post in storage.fetch(
+        'community_posts', f'id IN ({", ".join("?" for _ in ids)})', ids)}
+    posts = [found[post_id] for post_id in ids if post_id in found]
+    return posts, ranked[-1] if len(ranked) == limit else None
+
+
+def toggle_like(post_id, user_id):
+    """Like a post, or take the like back; returns (liked, like count)"""
+    with storage.transaction() as conn:
+        added = conn.execute('INSERT OR IGNORE INTO post_likes (post_id, user_id) VALUES (?, ?)',
+                             (post_id, user_id)).rowcount
+        if added:
+            conn.execute('UPDATE community_posts SET likes = likes + 1 WHERE id = ?', (post_id,))
+        else:
+            conn.execute('DELETE FROM post_likes WHERE post_id = ? AND user_id = ?', (post_id, user_id))
+            conn.execute('UPDATE community_posts SET likes = MAX(likes - 1, 0) WHERE id = ?', (post_id,))
+        row = conn.execute('SELECT likes FROM community_posts WHERE id = ?', (post_id,)).fetchone()
+    storage.bump('community_posts')
+    return bool(added), row[0] if row else 0
+
+
+def liked_by(user_id, post_ids):
+    """Which of ``post_ids`` the user has liked"""
+    if not post_ids:
+        return set()
+    with storage.reading() as conn:
+        rows = conn.execute(
+            f'SELECT post_id FROM post_likes WHERE user_id = ? AND post_id IN ({", ".join("?" for _ in post_ids)})',
+            (user_id, *post_ids)).fetchall()
+    return {post_id for (post_id,) in rows}
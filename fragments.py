@@ -0,0 +1,101 @@
+"""Rendered HTML for chat bubbles, community post cards and journal cards.
+
+Each fragment is built once and cached under (kind, record id, version). A
+record's version is the values of the fields its fragment shows, so a new or
+edited record is rendered and everything else is a cache hit. Like counts and
+other fields drawn outside the fragment don't invalidate it.
+
+All user text is HTML-escaped before it goes into the markup. Line breaks
+become ``<br>``, because a blank line would end the HTML block in markdown.
+"""
+import html
+import re
+
+import cache
+
+_cache = cache.named('fragments', maxsize=4096)
+
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+CHAT_USER = """
+<div style='background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
+            padding: 20px; border-radius: 25px; margin: 15px 0;
+            border-left: 6px solid #f59e0b; max-width: 85%; margin-left: auto; margin-right: 0;
+            box-shadow: 0 4px 12px rgba(245, 158, 11, 0.25);
+            border: 2px solid #f59e0b;'>
+    <strong style='color: #92400e; font-size: 1.1em; font-weight: bold;'>You:</strong>
+    <div style='color: #92400e; font-size: 1em; margin-top: 8px; line-height: 1.4;'>{content}</div>
+    <div style='color: #a16207; font-size: 0.8em; margin-top: 10px; text-align: right;'>{time}</div>
+</div>
+"""
+
+CHAT_ASSISTANT = """
+<div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
+            padding: 20px; border-radius: 25px; margin: 15px 0;
+            border-left: 6px solid #3b82f6; max-width: 85%;
+            box-shadow: 0 4px 12px rgba(59, 130, 246, 0.25);
+            border: 2px solid #3b82f6;'>
+    <strong style='color: #1e40af; font-size: 1.1em; font-weight: bold;'>🤖 MindCare Assistant:</strong>
+    <div style='color: #1e40af; font-size: 1em; margin-top: 8px; line-height: 1.4;'>{content}</div>
+    <div style='color: #1e3a8a; font-size: 0.8em; margin-top: 10px;'>{time}</div>
+</div>
+"""
+
+POST_CARD = """
+<div style='display: flex; gap: 15px; align-items: flex-start;'>
+    <div style='flex: 0 0 50px; width: 50px; height: 50px; border-radius: 50%;
+                background: linear-gradient(135deg, #9333ea 0%, #ec4899 100%);
+                display: flex; align-items: center; justify-content: center;
+                color: white; font-weight: bold; font-size: 1.5em;'>{initial}</div>
+    <div>
+        <strong>{author}</strong>
+        <div style='color: #9ca3af; font-size: 0.85em; margin: 2px 0 10px 0;'>{time}</div>
+        <div style='line-height: 1.5;'>{content}</div>
+    </div>
+</div>
+"""
+
+JOURNAL_CARD = """
+<div style='background: #f9fafb; padding: 20px; border-radius: 12px;
+            border-left: 4px solid #9333ea; margin-bottom: 20px;'>
+    <p style='color: #1f2937; white-space: pre-wrap; margin: 0;'>{content}</p>
+</div>
+"""
+
+
+def text_html(text):
+    """User or assistant text as safe inline HTML, keeping **bold** and line breaks"""
+    escaped = html.escape(text or '')
+    return _BOLD.sub(r'<strong>\1</strong>', escaped).replace('\r\n', '\n').replace('\n', '<br>')
+
+
+def _chat(message):
+    template = CHAT_USER if message['role'] == 'user' else CHAT_ASSISTANT
+    return template.format(content=text_html(message['content']),
+                           time=message['timestamp'].strftime('%I:%M %p'))
+
+
+def _post(post):
+    author = post['author'] or ''
+    return POST_CARD.format(initial=html.escape(author[:1] or '?'), author=html.escape(author),
+                            time=post['timestamp'].strftime('%B %d, %Y at %I:%M %p'),
+                            content=text_html(post['content']))
+
+
+def _journal(entry):
+    return JOURNAL_CARD.format(content=text_html(entry['content']))
+
+
+# Each kind's builder and the fields that make up a record's version
+RENDERERS = {
+    'chat': (_chat, ('role', 'content', 'timestamp')),
+    'post': (_post, ('author', 'content', 'timestamp')),
+    'journal': (_journal, ('content',)),
+}
+
+
+def render(kind, record):
+    """The HTML for one record, built only the first time this version is seen"""
+    build, fields = RENDERERS[kind]
+    key = (kind, record['id'], tuple(record[f] for f in fields))
+    return _cache.get_or_build(key, lambda: build(record))
@@ -0,0 +1,261 @@
+"""Tags, sentiment and a mood score for journal entries, computed off the page.
+
+Saving an entry only inserts its text. ``submit`` hands the entry to a small
+thread pool and returns at once, so the save never waits for the analysis.
+A worker then computes three things and writes them back to the entry's row:
+- tags: one scan with the chat's keyword matcher over ``TAGS``;
+- sentiment: a lexicon score in [-1, 1], where a negation flips the next
+  few words;
+- mood: the day's logged mood from the ``mood_daily`` rollup, falling back
+  to the sentiment mapped onto the 1-5 scale.
+Tags or a mood the entry already has, like the demo entries', are kept. An
+entry counts as analyzed once its sentiment is set.
+
+Results are also kept by entry id in a bounded LRU. An entry that was
+already analyzed, or is still queued, is not submitted again.
+
+``backfill`` analyzes a user's older entries that have no sentiment yet. It
+splits their row ids into chunks of ``BACKFILL_CHUNK``, and each chunk is one
+pool task that reads its entries and writes them back in a single
+transaction, so memory holds only the chunks being worked on. Run
+``python journal_enrichment.py [--user ID | --all]`` to backfill from the
+command line and wait for it.
+
+The analysis is pure Python and holds the GIL, so the pool keeps the work off
+the script thread rather than running entries in parallel.
+"""
+import argparse
+import json
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import chat_matcher
+import storage
+
+WORKERS = 2
+BACKFILL_CHUNK = 500
+MAX_RESULTS = 4096
+
+# Tag -> keywords; single words also match their inflections (see chat_matcher)
+TAGS = {
+    'anxiety': ['anxious', 'anxiety', 'worried', 'worry', 'panic', 'nervous', 'afraid'],
+    'stress': ['stress', 'stressful', 'overwhelmed', 'pressure', 'burnout'],
+    'depression': ['depressed', 'sad', 'hopeless', 'empty', 'worthless', 'numb'],
+    'sleep': ['sleep', 'slept', 'insomnia', 'tired', 'exhausted', 'nap', 'nightmare'],
+    'work': ['work', 'job', 'boss', 'deadline', 'office', 'meeting'],
+    'relationships': ['family', 'friend', 'partner', 'mom', 'dad', 'relationship', 'lonely'],
+    'therapy': ['therapy', 'therapist', 'counselor', 'counseling'],
+    'medication': ['medication', 'meds', 'dose', 'pill'],
+    'exercise': ['walk', 'running', 'exercise', 'gym', 'yoga', 'workout'],
+    'coping': ['breath', 'breathing', 'meditate', 'meditation', 'coping', 'grounding', 'journal'],
+    'progress': ['progress', 'better', 'improving', 'improved', 'proud', 'accomplished'],
+    'gratitude': ['grateful', 'thankful', 'gratitude', 'appreciate'],
+}
+
+# Word -> weight, from -3 (very negative) to 3 (very positive)
+LEXICON = {
+    'amazing': 3, 'wonderful': 3, 'fantastic': 3, 'joy': 3, 'love': 3, 'loved': 3, 'proud': 2,
+    'happy': 2, 'grateful': 2, 'thankful': 2, 'calm': 2, 'peaceful': 2, 'relaxed': 2, 'hopeful': 2,
+    'excited': 2, 'good': 2, 'great': 3, 'glad': 2, 'relieved': 2, 'better': 1, 'okay': 1, 'fine': 1,
+    'nice': 1, 'safe': 1, 'rested': 1, 'productive': 1, 'progress': 1, 'strong': 1, 'enjoyed': 2,
+    'energized': 2, 'supported': 2, 'laughed': 2, 'confident': 2, 'equipped': 1, 'helped': 1,
+    'bad': -2, 'sad': -2, 'awful': -3, 'terrible': -3, 'horrible': -3, 'hopeless': -3,
+    'worthless': -3, 'miserable': -3, 'depressed': -3, 'anxious': -2, 'worried': -2, 'afraid': -2,
+    'scared': -2, 'panic': -3, 'stressed': -2, 'stressful': -2, 'overwhelmed': -2, 'tired': -1,
+    'exhausted': -2, 'lonely': -2, 'angry': -2, 'frustrated': -2, 'upset': -2, 'hurt': -2,
+    'cried': -2, 'crying': -2, 'empty': -2, 'numb': -2, 'guilty': -2, 'ashamed': -2, 'worse': -2,
+    'difficult': -1, 'challenging': -1, 'hard': -1, 'struggling': -2, 'struggled': -2, 'pain': -2,
+    'nervous': -1, 'restless': -1, 'irritable': -1, 'insomnia': -2, 'nightmare': -2,
+}
+NEGATIONS = {'not', 'no', 'never', "don't", "didn't", "isn't", "wasn't", "can't", "couldn't", 'nothing',
+             'hardly'}
+# A negation flips the sentiment of this many words after it
+NEGATION_REACH = 3
+# Larger values pull raw scores toward zero more gently (as in VADER)
+NORMALIZER = 15
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z']+")
+_tagger = chat_matcher.KeywordMatcher(TAGS)
+
+_results = OrderedDict()
+_queued = set()
+_backfilled = set()
+_lock = threading.Lock()
+_pool = None
+
+
+# Analysis
+
+def tags(text):
+    """Tags for ``text``, in ``TAGS`` order"""
+    return _tagger.categories(text or '')
+
+
+def sentiment(text):
+    """Lexicon sentiment of ``text`` from -1 (negative) to 1 (positive)"""
+    score = 0.0
+    negated_until = -1
+    for at, word in enumerate(_WORD.findall((text or '').lower())):
+        if word in NEGATIONS:
+            negated_until = at + NEGATION_REACH
+            continue
+        weight = LEXICON.get(word, 0)
+        score += -weight if at <= negated_until else weight
+    return score / math.sqrt(score * score + NORMALIZER)
+
+
+def mood_from(score):
+    """A sentiment score on the 1-5 mood scale"""
+    return min(5, max(1, round(3 + 2 * score)))
+
+
+def analyze(text, logged_mood=None):
+    """Tags, sentiment and mood for one entry's text"""
+    score = sentiment(text)
+    mood = round(logged_mood) if logged_mood is not None else mood_from(score)
+    return {'tags': tags(text), 'sentiment': round(score, 3), 'mood': mood}
+
+
+def result(entry_id):
+    """The cached analysis of an entry, or None if it hasn't been analyzed in this process"""
+    with _lock:
+        found = _results.get(entry_id)
+        if found is not None:
+            _results.move_to_end(entry_id)
+        return found
+
+
+def _remember(entry_id, analysis):
+    with _lock:
+        _results[entry_id] = analysis
+        _results.move_to_end(entry_id)
+        while len(_results) > MAX_RESULTS:
+            _results.popitem(last=False)
+        _queued.discard(entry_id)
+
+
+# Writing back
+
+def _logged_moods(conn, user_id, days):
+    # Average logged mood on each of ``days``, from the rollups
+    first, last = min(days), max(days)
+    rows = conn.execute('SELECT date, total / count FROM mood_daily WHERE user_id = ? AND date BETWEEN ? AND ?',
+                        (user_id, first, last)).fetchall()
+    return dict(rows)
+
+
+def _enrich(user_id, entries):
+    # Runs on a pool thread: analyze ``entries`` and write them back together
+    storage.use(user_id)
+    days = {entry['timestamp'].strftime('%Y-%m-%d') for entry in entries}
+    with storage.reading() as conn:
+        logged = _logged_moods(conn, user_id, days)
+    updates, analyses = [], {}
+    for entry in entries:
+        analysis = analyze(entry['content'], logged.get(entry['timestamp'].strftime('%Y-%m-%d')))
+        # What the entry already has wins over what was inferred
+        analysis['tags'] = entry.get('tags') or analysis['tags']
+        if entry.get('mood') is not None:
+            analysis['mood'] = entry['mood']
+        updates.append((json.dumps(analysis['tags']), analysis['sentiment'], analysis['mood'], entry['id'], user_id))
+        analyses[entry['id']] = analysis
+    with storage.transaction() as conn:
+        conn.executemany('UPDATE journal_entries SET tags = ?, sentiment = ?, mood = ? '
+                         'WHERE id = ? AND user_id = ?', updates)
+    storage.bump('journal_entries')
+    for entry_id, analysis in analyses.items():
+        _remember(entry_id, analysis)
+    return len(updates)
+
+
+def _executor():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='mindcare-enrich')
+        return _pool
+
+
+def submit(entry, user_id=None):
+    """Queue ``entry`` for analysis and return at once (a Future, or None if already handled)"""
+    user_id = user_id or storage.current_user()
+    with _lock:
+        if entry['id'] in _results or entry['id'] in _queued:
+            return None
+        _queued.add(entry['id'])
+    future = _executor().submit(_enrich, user_id, [entry])
+    future.add_done_callback(lambda done: _settle(entry['id'], done))
+    return future
+
+
+def _settle(entry_id, future):
+    # Nobody waits on a save's future, so a failure is logged here; the
+    # entry keeps no sentiment and the next backfill retries it
+    if future.exception() is not None:
+        with _lock:
+            _queued.discard(entry_id)
+        logger.error("Couldn't enrich journal entry %s", entry_id, exc_info=future.exception())
+
+
+def _enrich_rows(user_id, first, last):
+    # Runs on a pool thread: one backfill chunk, read here so only the
+    # chunks being worked on are held in memory
+    storage.use(user_id)
+    # The unary + keeps SQLite on the rowid range instead of scanning all of
+    # the user's rows through the (user_id, timestamp) index for every chunk
+    with storage.reading() as conn:
+        rows = conn.execute(storage.STATEMENTS['journal_entries']['select']
+                            + ' WHERE rowid BETWEEN ? AND ? AND +user_id = ? AND sentiment IS NULL',
+                            (first, last, user_id)).fetchall()
+    entries = [storage.decode('journal_entries', row) for row in rows]
+    return _enrich(user_id, entries) if entries else 0
+
+
+def backfill(chunk_size=BACKFILL_CHUNK):
+    """Queue every entry of the current user without a sentiment yet, one task per chunk
+
+    Returns the futures; each resolves to the number of entries it wrote.
+    """
+    user_id = storage.current_user()
+    with storage.reading() as conn:
+        rowids = [row[0] for row in conn.execute(
+            'SELECT rowid FROM journal_entries WHERE user_id = ? AND sentiment IS NULL ORDER BY rowid', (user_id,))]
+    chunks = (rowids[i:i + chunk_size] for i in range(0, len(rowids), chunk_size))
+    return [_executor().submit(_enrich_rows, user_id, chunk[0], chunk[-1]) for chunk in chunks]
+
+
+def ensure_backfilled():
+    """Backfill the current user's journal once per process"""
+    user_id = storage.current_user()
+    with _lock:
+        if user_id in _backfilled:
+            return
+        _backfilled.add(user_id)
+    backfill()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backfill tags, sentiment and mood for journal entries.')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--user', default=storage.DEFAULT_USER, help='account to backfill (default: demo)')
+    group.add_argument('--all', action='store_true', help='backfill every account')
+    args = parser.parse_args()
+
+    if args.all:
+        with storage.reading() as conn:
+            owners = [row[0] for row in conn.execute('SELECT DISTINCT user_id FROM journal_entries')]
+    else:
+        owners = [args.user]
+    start = time.perf_counter()
+    total = 0
+    for owner in owners:
+        storage.use(owner)
+        total += sum(future.result() for future in backfill())
+    print(f'Enriched {total} journal entries for {len(owners)} account(s) in {time.perf_counter() - start:.2f}s')
@@ -0,0 +1,235 @@
+"""Rerun, helper and session-state metrics in the Prometheus text format.
+
+Every script run is timed from the top of app.py to the end of its page and
+recorded in a histogram labelled with the active page. The same hook counts
+the runs a page cut short with ``st.rerun()`` and samples the size of the
+session's state. Hot helpers, such as the chart builders, the chat reply and
+the add/toggle mutation helpers, are wrapped in ``timed`` and get a
+histogram per function. Cache hits and misses (``cache.stats()``) and the
+process's time to first paint are read when the metrics are rendered.
+
+Recording an observation takes a lock and a few additions, so it is cheap
+enough to leave on for every run. The label sets are fixed (pages and
+function names), so memory stays constant however long the process runs.
+
+``render()`` produces the exposition text. ``start()`` publishes it as
+configured:
+- ``MINDCARE_METRICS_FILE``: rewritten every ``WRITE_SECONDS``, for a
+  node_exporter textfile collector.
+- ``MINDCARE_METRICS_PORT``: served at ``/metrics`` from a small HTTP
+  server on a daemon thread, bound to ``MINDCARE_METRICS_HOST``
+  (default 127.0.0.1).
+"""
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException
+
+import cache
+import startup
+
+SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+METRICS_FILE = os.environ.get('MINDCARE_METRICS_FILE')
+METRICS_HOST = os.environ.get('MINDCARE_METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.environ.get('MINDCARE_METRICS_PORT', 0))
+WRITE_SECONDS = 15
+
+_lock = threading.Lock()
+_metrics = []
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, **extra):
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Counter:
+    """A monotonically increasing count for each label set"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, labels
+        self._series = {}
+        _metrics.append(self)
+
+    def inc(self, *labels, amount=1):
+        with _lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def lines(self):
+        with _lock:
+            series = sorted(self._series.items())
+        for labels, value in series:
+            yield f'{self.name}{_labels(self.labels, labels)} {value}'
+
+
+class Histogram:
+    """Bucketed observations with their sum and count for each label set"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=SECONDS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._series = {}
+        _metrics.append(self)
+
+    def observe(self, value, *labels):
+        # Per-bucket counts; they are made cumulative when rendered
+        at = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][at] += 1
+            series[1] += value
+
+    def lines(self):
+        with _lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        for labels, counts, total in series:
+            running = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                running += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                yield f'{self.name}_bucket{_labels(self.labels, labels, le=le)} {running}'
+            yield f'{self.name}_sum{_labels(self.labels, labels)} {total!r}'
+            yield f'{self.name}_count{_labels(self.labels, labels)} {running}'
+
+
+rerun_seconds = Histogram('mindcare_rerun_seconds', 'Wall time of a script run, by active page', ('page',))
+requested_reruns = Counter('mindcare_requested_reruns_total', 'Runs ended early by st.rerun(), by page', ('page',))
+session_state_bytes = Histogram('mindcare_session_state_bytes', 'Approximate size of session state after a run',
+                                ('page',), buckets=BYTES)
+function_seconds = Histogram('mindcare_function_seconds', 'Wall time of instrumented helpers', ('function',))
+
+
+def timed(func):
+    """Record the wall time of every call to ``func``"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            # Also when st.rerun() ends the call
+            function_seconds.observe(time.perf_counter() - start, func.__name__)
+    return wrapper
+
+
+def _size(value, seen):
+    # sys.getsizeof of every container and what it holds, each object once
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_size(k, seen) + _size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_size(v, seen) for v in value)
+    return size
+
+
+def session_state_size():
+    """Approximate bytes held in the current session's state"""
+    return _size(st.session_state.to_dict(), set())
+
+
+@contextmanager
+def page_run(page, started):
+    """Record the run of ``page`` that began at ``started`` (a perf_counter reading)"""
+    try:
+        yield
+    except RerunException:
+        requested_reruns.inc(page)
+        raise
+    finally:
+        rerun_seconds.observe(time.perf_counter() - started, page)
+        session_state_bytes.observe(session_state_size(), page)
+
+
+def render():
+    """Every metric in the Prometheus text exposition format"""
+    out = []
+    for metric in _metrics:
+        out += [f'# HELP {metric.name} {metric.help}', f'# TYPE {metric.name} {metric.kind}']
+        out.extend(metric.lines())
+    caches = cache.stats()
+    for field in ('hits', 'misses'):
+        name = f'mindcare_cache_{field}_total'
+        out += [f'# HELP {name} Versioned cache {field}, by cached function', f'# TYPE {name} counter']
+        out.extend(f'{name}{_labels(("cache",), (cache_name,))} {stats[field]}'
+                   for cache_name, stats in sorted(caches.items()))
+    if 'first paint' in startup.timings:
+        out += ['# HELP mindcare_first_paint_seconds Time to the first paint of this process',
+                '# TYPE mindcare_first_paint_seconds gauge',
+                f"mindcare_first_paint_seconds {startup.timings['first paint']!r}"]
+    return '\n'.join(out) + '\n'
+
+
+def write(path):
+    """Write the metrics to ``path``, replacing it in one step"""
+    partial = f'{path}.tmp'
+    with open(partial, 'w', encoding='utf-8') as f:
+        f.write(render())
+    os.replace(partial, path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _write_forever(path):
+    while True:
+        try:
+            write(path)
+        except OSError:
+            pass
+        time.sleep(WRITE_SECONDS)
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start():
+    """Start publishing metrics to the configured file and/or port, once per process"""
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+    if METRICS_FILE:
+        threading.Thread(target=_write_forever, args=(METRICS_FILE,), name='mindcare-metrics-file',
+                         daemon=True).start()
+    if METRICS_PORT:
+        server = ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), _Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='mindcare-metrics-http', daemon=True).start()
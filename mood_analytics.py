@@ -0,0 +1,104 @@
+"""Rolling statistics, weekday seasonality and downsampling for mood charts.
+
+Everything starts from the daily rollups in ``mood_daily``, read once into a
+pandas series with one row per calendar day (days without a check-in are
+NaN). The 7- and 30-day means, the anomaly flags and the weekday profile are
+vectorized operations over that series. They are cached until the next mood
+is logged.
+
+A chart never needs more points than it has pixels across. When the range
+shown holds more days than ``POINT_BUDGET``, the daily line is reduced with
+Largest-Triangle-Three-Buckets (``lttb``). That keeps the peaks and troughs
+a straight stride would drop, so the figure sent to the browser stays the
+same size whether it covers a month or five years.
+"""
+import numpy as np
+import pandas as pd
+
+import cache
+import storage
+
+POINT_BUDGET = 800
+
+# A day is flagged when it sits this many standard deviations away from the
+# 30 days before it; the window needs this many check-ins to judge
+ANOMALY_SIGMA = 2.0
+ANOMALY_MIN_DAYS = 14
+
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+@cache.versioned('moods')
+def daily():
+    """Average mood per calendar day, NaN on days without a check-in"""
+    with storage.reading() as conn:
+        moods = pd.read_sql_query('SELECT date, total / count AS mood FROM mood_daily WHERE user_id = ? ORDER BY date',
+                                  conn, params=(storage.current_user(),))
+    if moods.empty:
+        return None
+    return moods.set_index(pd.to_datetime(moods['date']))['mood'].asfreq('D')
+
+
+@cache.versioned('moods')
+def analyze():
+    """Daily mood with rolling means and anomaly flags, one row per calendar day"""
+    mood = daily()
+    if mood is None:
+        return None
+    frame = pd.DataFrame({'mood': mood})
+    frame['mean_7'] = mood.rolling(7, min_periods=1).mean()
+    frame['mean_30'] = mood.rolling(30, min_periods=1).mean()
+    # Compared with the 30 days before, so a day doesn't dampen its own flag
+    before = mood.shift(1).rolling(30, min_periods=ANOMALY_MIN_DAYS)
+    spread = before.std().where(lambda s: s > 0)
+    frame['zscore'] = (mood - before.mean()) / spread
+    frame['anomaly'] = frame['zscore'].abs() >= ANOMALY_SIGMA
+    return frame
+
+
+@cache.versioned('moods')
+def weekday_profile():
+    """Mean mood by day of the week (Mon-Sun), relative to the overall mean"""
+    mood = daily()
+    if mood is None:
+        return None
+    mood = mood.dropna()
+    profile = mood.groupby(mood.index.dayofweek).mean().reindex(range(7))
+    profile.index = WEEKDAYS
+    return profile - mood.mean()
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points of (x, y) that best keep its shape
+
+    Largest-Triangle-Three-Buckets: the first and last points are kept, and
+    each bucket in between contributes the point forming the largest
+    triangle with the previous pick and the next bucket's average.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    picked = np.empty(threshold, dtype=int)
+    picked[0], picked[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        following = slice(stop, edges[bucket + 2] if bucket + 2 < len(edges) else n)
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+        # Twice the triangle area for every candidate in the bucket at once
+        area = np.abs((x[previous] - avg_x) * (y[start:stop] - y[previous])
+                      - (x[previous] - x[start:stop]) * (avg_y - y[previous]))
+        previous = start + int(area.argmax())
+        picked[bucket + 1] = previous
+    return picked
+
+
+def downsample(series, budget=POINT_BUDGET):
+    """``series`` without gaps, reduced to at most ``budget`` points"""
+    series = series.dropna()
+    if len(series) <= budget:
+        return series
+    return series.iloc[lttb(series.index.asi8, series.to_numpy(), budget)]
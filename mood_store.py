@@ -0,0 +1,35 @@
+"""Mood time series with pre-aggregated daily rollups.
+
+Each check-in is written to the ``moods`` table and folded into a per-day
+count/sum/min/max row in ``mood_daily`` in the same transaction. Charts and
+summary metrics read the rollups, so their cost follows the number of days
+shown rather than the number of check-ins ever logged. Rollups are kept per
+user, like the entries they summarize.
+"""
+import rollups
+import storage
+
+_UPSERT_DAY = (
+    'INSERT INTO mood_daily (user_id, date, count, total, min, max) VALUES (?, ?, 1, ?, ?, ?) '
+    'ON CONFLICT(user_id, date) DO UPDATE SET count = count + 1, total = total + excluded.total, '
+    'min = MIN(min, excluded.min), max = MAX(max, excluded.max)'
+)
+
+
+def _day_row(user, record):
+    return (user, record['date'], record['value'], record['value'], record['value'])
+
+
+ROLLUP = rollups.Rollup(
+    'moods', 'mood_daily', ('user_id', 'date', 'count', 'total', 'min', 'max'), _UPSERT_DAY, _day_row,
+    'SELECT user_id, date, COUNT(*), SUM(value), MIN(value), MAX(value) FROM moods WHERE user_id = ? GROUP BY date'
+)
+add, add_many, rebuild, ensure_rollups = ROLLUP.add, ROLLUP.add_many, ROLLUP.rebuild, ROLLUP.ensure
+
+
+def summary():
+    """Overall average and entry count"""
+    with storage.reading() as conn:
+        count, total = conn.execute('SELECT SUM(count), SUM(total) FROM mood_daily WHERE user_id = ?',
+                                    (storage.current_user(),)).fetchone()
+    return {'count': count or 0, 'average': total / count if count else None}
@@ -0,0 +1,305 @@
+"""Medication and appointment reminders.
+
+Medication times are stored as display strings ('08:00 AM', 'As needed') next
+to a frequency ('Daily', 'Twice Daily', 'Weekly', 'PRN'). ``parse`` turns the
+pair into a ``Recurrence``: the times of day a dose falls due and how many
+days apart its cycles are. As-needed medications have no recurrence.
+
+Each user has a ``Scheduler`` with a min-heap holding the next occurrence of
+every reminder. When an occurrence's time passes it is popped into the
+pending set and the following occurrence is pushed. That costs O(log n) per
+reminder that fired; reminders that didn't fire are never looked at. A
+pending dose is due for ``GRACE`` and overdue after that, until it is taken
+or the next occurrence replaces it. An appointment is due from ``LEAD``
+before it starts until it ends; a repeating one then moves on to its next
+session.
+
+Taking a dose or adding a medication refreshes that one reminder. Heap
+entries are not removed; a stale one is skipped when it reaches the top. A
+write that bypassed those hooks (seeding, imports) changes a collection
+version, and the heap is then rebuilt on the next read.
+
+A daemon thread started by ``start()`` advances every loaded scheduler when
+its next reminder falls due, so a page usually finds its reminders already
+sorted out. Reads also advance the heap themselves, so the thread is never
+required for a correct answer.
+"""
+import heapq
+import itertools
+import threading
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta
+
+import appointments
+import cache
+import dose_store
+import storage
+
+# Times of day (sorted) and days between cycles
+Recurrence = namedtuple('Recurrence', 'times every')
+
+DEFAULT_TIME = time(9, 0)
+GRACE = timedelta(hours=1)
+LEAD = timedelta(hours=2)
+TICK_SECONDS = 60
+MAX_SCHEDULERS = 1024
+
+# Versions of these collections tell a scheduler its heap may be out of date
+WATCHED = ('medications', 'appointments', 'dose_events')
+
+_TIME_FORMATS = ('%I:%M %p', '%H:%M')
+
+
+def parse_time(text):
+    """A time of day from a display string, or None if there isn't one"""
+    for fmt in _TIME_FORMATS:
+        try:
+            return datetime.strptime((text or '').strip(), fmt).time()
+        except ValueError:
+            continue
+    return None
+
+
+def parse(frequency, time_text):
+    """The recurrence for a medication, or None if it is taken as needed"""
+    if frequency not in dose_store.SCHEDULES:
+        return None
+    doses, every = dose_store.SCHEDULES[frequency]
+    first = datetime.combine(date.min, parse_time(time_text) or DEFAULT_TIME)
+    # Doses are spread evenly over the day, starting from the stored time
+    spacing = timedelta(days=1) / doses
+    times = sorted((first + spacing * i).time() for i in range(doses))
+    return Recurrence(tuple(times), every)
+
+
+class Scheduler:
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._lock = threading.RLock()
+        self._versions = None
+        self._heap = []
+        self._reminders = {}
+        self._pending = {}
+        self._seq = itertools.count()
+
+    # Building
+
+    def _versions_now(self):
+        return tuple(storage.version(c) for c in WATCHED)
+
+    def _sync(self, now):
+        # Reads happen on a page's script thread, scoped to this user
+        versions = self._versions_now()
+        if versions != self._versions:
+            self._load(now)
+            self._versions = versions
+
+    def _load(self, now):
+        user = (self.user_id,)
+        with storage.reading() as conn:
+            meds = conn.execute('SELECT id, name, dosage, "time", frequency FROM medications '
+                                "WHERE user_id = ? AND frequency != 'PRN'", user).fetchall()
+            doses = self._dose_state(conn)
+        self._heap = []
+        self._reminders = {}
+        self._pending = {}
+        for row in meds:
+            self._add_medication(row, doses.get(row[0], {}), now)
+        for record in appointments.index(self.user_id).active(now):
+            self._add_appointment(record, now)
+
+    def _dose_state(self, conn, medication_id=None):
+        # Each medication's most recent day with a dose and what was taken on it
+        where, params = 'user_id = ? AND taken > 0', (self.user_id,)
+        if medication_id is not None:
+            where, params = where + ' AND medication_id = ?', params + (medication_id,)
+        rows = conn.execute(
+            f'SELECT d.medication_id, d.date, d.taken FROM dose_daily d JOIN ('
+            f'SELECT medication_id, MAX(date) AS date FROM dose_daily WHERE {where} '
+            f'GROUP BY medication_id) last USING (medication_id, date) WHERE d.user_id = ?',
+            (*params, self.user_id)).fetchall()
+        return {med_id: {'date': date.fromisoformat(day), 'taken': taken} for med_id, day, taken in rows}
+
+    def _add_medication(self, row, last_dose, now):
+        record_id, name, dosage, time_text, frequency = row
+        recurrence = parse(frequency, time_text)
+        if recurrence is None:
+            return
+        today = now.date()
+        last_day = last_dose.get('date')
+        # A cycle is the day its doses fall due: today for a daily medication,
+        # for a weekly one the day of the last dose until a week has passed
+        if recurrence.every == 1 or last_day is None:
+            cycle = today
+        elif last_day + timedelta(days=recurrence.every) > today:
+            cycle = last_day
+        else:
+            cycle = last_day + timedelta(days=recurrence.every)
+        key = ('medication', record_id)
+        previous = self._reminders.get(key)
+        reminder = {
+            'kind': 'medication', 'id': record_id, 'title': name, 'detail': dosage,
+            'recurrence': recurrence, 'cycle': cycle,
+            'handled': last_dose.get('taken', 0) if last_day == cycle else 0,
+            'generation': previous['generation'] + 1 if previous else 0,
+        }
+        self._reminders[key] = reminder
+        self._pending.pop(key, None)
+
+        occurrences = [datetime.combine(cycle, t) for t in recurrence.times][reminder['handled']:]
+        missed = [at for at in occurrences if at <= now]
+        if missed:
+            self._pending[key] = missed[-1]
+        later = [at for at in occurrences if at > now]
+        if later:
+            reminder['slot'] = len(recurrence.times) - len(later)
+            self._push(later[0], key, reminder)
+        else:
+            self._next_cycle(key, reminder)
+
+    def _add_appointment(self, record, now):
+        key = ('appointment', record['id'])
+        reminder = {'kind': 'appointment', 'id': record['id'], 'title': record['title'],
+                    'detail': record['location'], 'record': record, 'start': record['datetime'],
+                    'duration': timedelta(minutes=record['duration'] or 0), 'generation': 0}
+        self._reminders[key] = reminder
+        if reminder['start'] - LEAD <= now:
+            self._pending[key] = reminder['start']
+            self._next_session(key, reminder)
+        else:
+            self._push(reminder['start'] - LEAD, key, reminder)
+
+    def _push(self, at, key, reminder):
+        heapq.heappush(self._heap, (at, next(self._seq), key, reminder['generation']))
+
+    def _next_cycle(self, key, reminder):
+        recurrence = reminder['recurrence']
+        reminder['cycle'] += timedelta(days=recurrence.every)
+        reminder['handled'] = 0
+        reminder['slot'] = 0
+        self._push(datetime.combine(reminder['cycle'], recurrence.times[0]), key, reminder)
+
+    def _next_session(self, key, reminder):
+        # Only a repeating appointment has one
+        start = next(appointments.sessions(reminder['record'], reminder['start']), None)
+        if start is not None:
+            reminder['start'] = start
+            self._push(start - LEAD, key, reminder)
+
+    def _is_live(self, entry):
+        reminder = self._reminders.get(entry[2])
+        return reminder is not None and reminder['generation'] == entry[3]
+
+    # Advancing
+
+    def advance(self, now=None):
+        """Move every reminder whose time has come from the heap to pending"""
+        now = now or datetime.now()
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if not self._is_live(entry):
+                    continue
+                at, _, key, _ = entry
+                reminder = self._reminders[key]
+                if reminder['kind'] == 'appointment':
+                    self._pending[key] = reminder['start']
+                    self._next_session(key, reminder)
+                    continue
+                self._pending[key] = at
+                times = reminder['recurrence'].times
+                if reminder['slot'] + 1 < len(times):
+                    reminder['slot'] += 1
+                    self._push(datetime.combine(reminder['cycle'], times[reminder['slot']]), key, reminder)
+                else:
+                    self._next_cycle(key, reminder)
+
+    def next_at(self):
+        """When the earliest reminder on the heap falls due, or None"""
+        with self._lock:
+            while self._heap and not self._is_live(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    # Hooks for the mutation helpers
+
+    def refresh_medication(self, medication_id, now=None):
+        """Reschedule one medication after it was added, changed or taken"""
+        now = now or datetime.now()
+        with self._lock:
+            self._sync(now)
+            with storage.reading() as conn:
+                row = conn.execute('SELECT id, name, dosage, "time", frequency FROM medications '
+                                   'WHERE user_id = ? AND id = ?', (self.user_id, medication_id)).fetchone()
+                last_dose = self._dose_state(conn, medication_id).get(medication_id, {})
+            key = ('medication', medication_id)
+            if row is None or parse(row[4], row[3]) is None:
+                self._reminders.pop(key, None)
+                self._pending.pop(key, None)
+            else:
+                self._add_medication(row, last_dose, now)
+            # The write that triggered this is now reflected in the heap
+            self._versions = self._versions_now()
+
+    # Reads
+
+    def due(self, now=None):
+        """Pending reminders, oldest first, each marked 'due' or 'overdue'"""
+        now = now or datetime.now()
+        with self._lock:
+            self._sync(now)
+            self.advance(now)
+            reminders = []
+            for key, at in list(self._pending.items()):
+                reminder = self._reminders.get(key)
+                if reminder is None:
+                    del self._pending[key]
+                    continue
+                if reminder['kind'] == 'appointment':
+                    if at + reminder['duration'] <= now:
+                        del self._pending[key]
+                        continue
+                    status = 'due'
+                else:
+                    status = 'overdue' if now - at > GRACE else 'due'
+                reminders.append({'kind': reminder['kind'], 'id': reminder['id'], 'title': reminder['title'],
+                                  'detail': reminder['detail'], 'at': at, 'status': status})
+            return sorted(reminders, key=lambda r: r['at'])
+
+    def overdue(self, now=None):
+        return [r for r in self.due(now) if r['status'] == 'overdue']
+
+
+_wake = threading.Event()
+# Let the background thread see a new scheduler's reminders
+_schedulers = cache.PerUser(Scheduler, MAX_SCHEDULERS, on_create=lambda _: _wake.set())
+_thread = None
+_start_lock = threading.Lock()
+
+
+def scheduler(user_id=None):
+    """The reminder scheduler for ``user_id``, by default the current user"""
+    return _schedulers.get(user_id)
+
+
+def _run():
+    while True:
+        loaded = _schedulers.values()
+        now = datetime.now()
+        for sched in loaded:
+            sched.advance(now)
+        upcoming = [at for at in (sched.next_at() for sched in loaded) if at is not None]
+        wait = TICK_SECONDS
+        if upcoming:
+            wait = min(wait, max((min(upcoming) - datetime.now()).total_seconds(), 0.1))
+        _wake.wait(wait)
+        _wake.clear()
+
+
+def start():
+    """Start the background thread that advances reminders as they fall due"""
+    global _thread
+    with _start_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name='mindcare-reminders', daemon=True)
+            _thread.start()
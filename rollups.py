@@ -0,0 +1,78 @@
+"""Collections kept together with a per-user daily rollup table.
+
+A ``Rollup`` ties a raw collection (``moods``, ``dose_events``) to its
+derived table (``mood_daily``, ``dose_daily``). Every write stores the raw
+records and folds them into their day's rollup row in the same transaction,
+so readers of the rollups never see one without the other. ``rebuild``
+recomputes a user's rollups from the raw records with one INSERT ... SELECT.
+
+The stores built on this (``mood_store``, ``dose_store``) register themselves
+in ``ROLLUPS`` by collection. Code that writes collections generically, like
+seeding and imports, stores records with ``write``, which goes through a
+collection's rollup when it has one.
+"""
+import storage
+
+ROLLUPS = {}
+
+
+class Rollup:
+    """A collection whose writes also update a daily rollup table
+
+    ``upsert`` folds one row, built from a record by ``day_row(user_id,
+    record)``, into the rollup table. ``aggregate`` is the SELECT that
+    recomputes a user's rollup rows from the collection (its one parameter
+    is the user id).
+    """
+
+    def __init__(self, collection, table, columns, upsert, day_row, aggregate):
+        self.collection = collection
+        self.table = table
+        self.upsert = upsert
+        self.day_row = day_row
+        self.rebuild_sql = f'INSERT INTO {table} ({", ".join(columns)}) {aggregate}'
+        ROLLUPS[collection] = self
+
+    def add(self, record):
+        """Store one record and update its day's rollup"""
+        user = storage.current_user()
+        with storage.transaction() as conn:
+            conn.execute(storage.STATEMENTS[self.collection]['insert'], storage.encode(self.collection, record))
+            conn.execute(self.upsert, self.day_row(user, record))
+        storage.bump(self.collection)
+        return record
+
+    def add_many(self, records):
+        """Store a batch of records and their rollups in one transaction"""
+        records = list(records)
+        user = storage.current_user()
+        with storage.transaction() as conn:
+            conn.executemany(storage.STATEMENTS[self.collection]['insert'],
+                             (storage.encode(self.collection, r) for r in records))
+            conn.executemany(self.upsert, (self.day_row(user, r) for r in records))
+        storage.bump(self.collection)
+
+    def rebuild(self):
+        """Recompute the current user's rollups from their raw records"""
+        user = storage.current_user()
+        with storage.transaction() as conn:
+            conn.execute(f'DELETE FROM {self.table} WHERE user_id = ?', (user,))
+            conn.execute(self.rebuild_sql, (user,))
+        storage.bump(self.collection)
+
+    def ensure(self):
+        """Backfill the current user's rollups once if records predate them"""
+        with storage.reading() as conn:
+            missing = conn.execute(f'SELECT 1 FROM {self.table} WHERE user_id = ? LIMIT 1',
+                                   (storage.current_user(),)).fetchone() is None
+        if missing and not storage.is_empty(self.collection):
+            self.rebuild()
+
+
+def write(collection, records):
+    """Store a batch of ``records``, keeping ``collection``'s rollups current if it has any"""
+    rollup = ROLLUPS.get(collection)
+    if rollup is not None:
+        rollup.add_many(records)
+    else:
+        storage.insert_many(collection, records)
@@ -0,0 +1,287 @@
+"""Demo data seeding, run lazily per collection.
+
+Fixtures are only written when a collection is empty, and only when a page
+that reads that collection is first shown (``ensure_page``). Pages that need
+nothing, like Coping Strategies or Education, paint without seeding anything.
+The mood history is generated in one vectorized NumPy step from a fixed seed,
+so every fresh database starts with the same data. Personal collections are
+only seeded for the demo account and for guest sessions, each into its own
+rows; real accounts start empty apart from the chat greeting. Shared
+collections are seeded once.
+
+Run ``python seed.py`` to see what each collection costs to seed and how much
+of that each page skips on its first paint.
+"""
+import hashlib
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import chat_log
+import counters
+import dose_store
+import mood_store  # registers the moods rollup that rollups.write uses
+import rollups
+import storage
+import users
+
+SEED = 20240110
+# Days of demo dose history
+DOSE_DAYS = 90
+
+MOOD_LABELS = np.array(['', 'Very Low', 'Low', 'Okay', 'Good', 'Great'], dtype=object)
+MOOD_EMOJIS = np.array(['', '😢', '😔', '😐', '🙂', '😊'], dtype=object)
+
+# Collections each page reads; anything else stays unseeded until needed
+PAGE_COLLECTIONS = {
+    "📊 Dashboard": ['moods', 'goals', 'medications', 'dose_events', 'journal_entries', 'appointments', 'symptoms'],
+    "🏠 Home": ['moods', 'goals', 'medications', 'journal_entries', 'appointments', 'symptoms'],
+    "😊 Mood Tracking": ['moods'],
+    "🎯 Goals": ['goals'],
+    "👥 Community": ['community_posts'],
+    "💊 Medications": ['medications', 'dose_events'],
+    "📔 Journal": ['journal_entries'],
+    "👤 Profile": ['moods', 'goals', 'medications', 'dose_events', 'journal_entries'],
+    "💬 Chat Support": ['chat_messages'],
+}
+
+_lock = threading.Lock()
+_ready = set()
+timings = {}
+
+
+def _ids(rng, n):
+    # Deterministic version-4 UUIDs drawn from the same generator
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    return [str(uuid.UUID(bytes=row.tobytes(), version=4)) for row in raw]
+
+
+def mood_fixtures(now, days=30, seed=SEED):
+    """A month of daily check-ins with a weekly pattern and some noise"""
+    rng = np.random.default_rng(seed)
+    offsets = np.arange(days)
+    weekday = offsets % 7
+    base = np.full(days, 3.0)
+    base[np.isin(weekday, [0, 6])] += 0.5  # weekends might be better
+    base[np.isin(weekday, [1, 2])] -= 0.5  # Monday/Tuesday might be harder
+    values = np.clip(np.rint(base + rng.uniform(-0.5, 0.5, days)), 1, 5).astype(int)
+
+    stamps = pd.DatetimeIndex(now - timedelta(days=days) + pd.to_timedelta(offsets, unit='D'))
+    labels = MOOD_LABELS[values]
+    return [
+        {'id': id_, 'date': date, 'datetime': stamp, 'value': int(value), 'label': label,
+         'emoji': emoji, 'notes': f"Daily mood tracking - {label.lower()} day"}
+        for id_, date, stamp, value, label, emoji in zip(
+            _ids(rng, days), stamps.strftime('%Y-%m-%d'), stamps.to_pydatetime(), values,
+            labels, MOOD_EMOJIS[values])
+    ]
+
+
+def goal_fixtures(now):
+    return [
+        {'text': 'Practice deep breathing for 5 minutes daily', 'completed': True, 'created': datetime(2024, 1, 15), 'category': 'Mindfulness'},
+        {'text': 'Take a 20-minute walk outside', 'completed': True, 'created': datetime(2024, 1, 16), 'category': 'Exercise'},
+        {'text': 'Write in journal about positive experiences', 'completed': False, 'created': datetime(2024, 1, 17), 'category': 'Journaling'},
+        {'text': 'Call a friend or family member', 'completed': False, 'created': datetime(2024, 1, 18), 'category': 'Social'},
+        {'text': 'Try a new healthy recipe', 'completed': False, 'created': datetime(2024, 1, 19), 'category': 'Nutrition'},
+        {'text': 'Attend weekly therapy session', 'completed': False, 'created': datetime(2024, 1, 20), 'category': 'Therapy'},
+    ]
+
+
+def journal_fixtures(now):
+    return [
+        {
+            'content': 'Today was challenging. Work was stressful and I felt overwhelmed. Took some deep breaths and went for a short walk. Feeling a bit better now.',
+            'timestamp': now - timedelta(days=2),
+            'mood': 2,
+            'tags': ['stress', 'work', 'anxiety']
+        },
+        {
+            'content': 'Had a good therapy session today. We talked about coping strategies and I feel more equipped to handle difficult situations.',
+            'timestamp': now - timedelta(days=1),
+            'mood': 4,
+            'tags': ['therapy', 'progress', 'coping']
+        }
+    ]
+
+
+def medication_fixtures(now):
+    # Added in time for the whole dose history below
+    added = now - timedelta(days=DOSE_DAYS)
+    return [
+        {'name': 'Sertraline (Zoloft)', 'dosage': '50mg', 'time': '08:00 AM', 'frequency': 'Daily', 'purpose': 'Anxiety/Depression', 'created': added},
+        {'name': 'Lorazepam (Ativan)', 'dosage': '0.5mg', 'time': 'As needed', 'frequency': 'PRN', 'purpose': 'Acute Anxiety', 'created': added},
+        {'name': 'Vitamin D3', 'dosage': '2000 IU', 'time': '09:00 AM', 'frequency': 'Daily', 'purpose': 'Supplement', 'created': added},
+    ]
+
+
+def dose_event_fixtures(now, days=DOSE_DAYS):
+    """A few months of doses for the scheduled medications, mostly on time"""
+    # Medications are always seeded first (see PAGE_COLLECTIONS)
+    rng = np.random.default_rng([SEED, 0])
+    events = []
+    scheduled = [m for m in storage.fetch('medications') if m['frequency'] in dose_store.SCHEDULES]
+    for med in scheduled:
+        dose_time = datetime.strptime(med['time'], '%I:%M %p').time()
+        taken = rng.random(days) < 0.9
+        # Today only the first one has been taken, so the demo has a dose left to mark
+        taken[-1] = med is scheduled[0]
+        for offset in np.flatnonzero(taken):
+            day = (now - timedelta(days=days - 1 - int(offset))).date()
+            events.append({'medication_id': med['id'], 'taken': True,
+                           'timestamp': datetime.combine(day, dose_time), 'date': day.isoformat()})
+    return events
+
+
+def appointment_fixtures(now):
+    return [
+        {'title': 'Weekly Therapy Session', 'datetime': now + timedelta(days=2), 'duration': 50, 'type': 'Therapy', 'location': 'Virtual', 'notes': 'Discuss coping strategies',
+         'repeat': 'Weekly', 'until': now + timedelta(days=365)},
+        {'title': 'Psychiatrist Follow-up', 'datetime': now + timedelta(days=7), 'duration': 30, 'type': 'Medication Review', 'location': 'Clinic', 'notes': 'Medication adjustment review'},
+    ]
+
+
+SYMPTOMS = {
+    # name: (today's severity, today's notes, days its weekly pattern leads mood by)
+    'Anxiety': (6, 'Worse in mornings', 0),
+    'Sleep Quality': (4, 'Better than last week', 1),
+    'Concentration': (5, 'Improving with medication', 0),
+}
+
+
+def symptom_fixtures(now, days=90):
+    """Three months of daily severities that move against the demo mood pattern"""
+    rng = np.random.default_rng([SEED, 1])
+    dates = pd.date_range(end=now.date(), periods=days, freq='D')
+    # Same weekly rhythm as mood_fixtures, whose first day is `now - 30 days`
+    rhythm = (dates - pd.Timestamp((now - timedelta(days=30)).date())).days.to_numpy()
+    records = []
+    for name, (today, notes, lead) in SYMPTOMS.items():
+        weekday = (rhythm + lead) % 7
+        base = np.full(days, 5.0)
+        base[np.isin(weekday, [0, 6])] -= 1.5
+        base[np.isin(weekday, [1, 2])] += 1.5
+        severity = np.clip(np.rint(base + rng.normal(0, 1, days)), 1, 10).astype(int)
+        severity[-1] = today
+        records.extend(
+            {'name': name, 'severity': int(value), 'date': day, 'notes': notes if i == days - 1 else ''}
+            for i, (day, value) in enumerate(zip(dates.strftime('%Y-%m-%d'), severity))
+        )
+    return records
+
+
+def community_post_fixtures(now):
+    return [
+        {
+            'author': 'Anonymous User',
+            'content': 'Today was hard, but I made it through. Small victories matter. Remember to be kind to yourself.',
+            'likes': 24,
+            'timestamp': now - timedelta(hours=2),
+            'tags': ['motivation', 'self-care']
+        },
+        {
+            'author': 'Hope Seeker',
+            'content': 'Started using the breathing exercises from the coping strategies. They really help when anxiety spikes!',
+            'likes': 15,
+            'timestamp': now - timedelta(hours=5),
+            'tags': ['coping', 'anxiety', 'breathing']
+        },
+        {
+            'author': 'Mindful One',
+            'content': 'Grateful for this community. Therapy starts next week and I\'m nervous but hopeful.',
+            'likes': 8,
+            'timestamp': now - timedelta(hours=8),
+            'tags': ['therapy', 'gratitude', 'hope']
+        }
+    ]
+
+
+def chat_message_fixtures(now):
+    return [{'role': 'assistant', 'content': chat_log.GREETING, 'timestamp': now}]
+
+
+FIXTURES = {
+    'goals': goal_fixtures,
+    'journal_entries': journal_fixtures,
+    'medications': medication_fixtures,
+    'dose_events': dose_event_fixtures,
+    'appointments': appointment_fixtures,
+    'symptoms': symptom_fixtures,
+    'community_posts': community_post_fixtures,
+    'chat_messages': chat_message_fixtures,
+}
+
+# Every collection that has demo data
+SEEDED = ['moods', *FIXTURES]
+
+# Seeded for every account, not just the demo one and guests
+FOR_EVERYONE = {'chat_messages'}
+
+
+def _seed(collection, now):
+    # Ids are a global primary key, so every account other than the demo one
+    # draws them from its own stream. With a guest per session there are many
+    # owners, so the stream is keyed by a 128-bit digest of the id
+    owner = storage.owner(collection)
+    salt = [] if owner in (None, storage.DEFAULT_USER) else [
+        int.from_bytes(hashlib.blake2b(owner.encode(), digest_size=16).digest(), 'big')]
+    if collection == 'moods':
+        records = mood_fixtures(now, seed=[SEED, *salt])
+    else:
+        records = FIXTURES[collection](now)
+        rng = np.random.default_rng([SEED, list(FIXTURES).index(collection) + 1, *salt])
+        for record, id_ in zip(records, _ids(rng, len(records))):
+            record['id'] = id_
+    rollups.write(collection, records)
+
+
+def ensure(*collections):
+    """Seed any of ``collections`` that is still empty for the current user, once per process"""
+    pending = [(storage.owner(c), c) for c in collections if (storage.owner(c), c) not in _ready]
+    if not pending:
+        return
+    with _lock:
+        seeded = False
+        for key in pending:
+            collection = key[1]
+            if key in _ready:
+                continue
+            user = storage.current_user()
+            wanted = (storage.is_shared(collection) or collection in FOR_EVERYONE
+                      or user == storage.DEFAULT_USER or users.is_guest(user))
+            if wanted and storage.is_empty(collection):
+                start = time.perf_counter()
+                _seed(collection, datetime.now())
+                timings[collection] = time.perf_counter() - start
+                seeded = True
+            if collection in rollups.ROLLUPS:
+                rollups.ROLLUPS[collection].ensure()
+            _ready.add(key)
+        if seeded:
+            counters.engine().invalidate()
+
+
+def ensure_page(page):
+    ensure(*PAGE_COLLECTIONS.get(page, ()))
+
+
+if __name__ == '__main__':
+    import tempfile
+    from pathlib import Path
+
+    # Seed every collection into a throwaway database and show, per page,
+    # how much of an eager seed its first paint avoids
+    storage.connect(Path(tempfile.mkdtemp()) / 'mindcare.db')
+    ensure(*SEEDED)
+    total = sum(timings.values())
+    for collection, seconds in timings.items():
+        print(f"{collection:<16} {seconds * 1000:7.2f} ms")
+    print(f"{'eager total':<16} {total * 1000:7.2f} ms")
+    pages = ["🌟 Coping Strategies", "📞 Professional Support", "📚 Education"]
+    for page in list(PAGE_COLLECTIONS) + pages:
+        needed = sum(timings[c] for c in PAGE_COLLECTIONS.get(page, ()))
+        print(f"{page:<24} saves {(total - needed) * 1000:7.2f} ms on first paint")
@@ -0,0 +1,133 @@
+"""Startup timing and a background warm-up of the chart libraries.
+
+Streamlit itself imports pandas, NumPy and plotly's top-level package, so
+what a fresh process still has to load for its first page is this app's own
+modules and that page's module (page modules are imported on first use, see
+``views``). The expensive step comes later. plotly builds its figure classes,
+property validators and the ``plotly_white`` template on first use, and that
+takes about half a second. After a deploy or a scale-out, the first person
+to open a chart page would wait for it.
+
+``painted()`` runs at the end of every script run. After the process's first
+paint it starts ``preload()`` on a daemon thread. The thread imports the
+pages that draw charts and builds and serializes one throwaway figure, so
+that work is done before anyone needs it. Set ``MINDCARE_PRELOAD=0`` to skip
+it.
+
+With ``MINDCARE_PROFILE_STARTUP=1`` the first run logs its time to first
+paint, split into seeding, the page (import and render) and the rest, and
+the preload logs what it warmed. ``python startup.py`` profiles a cold start in a
+fresh interpreter: every module the app loads is imported one at a time,
+dependencies first, followed by the warm-up, each with its time.
+"""
+import importlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE = os.environ.get('MINDCARE_PROFILE_STARTUP', '0') != '0'
+PRELOAD = os.environ.get('MINDCARE_PRELOAD', '1') != '0'
+
+# What the first run of a fresh process imports, dependencies first
+MODULES = ['streamlit', 'storage', 'cache', 'users', 'assets', 'rollups', 'dose_store', 'appointments', 'reminders',
+           'counters', 'mood_store', 'seed', 'views', 'views.common']
+
+# Pages that draw charts, warmed after the first paint
+CHART_PAGES = ['views.charts', 'views.dashboard', 'views.mood_tracking', 'views.medications']
+
+logger = logging.getLogger(__name__)
+if PROFILE:
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.StreamHandler())
+timings = {}
+_lock = threading.Lock()
+_began = None
+_painted = False
+
+
+def begin():
+    """Mark the start of the process's first run"""
+    global _began
+    with _lock:
+        if _began is None:
+            _began = time.perf_counter()
+
+
+@contextmanager
+def timed(step):
+    """Record how long the first run of ``step`` took"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.setdefault(step, time.perf_counter() - start)
+
+
+def timed_import(name):
+    """Import ``name``, recording how long it took if it wasn't loaded yet"""
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    timings.setdefault(f'import {name}', elapsed)
+    return module
+
+
+def warm_plotly():
+    """Build and serialize one figure so plotly's lazy setup is done"""
+    import plotly.graph_objects as go
+    import plotly.io
+
+    start = time.perf_counter()
+    fig = go.Figure([go.Scatter(x=[0], y=[0]), go.Scattergl(x=[0], y=[0]), go.Bar(x=[0], y=[0])])
+    fig.update_layout(template='plotly_white', yaxis2=dict(overlaying='y', side='right'),
+                      legend=dict(orientation='h'), hovermode='x unified')
+    plotly.io.to_json(fig, validate=False)
+    timings['warm plotly'] = time.perf_counter() - start
+
+
+def preload():
+    """Import the chart pages and warm plotly"""
+    try:
+        for name in CHART_PAGES:
+            timed_import(name)
+        warm_plotly()
+    except Exception:
+        # Only a head start; each page imports what it needs either way
+        logger.exception("Preload failed")
+        return
+    if PROFILE:
+        pages = sum(timings[f'import {name}'] for name in CHART_PAGES)
+        logger.info("Preloaded chart pages in %.0f ms, warmed plotly in %.0f ms",
+                    pages * 1000, timings['warm plotly'] * 1000)
+
+
+def painted(seeded=None):
+    """Called at the end of each run; after the first one, report and preload"""
+    global _painted
+    with _lock:
+        if _painted or _began is None:
+            return
+        _painted = True
+        timings['first paint'] = time.perf_counter() - _began
+    if PROFILE:
+        # Only the first page has been imported and rendered at this point
+        seeding = sum((seeded or {}).values())
+        page = sum(v for k, v in timings.items() if k.startswith('render '))
+        imported = sum(v for k, v in timings.items() if k.startswith('import views.'))
+        logger.info("First paint %.0f ms: seeding %.0f ms, page %.0f ms (import %.0f ms), rest %.0f ms",
+                    timings['first paint'] * 1000, seeding * 1000, page * 1000, imported * 1000,
+                    (timings['first paint'] - seeding - page) * 1000)
+    if PRELOAD:
+        threading.Thread(target=preload, name='mindcare-preload', daemon=True).start()
+
+
+if __name__ == '__main__':
+    # Run from a fresh interpreter, so every import below is cold
+    for name in MODULES + CHART_PAGES:
+        timed_import(name)
+    warm_plotly()
+    for step, seconds in timings.items():
+        print(f"{step:<30} {seconds * 1000:8.2f} ms")
+    print(f"{'total':<30} {sum(timings.values()) * 1000:8.2f} ms")
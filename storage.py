@@ -0,0 +1,514 @@
+"""SQLite storage for MindCare.
+
+Every collection the app used to keep as a list in ``st.session_state`` lives
+in its own indexed table here. The database runs in WAL mode so page reads are
+never blocked by a concurrent write, and pages ask only for the rows they
+actually render (``fetch(..., limit=...)``) instead of loading whole histories.
+
+Collections are partitioned by user: each row carries a ``user_id``, every
+index leads with it, and every read and write is scoped to the user set with
+``use()`` for the current thread (a Streamlit session's script thread). Shared
+collections such as community posts are not scoped. Connections come from a
+small pool, so sessions read concurrently and only writes are serialized.
+"""
+import contextvars
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+DATA_DIR = Path(os.environ.get('MINDCARE_DATA_DIR', Path(__file__).resolve().parent / 'data'))
+DB_PATH = DATA_DIR / 'mindcare.db'
+POOL_SIZE = int(os.environ.get('MINDCARE_DB_POOL', 8))
+
+# Owner of rows written outside any signed-in session (seeding, scripts)
+DEFAULT_USER = 'demo'
+
+# Column types: 'text', 'int', 'real', 'bool', 'datetime' (ISO text) and 'json'
+COLLECTIONS = {
+    'moods': {
+        'columns': {'id': 'text', 'date': 'text', 'datetime': 'datetime', 'value': 'int',
+                    'label': 'text', 'emoji': 'text', 'notes': 'text'},
+        'order_by': 'datetime',
+        'indexes': ['datetime', 'date'],
+    },
+    'goals': {
+        'columns': {'id': 'text', 'text': 'text', 'completed': 'bool', 'created': 'datetime',
+                    'category': 'text'},
+        'order_by': 'created',
+        'indexes': ['created', 'completed'],
+    },
+    'journal_entries': {
+        # tags, mood and sentiment are filled in by journal_enrichment
+        'columns': {'id': 'text', 'content': 'text', 'timestamp': 'datetime', 'mood': 'int',
+                    'tags': 'json', 'sentiment': 'real'},
+        'order_by': 'timestamp',
+        'indexes': [('timestamp', 'id')],
+    },
+    'medications': {
+        # Whether a dose was taken is read from dose_daily (see dose_store.taken_now)
+        'columns': {'id': 'text', 'name': 'text', 'dosage': 'text', 'time': 'text',
+                    'frequency': 'text', 'purpose': 'text', 'created': 'datetime'},
+        'order_by': 'rowid',
+        'indexes': ['frequency'],
+    },
+    'dose_events': {
+        # Append-only: one row per dose marked taken (or taken back)
+        'columns': {'id': 'text', 'medication_id': 'text', 'taken': 'bool', 'timestamp': 'datetime',
+                    'date': 'text'},
+        'order_by': 'timestamp',
+        'indexes': [('medication_id', 'timestamp')],
+    },
+    'appointments': {
+        # A repeating appointment is one row; see appointments.py
+        'columns': {'id': 'text', 'title': 'text', 'datetime': 'datetime', 'duration': 'int',
+                    'type': 'text', 'location': 'text', 'notes': 'text', 'repeat': 'text',
+                    'until': 'datetime'},
+        'order_by': 'datetime',
+        'indexes': ['datetime'],
+    },
+    'symptoms': {
+        # One row per reading, so each symptom is a time series
+        'columns': {'id': 'text', 'name': 'text', 'severity': 'int', 'date': 'text',
+                    'notes': 'text'},
+        'order_by': 'rowid',
+        'indexes': [('name', 'date'), 'date'],
+    },
+    'community_posts': {
+        'columns': {'id': 'text', 'author': 'text', 'content': 'text', 'likes': 'int',
+                    'timestamp': 'datetime', 'tags': 'json'},
+        'order_by': 'timestamp',
+        # Time order for the feed and paging, likes for the best score
+        'indexes': [('timestamp', 'id'), 'likes'],
+        'shared': True,
+    },
+    'chat_messages': {
+        'columns': {'id': 'text', 'role': 'text', 'content': 'text', 'timestamp': 'datetime'},
+        'order_by': 'timestamp',
+        'indexes': [('timestamp', 'id')],
+    },
+    'users': {
+        'columns': {'id': 'text', 'email': 'text', 'name': 'text', 'age': 'int', 'diagnosis': 'text',
+                    'therapist': 'text', 'emergency_contact': 'text', 'joined': 'datetime',
+                    'therapy_sessions': 'int', 'days_sober': 'int', 'password_hash': 'text'},
+        'order_by': 'joined',
+        'indexes': ['email'],
+        'shared': True,
+    },
+}
+
+# Derived tables that are maintained alongside the collections above
+DERIVED_SCHEMA = [
+    # One row per user and calendar day of mood check-ins, kept current by mood_store
+    'CREATE TABLE IF NOT EXISTS mood_daily (user_id TEXT NOT NULL, date TEXT NOT NULL, '
+    'count INTEGER NOT NULL, total REAL NOT NULL, min INTEGER NOT NULL, max INTEGER NOT NULL, '
+    'PRIMARY KEY (user_id, date))',
+    # Net doses per user, calendar day and medication, kept current by dose_store
+    'CREATE TABLE IF NOT EXISTS dose_daily (user_id TEXT NOT NULL, date TEXT NOT NULL, '
+    'medication_id TEXT NOT NULL, taken INTEGER NOT NULL, PRIMARY KEY (user_id, date, medication_id))',
+    # Who liked which community post; the post's likes column is the count
+    'CREATE TABLE IF NOT EXISTS post_likes (post_id TEXT NOT NULL, user_id TEXT NOT NULL, '
+    'PRIMARY KEY (post_id, user_id))',
+]
+
+_SQL_TYPES = {'text': 'TEXT', 'int': 'INTEGER', 'real': 'REAL', 'bool': 'INTEGER',
+              'datetime': 'TEXT', 'json': 'TEXT'}
+
+_lock = threading.RLock()
+_write_lock = threading.RLock()
+_pool = None
+_current_user = contextvars.ContextVar('mindcare_user', default=DEFAULT_USER)
+
+# Bumped on every write so caches can tell when a collection has changed;
+# keyed by (owner, collection), where the owner is None for shared collections
+_versions = {}
+
+
+def is_shared(collection):
+    return COLLECTIONS[collection].get('shared', False)
+
+
+def _build_statements():
+    # SQL text is built once so sqlite3's per-connection statement cache
+    # always sees the same strings and reuses the compiled statements
+    statements = {}
+    for name, spec in COLLECTIONS.items():
+        quoted = ', '.join(f'"{c}"' for c in spec['columns'])
+        # Rows of user-scoped collections are written with their owner last
+        written = list(spec['columns']) + ([] if spec.get('shared') else ['user_id'])
+        quoted_written = ', '.join(f'"{c}"' for c in written)
+        owned = '' if spec.get('shared') else ' AND user_id = ?'
+        statements[name] = {
+            'insert': f'INSERT OR REPLACE INTO {name} ({quoted_written}) '
+                      f'VALUES ({", ".join("?" for _ in written)})',
+            'get': f'SELECT {quoted} FROM {name} WHERE id = ?{owned}',
+            'delete': f'DELETE FROM {name} WHERE id = ?{owned}',
+            'count': f'SELECT COUNT(*) FROM {name}',
+            'select': f'SELECT {quoted} FROM {name}',
+        }
+    return statements
+
+
+STATEMENTS = _build_statements()
+
+
+def _table_sql():
+    for name, spec in COLLECTIONS.items():
+        defs = ', '.join(
+            f'"{col}" {_SQL_TYPES[kind]}' + (' PRIMARY KEY' if col == 'id' else '')
+            for col, kind in spec['columns'].items()
+        )
+        if not spec.get('shared'):
+            defs += ', user_id TEXT NOT NULL'
+        yield f'CREATE TABLE IF NOT EXISTS {name} ({defs})'
+    yield from DERIVED_SCHEMA
+
+
+def _index_sql():
+    for name, spec in COLLECTIONS.items():
+        for cols in spec['indexes']:
+            # An index is a column name or a tuple of columns; user-scoped
+            # tables lead every index with the owner
+            cols = (cols,) if isinstance(cols, str) else tuple(cols)
+            if not spec.get('shared'):
+                cols = ('user_id',) + cols
+            quoted = ', '.join(f'"{c}"' for c in cols)
+            yield f'CREATE INDEX IF NOT EXISTS idx_{name}_{"_".join(cols)} ON {name} ({quoted})'
+
+
+def _migrate(conn):
+    # Databases from before partitioning: existing rows belong to the default
+    # user, and the daily mood rollups are dropped to be rebuilt per user
+    for name, spec in COLLECTIONS.items():
+        columns = {row[1] for row in conn.execute(f'PRAGMA table_info({name})')}
+        if not spec.get('shared') and 'user_id' not in columns:
+            conn.execute(f"ALTER TABLE {name} ADD COLUMN user_id TEXT NOT NULL DEFAULT '{DEFAULT_USER}'")
+            for cols in spec['indexes']:
+                cols = (cols,) if isinstance(cols, str) else cols
+                conn.execute(f'DROP INDEX IF EXISTS idx_{name}_{"_".join(cols)}')
+        # Columns added since the table was created start out empty
+        for col, kind in spec['columns'].items():
+            if col not in columns:
+                conn.execute(f'ALTER TABLE {name} ADD COLUMN "{col}" {_SQL_TYPES[kind]}')
+    if 'user_id' not in {row[1] for row in conn.execute('PRAGMA table_info(mood_daily)')}:
+        conn.execute('DROP TABLE mood_daily')
+        conn.execute(DERIVED_SCHEMA[0])
+
+
+class ConnectionPool:
+    """A bounded set of connections to one database, lent out per thread
+
+    A thread that already holds a connection gets the same one back, so
+    nested ``reading()``/``transaction()`` blocks never wait on the pool.
+    """
+
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._opened = []
+        self._held = threading.local()
+        self._lock = threading.Lock()
+
+    def _open(self):
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, cached_statements=256, timeout=30)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self.size:
+                conn = self._open()
+                self._opened.append(conn)
+                return conn
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self):
+        conn = getattr(self._held, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._held.conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._held.conn = None
+            self._idle.put(conn)
+
+    def close(self):
+        with self._lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
+
+
+def connect(path=None):
+    """Open (once per process) the database and its connection pool"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            db_path = Path(path or DB_PATH)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            pool = ConnectionPool(db_path)
+            with pool.connection() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                with conn:
+                    for sql in _table_sql():
+                        conn.execute(sql)
+                    _migrate(conn)
+                    for sql in _index_sql():
+                        conn.execute(sql)
+            _pool = pool
+        return _pool
+
+
+def close():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
+def reading():
+    """Borrow a pooled connection for one or more reads"""
+    with connect().connection() as conn:
+        yield conn
+
+
+@contextmanager
+def transaction():
+    """Hold a connection for a group of statements committed together
+
+    Writers take turns on a process-wide lock; readers never wait for it.
+    """
+    with connect().connection() as conn, _write_lock, conn:
+        yield conn
+
+
+def use(user_id):
+    """Scope this thread's reads and writes to ``user_id``"""
+    _current_user.set(user_id)
+
+
+def current_user():
+    return _current_user.get()
+
+
+def owner(collection):
+    """The user a collection is scoped to right now, or None if it is shared"""
+    return None if is_shared(collection) else _current_user.get()
+
+
+def _where(collection, where='', params=()):
+    # Rows of user-scoped collections are always filtered to the current user
+    clauses = [] if is_shared(collection) else ['user_id = ?']
+    values = [] if is_shared(collection) else [_current_user.get()]
+    if where:
+        clauses.append(f'({where})')
+        values.extend(params)
+    return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), tuple(values)
+
+
+def _owned(collection):
+    return () if is_shared(collection) else (_current_user.get(),)
+
+
+def version(collection):
+    return _versions.get((owner(collection), collection), 0)
+
+
+def bump(collection):
+    key = (owner(collection), collection)
+    with _lock:
+        _versions[key] = _versions.get(key, 0) + 1
+
+
+def encode(collection, record):
+    row = []
+    for col, kind in COLLECTIONS[collection]['columns'].items():
+        value = record.get(col)
+        if value is None:
+            row.append(None)
+        elif kind == 'datetime':
+            row.append(value.isoformat() if isinstance(value, datetime) else str(value))
+        elif kind == 'bool':
+            row.append(int(bool(value)))
+        elif kind == 'json':
+            row.append(json.dumps(value))
+        else:
+            row.append(value)
+    # The owner goes last, after the collection's own columns
+    return row + list(_owned(collection))
+
+
+def decode(collection, row):
+    record = {}
+    for (col, kind), value in zip(COLLECTIONS[collection]['columns'].items(), row):
+        if value is not None:
+            if kind == 'datetime':
+                value = datetime.fromisoformat(value)
+            elif kind == 'bool':
+                value = bool(value)
+            elif kind == 'json':
+                value = json.loads(value)
+        record[col] = value
+    return record
+
+
+def insert(collection, record):
+    with transaction() as conn:
+        conn.execute(STATEMENTS[collection]['insert'], encode(collection, record))
+    bump(collection)
+    return record
+
+
+def insert_many(collection, records):
+    with transaction() as conn:
+        conn.executemany(STATEMENTS[collection]['insert'], (encode(collection, r) for r in records))
+    bump(collection)
+
+
+def get(collection, record_id):
+    with reading() as conn:
+        row = conn.execute(STATEMENTS[collection]['get'], (record_id, *_owned(collection))).fetchone()
+    return decode(collection, row) if row else None
+
+
+def update(collection, record_id, **changes):
+    columns = COLLECTIONS[collection]['columns']
+    current = {col: changes[col] for col in columns if col in changes}
+    if not current:
+        return
+    assignments = ', '.join(f'"{col}" = ?' for col in current)
+    values = encode(collection, current)
+    values = [v for col, v in zip(columns, values) if col in current]
+    where, params = _where(collection, 'id = ?', (record_id,))
+    with transaction() as conn:
+        conn.execute(f'UPDATE {collection} SET {assignments}{where}', (*values, *params))
+    bump(collection)
+
+
+def toggle(collection, record_id, field):
+    """Flip a boolean column in place and return the new value"""
+    where, params = _where(collection, 'id = ?', (record_id,))
+    with transaction() as conn:
+        conn.execute(f'UPDATE {collection} SET "{field}" = 1 - "{field}"{where}', params)
+        row = conn.execute(f'SELECT "{field}" FROM {collection}{where}', params).fetchone()
+    bump(collection)
+    return bool(row[0]) if row else None
+
+
+def delete(collection, record_id):
+    with transaction() as conn:
+        conn.execute(STATEMENTS[collection]['delete'], (record_id, *_owned(collection)))
+    bump(collection)
+
+
+def clear(collection):
+    where, params = _where(collection)
+    with transaction() as conn:
+        conn.execute(f'DELETE FROM {collection}{where}', params)
+    bump(collection)
+
+
+def count(collection, where='', params=()):
+    where, params = _where(collection, where, params)
+    with reading() as conn:
+        return conn.execute(STATEMENTS[collection]['count'] + where, params).fetchone()[0]
+
+
+def fetch(collection, where='', params=(), descending=False, limit=None, offset=0, order_by=None):
+    """Read rows in storage order, optionally filtered and windowed
+
+    ``where`` is a trusted SQL fragment written by the app; values always go
+    through ``params``.
+    """
+    order_col = order_by or COLLECTIONS[collection]['order_by']
+    order_sql = order_col if order_col == 'rowid' else f'"{order_col}"'
+    where, params = _where(collection, where, params)
+    sql = STATEMENTS[collection]['select'] + where
+    sql += f' ORDER BY {order_sql} {"DESC" if descending else "ASC"}'
+    if limit is not None:
+        sql += ' LIMIT ? OFFSET ?'
+        params = (*params, limit, offset)
+    with reading() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return [decode(collection, row) for row in rows]
+
+
+def stream(collection, chunk_size=1000):
+    """Every row in storage order, decoded ``chunk_size`` rows at a time
+
+    Rows are read lazily from one cursor, so memory stays bounded by the
+    chunk however large the collection is.
+    """
+    spec = COLLECTIONS[collection]
+    order_sql = spec['order_by'] if spec['order_by'] == 'rowid' else f'"{spec["order_by"]}"'
+    where, params = _where(collection)
+    with reading() as conn:
+        cursor = conn.execute(STATEMENTS[collection]['select'] + where + f' ORDER BY {order_sql}', params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield [decode(collection, row) for row in rows]
+
+
+def page(collection, cursor=None, direction='older', limit=20):
+    """One newest-first window of rows, keyset-paginated on (order column, id)
+
+    ``cursor`` is the (order value, id) key of a row already shown; the window
+    holds the ``limit`` rows just older or newer than it. Returns the rows plus
+    the cursors for the next older and newer windows (None at either end).
+    """
+    order_col = COLLECTIONS[collection]['order_by']
+    select = STATEMENTS[collection]['select']
+    key = f'"{order_col}", id'
+    newest_first = f'"{order_col}" DESC, id DESC'
+    if cursor is None:
+        where, params = _where(collection)
+        sql = f'{select}{where} ORDER BY {newest_first} LIMIT ?'
+    elif direction == 'older':
+        where, params = _where(collection, f'({key}) < (?, ?)', cursor)
+        sql = f'{select}{where} ORDER BY {newest_first} LIMIT ?'
+    else:
+        where, params = _where(collection, f'({key}) > (?, ?)', cursor)
+        sql = f'{select}{where} ORDER BY {key} LIMIT ?'
+    params = (*params, limit)
+    with reading() as conn:
+        rows = conn.execute(sql, params).fetchall()
+        if direction == 'newer' and cursor is not None:
+            rows.reverse()
+        records = [decode(collection, row) for row in rows]
+        if not rows:
+            return {'rows': [], 'older': None, 'newer': None}
+        # id is always the first column
+        order_index = list(COLLECTIONS[collection]['columns']).index(order_col)
+        top = (rows[0][order_index], rows[0][0])
+        bottom = (rows[-1][order_index], rows[-1][0])
+        newer_where, newer_params = _where(collection, f'({key}) > (?, ?)', top)
+        older_where, older_params = _where(collection, f'({key}) < (?, ?)', bottom)
+        has_newer = conn.execute(f'SELECT 1 FROM {collection}{newer_where} LIMIT 1', newer_params).fetchone()
+        has_older = conn.execute(f'SELECT 1 FROM {collection}{older_where} LIMIT 1', older_params).fetchone()
+    return {
+        'rows': records,
+        'older': bottom if has_older else None,
+        'newer': top if has_newer else None,
+    }
+
+
+def is_empty(collection):
+    where, params = _where(collection)
+    with reading() as conn:
+        return conn.execute(f'SELECT 1 FROM {collection}{where} LIMIT 1', params).fetchone() is None
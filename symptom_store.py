@@ -0,0 +1,115 @@
+"""Symptom severity history and its relation to mood.
+
+Every check-in writes one ``symptoms`` row per symptom rated, so each
+symptom builds up its own time series instead of only the latest value.
+The rows are indexed by (user, name, date).
+
+The analytics work on whole columns at once. SQLite averages each day's
+readings, and the result is pivoted into a frame with one row per calendar
+day and one column per symptom. Rolling averages and the lagged
+correlations against the daily mood series are then single pandas
+operations over that frame, never a Python loop over readings. Results are
+cached until the next symptom or mood write, so a rerun without new data
+reuses them.
+"""
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import cache
+import mood_analytics
+import storage
+
+# Symptoms rated by the Home check-in, worst at 10
+CHECK_IN = ['Anxiety', 'Sleep Quality', 'Energy Level']
+
+# Fewer overlapping days than this and a correlation is left blank
+MIN_PAIRS = 7
+
+
+def record(severities, notes='', when=None):
+    """Store one reading per symptom in ``severities`` (name -> 1-10)"""
+    when = when or datetime.now()
+    day = when.strftime('%Y-%m-%d')
+    storage.insert_many('symptoms', [
+        {'id': str(uuid.uuid4()), 'name': name, 'severity': int(severity), 'date': day, 'notes': notes}
+        for name, severity in severities.items()
+    ])
+
+
+@cache.versioned('symptoms')
+def latest():
+    """Each symptom's most recent reading, by date (the later write on the same day)"""
+    # By date rather than insert order, so importing older readings doesn't
+    # replace the current ones
+    return storage.fetch(
+        'symptoms',
+        'rowid IN (SELECT rowid FROM (SELECT rowid, ROW_NUMBER() OVER '
+        '(PARTITION BY name ORDER BY date DESC, rowid DESC) AS n FROM symptoms WHERE user_id = ?) WHERE n = 1)',
+        (storage.current_user(),))
+
+
+@cache.versioned('symptoms')
+def daily():
+    """Average severity per calendar day (rows) and symptom (columns), gaps as NaN"""
+    with storage.reading() as conn:
+        readings = pd.read_sql_query(
+            'SELECT date, name, AVG(severity) AS severity FROM symptoms WHERE user_id = ? '
+            'GROUP BY name, date', conn, params=(storage.current_user(),))
+    if readings.empty:
+        return None
+    frame = readings.pivot(index='date', columns='name', values='severity')
+    frame.index = pd.to_datetime(frame.index)
+    return frame.sort_index().asfreq('D')
+
+
+@cache.versioned('symptoms')
+def rolling(window=7):
+    """Rolling mean severity over ``window`` days, per symptom"""
+    frame = daily()
+    if frame is None:
+        return None
+    return frame.rolling(window, min_periods=1).mean()
+
+
+@cache.versioned('symptoms', 'moods')
+def lagged_correlations(max_lag=7):
+    """Correlation of each symptom with mood ``lag`` days later (rows: lag, columns: symptom)
+
+    A negative value at lag 1 means a bad day for that symptom tends to be
+    followed by a lower mood the next day.
+    """
+    frame, mood = daily(), mood_analytics.daily()
+    if frame is None or mood is None:
+        return None
+    days = frame.index.union(mood.index)
+    frame, mood = frame.reindex(days), mood.reindex(days)
+    has_mood = mood.notna().to_numpy()[:, None]
+    lags = {}
+    for lag in range(max_lag + 1):
+        shifted = frame.shift(lag)
+        pairs = (shifted.notna().to_numpy() & has_mood).sum(axis=0)
+        lags[lag] = shifted.corrwith(mood).where(pairs >= MIN_PAIRS)
+    return pd.DataFrame.from_dict(lags, orient='index').rename_axis('lag')
+
+
+def strongest_links(max_lag=3):
+    """For each symptom, the lag with the largest absolute correlation: {name: (lag, r)}
+
+    The default stays under a week; at a lag of seven days a weekly rhythm
+    just repeats the same-day correlation.
+    """
+    correlations = lagged_correlations(max_lag)
+    if correlations is None:
+        return {}
+    values = correlations.to_numpy()
+    found = {}
+    for column, name in enumerate(correlations.columns):
+        magnitudes = np.abs(values[:, column])
+        if np.isnan(magnitudes).all():
+            continue
+        row = int(np.nanargmax(magnitudes))
+        found[name] = (int(correlations.index[row]), float(values[row, column]))
+    return found
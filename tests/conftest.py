@@ -0,0 +1,22 @@
+import os
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+# A throwaway database, set before anything imports storage
+os.environ['MINDCARE_DATA_DIR'] = tempfile.mkdtemp(prefix='mindcare-tests-')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import storage  # noqa: E402
+
+
+@pytest.fixture
+def user():
+    """A fresh account id, so a test only sees its own rows"""
+    user_id = f'test-{uuid.uuid4()}'
+    storage.use(user_id)
+    yield user_id
+    storage.use(storage.DEFAULT_USER)
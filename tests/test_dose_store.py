@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+import counters
+import dose_store
+import storage
+
+
+def _medication(frequency, created):
+    return storage.insert('medications', {
+        'id': f'med-{frequency}', 'name': 'Sertraline', 'dosage': '50mg', 'frequency': frequency,
+        'time': '08:00', 'purpose': '', 'created': created,
+    })
+
+
+def test_undo_takes_back_a_dose(user):
+    today = datetime.now().date()
+    med = _medication('Twice Daily', datetime.now() - timedelta(days=1))
+    engine = counters.engine()
+    for taken_before in range(2):
+        dose_store.record(med['id'], True)
+        engine.dose_taken(med['frequency'], taken_before)
+    assert dose_store.history([med], 1, today)[-1]['adherence'] == 1
+    assert engine.snapshot()['meds_scheduled_taken'] == 1
+
+    assert dose_store.undo(med)
+    engine.dose_undone(med['frequency'], 2)
+    assert dose_store.taken_now([med])[med['id']] == 1
+    assert dose_store.history([med], 1, today)[-1]['adherence'] == 0.5
+    assert engine.snapshot()['meds_scheduled_taken'] == 0
+    assert engine.snapshot()['meds_taken'] == 1
+
+    # The deltas agree with counting from storage
+    engine.invalidate()
+    assert engine.snapshot()['meds_scheduled_taken'] == 0
+    assert engine.snapshot()['meds_taken'] == 1
+
+
+def test_undo_lowers_the_day_the_dose_was_counted(user):
+    today = datetime.now().date()
+    med = _medication('Weekly', datetime.now() - timedelta(days=7))
+    dose_store.record(med['id'], True, datetime.now() - timedelta(days=3))
+    assert dose_store.history([med], 1, today)[-1]['adherence'] == 1
+
+    assert dose_store.undo(med)
+    assert dose_store.taken_now([med])[med['id']] == 0
+    assert dose_store.history([med], 1, today)[-1]['adherence'] == 0
+    assert dose_store.undo(med) is None
@@ -0,0 +1,28 @@
+import json
+
+import mood_analytics
+import symptom_store
+import transfer
+
+
+def _import(*items):
+    lines = [json.dumps({'collection': collection, 'record': record}) for collection, record in items]
+    return transfer.import_records(transfer.read_jsonl(lines))
+
+
+def test_malformed_dates_are_rejected(user):
+    report = _import(
+        ('symptoms', {'name': 'Anxiety', 'severity': 5, 'date': 'last tuesday'}),
+        ('moods', {'datetime': '2024-05-01T09:00:00', 'value': 3, 'date': '05/01/2024'}),
+        ('moods', {'datetime': '2024-05-01T09:00:00', 'value': 3, 'date': '2024-05-02'}),
+        ('symptoms', {'name': 'Anxiety', 'severity': 4, 'date': '2024-05-01'}),
+        ('moods', {'datetime': '2024-05-01T09:00:00', 'value': 4}),
+    )
+    assert report['errors'] == 3
+    assert report['imported'] == {'symptoms': 1, 'moods': 1}
+    assert any('date is not a YYYY-MM-DD date' in problem for problem in report['problems'])
+    assert any('date is not the day of datetime' in problem for problem in report['problems'])
+
+    # What was stored still parses, so the Dashboard and Mood Tracking render
+    assert list(symptom_store.daily().index.strftime('%Y-%m-%d')) == ['2024-05-01']
+    assert mood_analytics.daily().loc['2024-05-01'] == 4
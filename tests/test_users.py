@@ -0,0 +1,25 @@
+import seed
+import storage
+import users
+
+
+def test_each_guest_gets_their_own_data():
+    first, second = users.new_guest_id(), users.new_guest_id()
+    assert first != second
+    assert users.resolve(first)['id'] == first
+    assert storage.get('users', first) is None
+
+    goals = {}
+    for guest in (first, second):
+        storage.use(guest)
+        seed.ensure('goals')
+        goals[guest] = {goal['id'] for goal in storage.fetch('goals')}
+    storage.use(storage.DEFAULT_USER)
+    assert goals[first] and goals[second]
+    assert not goals[first] & goals[second]
+
+
+def test_unknown_account_resolves_to_a_new_guest():
+    user = users.resolve('no-such-account')
+    assert users.is_guest(user['id'])
+    assert user['name'] == 'Guest'
@@ -0,0 +1,117 @@
+"""Therapist directory search for the Professional Support page.
+
+Providers are loaded once per process from ``content/providers.json``.
+Everything is numbered in rank order (rating, then review count). Each filter
+value (specialty, approach, insurance, session format, location word) maps to
+a bitmap, stored as a Python int, of the providers that have it. The cost
+filter uses cumulative bitmaps at every distinct price, found with bisect.
+
+A query ANDs one bitmap per filter (OR within a filter). The best-ranked
+matches are the lowest set bits, so a results page never sorts anything. A
+deep page is found by counting set bits a block at a time rather than
+walking every match before it.
+"""
+import json
+import re
+import threading
+from bisect import bisect_right
+from pathlib import Path
+
+PROVIDERS_PATH = Path(__file__).resolve().parent / 'content' / 'providers.json'
+PAGE_SIZE = 5
+
+FACETS = ('specialties', 'approaches', 'insurance', 'formats')
+# Bitmaps are paged through in blocks of this many bytes
+_BLOCK_BYTES = 128
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def _bit_positions(bitmap, skip, limit):
+    # Skip whole blocks by their popcount, then walk the set bits of the
+    # block holding the page from the lowest (best ranked) upwards. Only small
+    # per-block ints are created, however deep the page is.
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    positions = []
+    for start in range(0, len(data), _BLOCK_BYTES):
+        block = int.from_bytes(data[start:start + _BLOCK_BYTES], 'little')
+        count = block.bit_count()
+        if skip >= count:
+            skip -= count
+            continue
+        while block and len(positions) < limit:
+            low = block & -block
+            if skip:
+                skip -= 1
+            else:
+                positions.append(start * 8 + low.bit_length() - 1)
+            block ^= low
+        if len(positions) >= limit:
+            break
+    return positions
+
+
+class ProviderDirectory:
+    def __init__(self, providers):
+        for provider in providers:
+            provider['cost'] = f"${provider['cost_min']}-{provider['cost_max']}/session"
+        self.providers = sorted(providers, key=lambda p: (-p['rating'], -p['reviews'], p['name']))
+        self.everyone = (1 << len(self.providers)) - 1
+
+        self.index = {facet: {} for facet in FACETS}
+        self.location_index = {}
+        by_cost = {}
+        for position, provider in enumerate(self.providers):
+            bit = 1 << position
+            for facet in FACETS:
+                postings = self.index[facet]
+                for value in provider[facet]:
+                    postings[value] = postings.get(value, 0) | bit
+            for word in set(_WORD.findall(f"{provider['city']} {provider['location']}".lower())):
+                self.location_index[word] = self.location_index.get(word, 0) | bit
+            by_cost[provider['cost_min']] = by_cost.get(provider['cost_min'], 0) | bit
+
+        # cost_bitmaps[i] holds everyone whose lowest fee is <= cost_points[i]
+        self.cost_points = sorted(by_cost)
+        self.cost_bitmaps = []
+        running = 0
+        for cost in self.cost_points:
+            running |= by_cost[cost]
+            self.cost_bitmaps.append(running)
+
+    def match(self, specialties=(), approaches=(), insurance=(), formats=(), max_cost=None, location=''):
+        """Bitmap of providers passing every filter; empty filters match all"""
+        result = self.everyone
+        for facet, wanted in zip(FACETS, (specialties, approaches, insurance, formats)):
+            if wanted:
+                postings = self.index[facet]
+                any_of = 0
+                for value in wanted:
+                    any_of |= postings.get(value, 0)
+                result &= any_of
+        if max_cost is not None:
+            i = bisect_right(self.cost_points, max_cost)
+            result &= self.cost_bitmaps[i - 1] if i else 0
+        for word in _WORD.findall(location.lower()):
+            result &= self.location_index.get(word, 0)
+        return result
+
+    def search(self, page=0, page_size=PAGE_SIZE, **filters):
+        """One page of ranked matches and the total match count"""
+        matches = self.match(**filters)
+        positions = _bit_positions(matches, page * page_size, page_size)
+        return [self.providers[i] for i in positions], matches.bit_count()
+
+
+_lock = threading.Lock()
+_directory = None
+
+
+def directory():
+    """The process-wide directory, loaded on first use"""
+    global _directory
+    with _lock:
+        if _directory is None:
+            _directory = ProviderDirectory(json.loads(PROVIDERS_PATH.read_text(encoding='utf-8')))
+        return _directory
+
@@ -0,0 +1,384 @@
+"""Bulk export and import of a user's data.
+
+An archive covers every personal collection in ``EXPORTED``. It comes in
+three formats:
+
+* JSONL: one ``{"collection": ..., "record": {...}}`` object per line.
+* CSV: a zip holding one ``<collection>.csv`` per collection.
+* Parquet: a directory holding one ``<collection>.parquet`` per collection.
+  This needs the optional ``pyarrow`` package.
+
+Both directions stream. Export reads each collection through
+``storage.stream`` one chunk at a time and writes the chunk before reading
+the next. Import reads archives line by line, row by row or row group by row
+group. Records are validated a batch at a time: pandas coerces whole columns
+to the collection's types and flags bad rows, and one query per batch finds
+ids that are already taken. Valid rows are then written with the same
+functions the app uses, so mood and dose rollups stay current. Memory
+therefore follows the batch size, not the archive size.
+
+Imported rows keep their ids, so importing the same archive twice adds
+nothing the second time. An id that already belongs to another account is
+replaced with one derived from it, so one user's archive can never
+overwrite another user's rows.
+
+Run ``python transfer.py export PATH`` or ``python transfer.py import PATH``
+to move data without going through the browser.
+"""
+import csv
+import io
+import json
+import uuid
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+import counters
+import dose_store
+import mood_store  # registers the moods rollup that rollups.write uses
+import rollups
+import seed
+import storage
+
+EXPORTED = ['moods', 'journal_entries', 'goals', 'medications', 'dose_events', 'appointments', 'symptoms',
+            'chat_messages']
+CHUNK = 1000
+MAX_ERRORS = 100
+
+# Ids taken by another account are rebased into this namespace
+_NAMESPACE = uuid.UUID('8f4b8f1e-4e0a-4d7e-9a51-3c1f0f0b2d6a')
+
+# What makes a record acceptable, beyond having the right column types.
+# 'days' are text columns holding a YYYY-MM-DD day, which the analytics
+# parse; when the day belongs to a datetime column it must be that one's day
+RULES = {
+    'moods': {'required': ('datetime', 'value'), 'ranges': {'value': (1, 5)}, 'days': {'date': 'datetime'}},
+    'journal_entries': {'required': ('content', 'timestamp'), 'ranges': {'mood': (1, 5), 'sentiment': (-1, 1)},
+                        'defaults': {'tags': []}},
+    'goals': {'required': ('text',), 'defaults': {'completed': False, 'category': 'General'}},
+    'medications': {'required': ('name', 'frequency'),
+                    'choices': {'frequency': (*dose_store.SCHEDULES, 'PRN')},
+                    'defaults': {'dosage': 'N/A', 'time': 'As needed', 'purpose': 'N/A'}},
+    'dose_events': {'required': ('medication_id', 'timestamp'), 'defaults': {'taken': True},
+                    'days': {'date': 'timestamp'}},
+    'appointments': {'required': ('title', 'datetime'), 'ranges': {'duration': (0, 24 * 60)},
+                     'choices': {'repeat': ('Weekly', 'Every 2 Weeks')}, 'defaults': {'duration': 60}},
+    'symptoms': {'required': ('name', 'severity', 'date'), 'ranges': {'severity': (1, 10)},
+                 'days': {'date': None}},
+    'chat_messages': {'required': ('role', 'content', 'timestamp'), 'choices': {'role': ('user', 'assistant')}},
+}
+
+_TRUE = {'1', 'true', 't', 'yes', 'y'}
+_FALSE = {'0', 'false', 'f', 'no', 'n'}
+
+
+# Export
+
+def _plain(collection, record):
+    # JSON-ready: datetimes as ISO text, everything else as stored
+    return {col: value.isoformat() if isinstance(value, datetime) else value for col, value in record.items()}
+
+
+def iter_jsonl(collections=EXPORTED, chunk_size=CHUNK):
+    """The current user's archive as JSONL text, one chunk of lines at a time"""
+    for collection in collections:
+        for chunk in storage.stream(collection, chunk_size):
+            yield ''.join(json.dumps({'collection': collection, 'record': _plain(collection, r)},
+                                     ensure_ascii=False) + '\n' for r in chunk)
+
+
+def write_jsonl(out, collections=EXPORTED, chunk_size=CHUNK):
+    """Write the archive to a text file object"""
+    for text in iter_jsonl(collections, chunk_size):
+        out.write(text)
+
+
+def _stored_row(collection, record):
+    # The row as SQLite holds it (ISO text, 0/1, JSON text), without the owner
+    return storage.encode(collection, record)[:len(storage.COLLECTIONS[collection]['columns'])]
+
+
+def write_csv_zip(out, collections=EXPORTED, chunk_size=CHUNK):
+    """Write the archive as a zip of CSVs to a path or binary file object"""
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for collection in collections:
+            with archive.open(f'{collection}.csv', 'w') as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8', newline='') as text:
+                writer = csv.writer(text)
+                writer.writerow(storage.COLLECTIONS[collection]['columns'])
+                for chunk in storage.stream(collection, chunk_size):
+                    writer.writerows(_stored_row(collection, r) for r in chunk)
+
+
+def _arrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError('Parquet archives need pyarrow: pip install pyarrow') from None
+    return pyarrow
+
+
+def write_parquet(directory, collections=EXPORTED, chunk_size=CHUNK):
+    """Write the archive as one Parquet file per collection, a row group per chunk"""
+    pa = _arrow()
+    types = {'int': pa.int64(), 'bool': pa.int64(), 'real': pa.float64()}
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for collection in collections:
+        columns = storage.COLLECTIONS[collection]['columns']
+        schema = pa.schema([(col, types.get(kind, pa.string())) for col, kind in columns.items()])
+        with pa.parquet.ParquetWriter(directory / f'{collection}.parquet', schema) as writer:
+            for chunk in storage.stream(collection, chunk_size):
+                rows = [_stored_row(collection, r) for r in chunk]
+                writer.write_table(pa.Table.from_pylist([dict(zip(columns, row)) for row in rows], schema))
+
+
+# Reading archives: each yields (collection, record, where it came from)
+
+def read_jsonl(lines):
+    for number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            collection, record = item['collection'], item['record']
+        except (ValueError, KeyError, TypeError):
+            yield None, None, f'line {number}'
+            continue
+        yield collection, record, f'line {number}'
+
+
+def read_csv_zip(source):
+    with zipfile.ZipFile(source) as archive:
+        for name in archive.namelist():
+            collection = Path(name).stem
+            with archive.open(name) as raw, io.TextIOWrapper(raw, encoding='utf-8', newline='') as text:
+                for number, row in enumerate(csv.DictReader(text), 2):
+                    # CSV has no null; an empty cell is a missing value
+                    yield collection, {k: (v if v != '' else None) for k, v in row.items()}, f'{name} row {number}'
+
+
+def read_parquet(directory, chunk_size=CHUNK):
+    _arrow()
+    import pyarrow.parquet as pq
+    for path in sorted(Path(directory).glob('*.parquet')):
+        number = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            for record in batch.to_pylist():
+                number += 1
+                yield path.stem, record, f'{path.name} row {number}'
+
+
+# Validation
+
+def _coerce(kind, column):
+    if kind == 'datetime':
+        values = pd.to_datetime(column, errors='coerce', format='ISO8601')
+        return values.dt.tz_localize(None) if values.dt.tz is not None else values
+    if kind in ('int', 'real'):
+        values = pd.to_numeric(column, errors='coerce')
+        if kind == 'int':
+            values = values.where(values % 1 == 0).astype('Int64')
+        return values
+    if kind == 'bool':
+        text = column.astype(str).str.strip().str.lower()
+        return column.where(column.isna(), text.map(lambda v: True if v in _TRUE else False if v in _FALSE else None))
+    if kind == 'json':
+        return column.map(_json_value)
+    return column.where(column.isna(), column.astype(str))
+
+
+def _json_value(value):
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        return None
+
+
+def _derive(collection, frame):
+    # Columns the app fills in itself when it writes a record
+    if collection == 'moods':
+        frame['date'] = frame['date'].fillna(frame['datetime'].dt.strftime('%Y-%m-%d'))
+        # Always from the value: the page shows these as markup, so text
+        # from an archive is never kept
+        values = frame['value'].fillna(0).astype(int).to_numpy()
+        frame['label'] = pd.Series(seed.MOOD_LABELS[values], index=frame.index)
+        frame['emoji'] = pd.Series(seed.MOOD_EMOJIS[values], index=frame.index)
+    elif collection == 'dose_events':
+        frame['date'] = frame['date'].fillna(frame['timestamp'].dt.strftime('%Y-%m-%d'))
+    elif collection == 'goals':
+        frame['created'] = frame['created'].fillna(pd.Timestamp.now())
+
+
+def validate(collection, records):
+    """Coerce a batch to the collection's columns; returns (valid records, [(position, reason)])"""
+    columns = storage.COLLECTIONS[collection]['columns']
+    rules = RULES[collection]
+    frame = pd.DataFrame.from_records(records, columns=list(columns))
+    reasons = pd.Series('', index=frame.index)
+
+    def reject(mask, reason):
+        reasons[mask & (reasons == '')] = reason
+
+    for col, kind in columns.items():
+        raw = frame[col]
+        frame[col] = _coerce(kind, raw)
+        reject(raw.notna() & frame[col].isna(), f'{col} is not a valid {kind}')
+    for col, default in rules.get('defaults', {}).items():
+        missing = frame[col].isna()
+        frame[col] = frame[col].astype(object)
+        frame.loc[missing, col] = pd.Series([default] * int(missing.sum()), index=frame.index[missing], dtype=object)
+    for col in rules['required']:
+        empty = frame[col].isna()
+        if columns[col] == 'text':
+            empty |= frame[col].fillna('').str.strip() == ''
+        reject(empty, f'{col} is missing')
+    for col, (low, high) in rules.get('ranges', {}).items():
+        values = pd.to_numeric(frame[col], errors='coerce').astype(float)
+        reject((values < low) | (values > high), f'{col} is out of range')
+    for col, source in rules.get('days', {}).items():
+        days = pd.to_datetime(frame[col], format='%Y-%m-%d', errors='coerce')
+        reject(frame[col].notna() & days.isna(), f'{col} is not a YYYY-MM-DD date')
+        # Stored zero-padded, like the days the app writes ('2024-5-1' parses too)
+        frame[col] = frame[col].where(days.isna(), days.dt.strftime('%Y-%m-%d'))
+        if source is not None:
+            reject(days.notna() & frame[source].notna() & (days != frame[source].dt.normalize()),
+                   f'{col} is not the day of {source}')
+    for col, allowed in rules.get('choices', {}).items():
+        reject(frame[col].notna() & ~frame[col].isin(allowed), f'{col} must be one of {", ".join(allowed)}')
+
+    ok = reasons == ''
+    frame = frame[ok].copy()
+    _derive(collection, frame)
+    # Back to Python objects (Timestamps are datetimes), with None for gaps
+    frame = frame.astype(object).where(frame.notna(), None)
+    errors = [(position, reason) for position, reason in reasons[~ok].items()]
+    names = list(frame.columns)
+    return [dict(zip(names, row)) for row in frame.itertuples(index=False, name=None)], errors
+
+
+def _owners(collection, ids):
+    if not ids:
+        return {}
+    with storage.reading() as conn:
+        rows = conn.execute(f'SELECT id, user_id FROM {collection} WHERE id IN ({", ".join("?" for _ in ids)})',
+                            list(ids)).fetchall()
+    return dict(rows)
+
+
+def _rebase(user, collection, record_id):
+    return str(uuid.uuid5(_NAMESPACE, f'{user}/{collection}/{record_id}'))
+
+
+def _settle_ids(collection, records):
+    """Give every record an id it may use; returns (new records, already imported count)"""
+    user = storage.current_user()
+    for record in records:
+        record['id'] = str(record['id']) if record['id'] else str(uuid.uuid4())
+    taken = _owners(collection, {r['id'] for r in records})
+    for record in records:
+        if taken.get(record['id'], user) != user:
+            record['id'] = _rebase(user, collection, record['id'])
+    if collection == 'dose_events':
+        # Follow the medication to wherever its own import put it
+        meds = _owners('medications', {r['medication_id'] for r in records})
+        for record in records:
+            if meds.get(record['medication_id'], user) != user:
+                record['medication_id'] = _rebase(user, 'medications', record['medication_id'])
+    mine = {record_id for record_id, owner in _owners(collection, {r['id'] for r in records}).items()
+            if owner == user}
+    fresh = []
+    for record in records:
+        # Also drops a repeated id within the batch
+        if record['id'] not in mine:
+            mine.add(record['id'])
+            fresh.append(record)
+    return fresh, len(records) - len(fresh)
+
+
+def _load(collection, batch, report):
+    records, errors = validate(collection, [record for record, _ in batch])
+    for position, reason in errors:
+        report['errors'] += 1
+        if len(report['problems']) < MAX_ERRORS:
+            report['problems'].append(f'{batch[position][1]}: {reason}')
+    records, duplicates = _settle_ids(collection, records)
+    if records:
+        rollups.write(collection, records)
+    report['imported'][collection] = report['imported'].get(collection, 0) + len(records)
+    report['skipped'] += duplicates
+
+
+def import_records(items, batch_size=CHUNK):
+    """Validate and store (collection, record, where) items, a batch per collection at a time"""
+    report = {'imported': {}, 'skipped': 0, 'errors': 0, 'problems': []}
+    pending = {}
+    for collection, record, where in items:
+        if collection not in RULES or not isinstance(record, dict):
+            report['errors'] += 1
+            if len(report['problems']) < MAX_ERRORS:
+                report['problems'].append(f'{where}: not a record of an importable collection')
+            continue
+        batch = pending.setdefault(collection, [])
+        batch.append((record, where))
+        if len(batch) >= batch_size:
+            _load(collection, pending.pop(collection), report)
+    for collection, batch in pending.items():
+        _load(collection, batch, report)
+    if report['imported']:
+        # Overview counters are reloaded; everything else follows the versions
+        counters.engine().invalidate()
+    return report
+
+
+def read(path_or_file, name=None):
+    """Items from an archive, with the format taken from its name"""
+    name = str(name or path_or_file)
+    if name.endswith('.jsonl'):
+        if isinstance(path_or_file, (str, Path)):
+            return _lines(path_or_file)
+        return read_jsonl(io.TextIOWrapper(path_or_file, encoding='utf-8'))
+    if name.endswith('.zip'):
+        return read_csv_zip(path_or_file)
+    if Path(name).is_dir():
+        return read_parquet(path_or_file)
+    raise ValueError(f'Unrecognized archive {name}: expected .jsonl, .zip or a Parquet directory')
+
+
+def _lines(path):
+    with open(path, encoding='utf-8') as lines:
+        yield from read_jsonl(lines)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export or import one MindCare account')
+    parser.add_argument('action', choices=['export', 'import'])
+    parser.add_argument('path', help='.jsonl file, .zip of CSVs, or a directory of Parquet files')
+    parser.add_argument('--user', default=storage.DEFAULT_USER, help='account id (default: the demo account)')
+    args = parser.parse_args()
+
+    storage.use(args.user)
+    if args.action == 'export':
+        if args.path.endswith('.jsonl'):
+            with open(args.path, 'w', encoding='utf-8') as out:
+                write_jsonl(out)
+        elif args.path.endswith('.zip'):
+            write_csv_zip(args.path)
+        else:
+            write_parquet(args.path)
+        print(f'Exported {args.user} to {args.path}')
+    else:
+        result = import_records(read(args.path))
+        print(f"Imported {sum(result['imported'].values())} records {result['imported']}, "
+              f"skipped {result['skipped']} already present, rejected {result['errors']}")
+        for problem in result['problems']:
+            print(f'  {problem}')
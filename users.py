@@ -0,0 +1,137 @@
+"""User accounts and the identity a session acts as.
+
+Accounts live in the shared ``users`` table. A browser session only keeps its
+user id in ``st.session_state``, and only ``register`` and a ``sign_in`` with
+the right password put one there; the profile is read from storage when a
+page needs it. A session nobody has signed in to gets its own guest id
+(``new_guest_id``), so no two anonymous visitors ever share data. A guest has
+no stored account, just the profile ``resolve`` builds for it.
+
+Passwords are stored as a salted scrypt hash (``PASSWORD_HASH``), never in
+clear, and compared in constant time. An account without a hash, such as
+one created before passwords existed, can't be signed in to.
+"""
+import hashlib
+import hmac
+import os
+import re
+import threading
+import uuid
+from datetime import datetime
+
+import storage
+
+GUEST_PREFIX = 'guest-'
+GUEST_PROFILE = {
+    'email': None,
+    'name': 'Guest',
+    'age': None,
+    'diagnosis': None,
+    'therapist': None,
+    'emergency_contact': None,
+    'therapy_sessions': 0,
+    'days_sober': 0,
+}
+
+MIN_PASSWORD_LENGTH = 8
+# scrypt cost parameters; about 75 ms per hash
+PASSWORD_HASH = {'n': 2 ** 14, 'r': 8, 'p': 1}
+
+_lock = threading.Lock()
+_EMAIL = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+def valid_email(email):
+    return _EMAIL.fullmatch(normalize_email(email)) is not None
+
+
+def first_name(user):
+    """The first word of the user's name, for greetings"""
+    words = (user.get('name') or '').split()
+    return words[0] if words else user['email'].split('@')[0] or 'friend'
+
+
+def get(user_id):
+    return storage.get('users', user_id)
+
+
+def find_by_email(email):
+    found = storage.fetch('users', 'email = ?', (normalize_email(email),), limit=1)
+    return found[0] if found else None
+
+
+def new_guest_id():
+    """A fresh id for a session nobody has signed in to"""
+    return f'{GUEST_PREFIX}{uuid.uuid4()}'
+
+
+def is_guest(user_id):
+    return user_id.startswith(GUEST_PREFIX)
+
+
+def guest(user_id):
+    """The profile of guest ``user_id``; it isn't stored"""
+    return {**GUEST_PROFILE, 'id': user_id, 'joined': datetime.now()}
+
+
+def hash_password(password, salt=None, n=PASSWORD_HASH['n'], r=PASSWORD_HASH['r'], p=PASSWORD_HASH['p']):
+    """``password`` as a self-describing ``scrypt$n$r$p$salt$hash`` string"""
+    salt = salt or os.urandom(16)
+    digest = hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p)
+    return f'scrypt${n}${r}${p}${salt.hex()}${digest.hex()}'
+
+
+def check_password(stored, password):
+    """Whether ``password`` matches the ``stored`` hash"""
+    try:
+        scheme, n, r, p, salt, _ = stored.split('$')
+        if scheme != 'scrypt':
+            return False
+        expected = hash_password(password, bytes.fromhex(salt), int(n), int(r), int(p))
+    except (AttributeError, ValueError):
+        return False
+    return hmac.compare_digest(expected, stored)
+
+
+def register(email, name, password):
+    """Create an account, raising ValueError if the details aren't acceptable"""
+    if not valid_email(email):
+        raise ValueError("Enter a valid email address.")
+    if len(password) < MIN_PASSWORD_LENGTH:
+        raise ValueError(f"Use a password of at least {MIN_PASSWORD_LENGTH} characters.")
+    email = normalize_email(email)
+    password_hash = hash_password(password)
+    with _lock:
+        if find_by_email(email) is not None:
+            raise ValueError("An account with this email already exists.")
+        return storage.insert('users', {
+            'id': str(uuid.uuid4()),
+            'email': email,
+            'name': name.strip() or email.split('@')[0],
+            'joined': datetime.now(),
+            'therapy_sessions': 0,
+            'days_sober': 0,
+            'password_hash': password_hash,
+        })
+
+
+def sign_in(email, password):
+    """The account for ``email`` if ``password`` is right, otherwise None"""
+    user = find_by_email(email) if valid_email(email) else None
+    stored = user.get('password_hash') if user else None
+    if not stored:
+        # Hash anyway, so an unknown email takes as long as a wrong password
+        hash_password(password)
+        return None
+    return user if check_password(stored, password) else None
+
+
+def resolve(user_id):
+    """The account a session acts as; an id without one gets a guest profile"""
+    if user_id and is_guest(user_id):
+        return guest(user_id)
+    return (get(user_id) if user_id else None) or guest(new_guest_id())
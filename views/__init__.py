@@ -0,0 +1,45 @@
+"""Page registry.
+
+Each page of the app is a module in this package with a ``render(user)``
+function, and ``PAGES`` maps the navigation label to that module, in
+sidebar order. A page module is imported the first time its page is shown
+and then stays in ``sys.modules``. A rerun therefore executes only
+``app.py``'s shell and the active page's ``render``, and pages nobody opens
+are never loaded.
+
+The page code lives outside app.py so its definitions survive a rerun: a
+function in a module, such as a ``cache.versioned`` figure builder, is
+defined once per process and shared by every rerun and session instead of
+being redefined each time the script runs.
+
+Widgets that only affect their own section are wrapped in
+``common.isolated``, so on a Streamlit with fragments a change to them
+reruns that section alone rather than the whole page.
+"""
+import startup
+
+PAGES = {
+    "📊 Dashboard": 'dashboard',
+    "🏠 Home": 'home',
+    "😊 Mood Tracking": 'mood_tracking',
+    "🌟 Coping Strategies": 'coping',
+    "🎯 Goals": 'goals',
+    "👥 Community": 'community',
+    "📞 Professional Support": 'professional_support',
+    "💬 Chat Support": 'chat_support',
+    "💊 Medications": 'medications',
+    "📔 Journal": 'journal',
+    "📚 Education": 'education',
+    "👤 Profile": 'profile',
+}
+
+
+def load(page):
+    """The module for ``page``, imported on first use"""
+    return startup.timed_import(f'{__name__}.{PAGES[page]}')
+
+
+def render(page, user):
+    """Show ``page`` for ``user``"""
+    with startup.timed(f'render {PAGES[page]}'):
+        load(page).render(user)
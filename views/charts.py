@@ -0,0 +1,89 @@
+"""The mood trend chart, shared by the Dashboard and Mood Tracking pages.
+
+Kept apart from ``common`` so the pages that only log moods or goals never
+touch plotly or pandas.
+"""
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+import cache
+import metrics
+import mood_analytics
+import mood_store
+
+
+@cache.versioned('moods')
+def build_mood_trend(days, today):
+    # Daily averages, rolling means and anomaly flags come from the rollups
+    # via mood_analytics. The figure is shared between sessions until the
+    # next add_mood (or the next day, since `today` is part of the cache key).
+    # Ranges longer than the point budget are downsampled and drawn with WebGL
+    frame = mood_analytics.analyze()
+    if frame is None:
+        return None, None
+    latest = frame.iloc[-1]
+    if days is not None:
+        frame = frame.loc[pd.Timestamp(today) - pd.Timedelta(days=days):]
+    if frame['mood'].isna().all():
+        return None, None
+
+    large = frame['mood'].count() > mood_analytics.POINT_BUDGET
+    Scatter = go.Scattergl if large else go.Scatter
+    mood = mood_analytics.downsample(frame['mood'])
+
+    fig = go.Figure()
+    
+    fig.add_trace(Scatter(
+        x=mood.index,
+        y=mood,
+        mode='lines' if large else 'lines+markers',
+        name='Daily Mood',
+        line=dict(color='#9333ea', width=2 if large else 3),
+        marker=dict(size=10, color='#ec4899'),
+        fill='tozeroy',
+        fillcolor='rgba(147, 51, 234, 0.1)'
+    ))
+    for column, name, color in (('mean_7', '7-Day Average', '#f59e0b'), ('mean_30', '30-Day Average', '#10b981')):
+        line = mood_analytics.downsample(frame[column])
+        fig.add_trace(Scatter(x=line.index, y=line, mode='lines', name=name,
+                              line=dict(color=color, width=2, dash='dash')))
+    anomalies = mood_analytics.downsample(frame.loc[frame['anomaly'], 'mood'])
+    if len(anomalies):
+        fig.add_trace(Scatter(x=anomalies.index, y=anomalies, mode='markers', name='Unusual Day',
+                              marker=dict(size=12, color='#ef4444', symbol='x')))
+    
+    fig.update_layout(
+        title='Your Mood Trend Over Time',
+        xaxis_title='Date',
+        yaxis_title='Mood Score',
+        yaxis=dict(range=[0, 6], tickvals=[1, 2, 3, 4, 5]),
+        hovermode='x unified',
+        template='plotly_white',
+        height=400
+    )
+    stats = mood_store.summary()
+    stats['mean_7'], stats['mean_30'] = latest['mean_7'], latest['mean_30']
+    return fig, stats
+
+
+@metrics.timed
+def plot_mood_trend(days=None):
+    fig, stats = build_mood_trend(days, datetime.now().strftime('%Y-%m-%d'))
+    if fig is None:
+        st.info("📊 No mood data yet. Start tracking to see your trends!")
+        return
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Statistics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Average Mood", f"{stats['average']:.1f}/5")
+    with col2:
+        st.metric("Total Entries", stats['count'])
+    with col3:
+        if stats['count'] > 1:
+            st.metric("7-Day Average", f"{stats['mean_7']:.1f}/5", f"{stats['mean_7'] - stats['mean_30']:+.1f} vs 30 days")
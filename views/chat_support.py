@@ -0,0 +1,143 @@
+"""Chat Support: the supportive chat and its paged history."""
+import streamlit as st
+
+import catalog
+import chat_log
+import chat_matcher
+import fragments
+import metrics
+
+
+@metrics.timed
+def add_chat_message(role, content):
+    message = chat_log.append(role, content)
+    st.session_state.chat_recent.append(message)
+    # A new message collapses any paged-in history back to the recent window
+    st.session_state.chat_earlier = []
+
+
+@metrics.timed
+def generate_chat_response(user_message):
+    """Generate a supportive AI response based on user input"""
+    content = catalog.catalog()
+    category = chat_matcher.matcher.first(user_message)
+    if category:
+        return content['chat_responses'][category]
+
+    # General supportive responses
+    supportive_responses = content['supportive_responses']
+    return supportive_responses[len(user_message) % len(supportive_responses)]
+
+
+def render(user):
+    st.title("💬 Chat Support")
+    st.markdown("Connect with our AI mental health assistant for immediate support, coping strategies, and guidance.")
+
+    # Only the latest messages live in the session; earlier ones are paged
+    # in from the persisted log on request
+    if 'chat_recent' not in st.session_state:
+        st.session_state.chat_recent = chat_log.recent()
+        st.session_state.chat_earlier = []
+
+    # Chat interface
+    st.markdown("### 💬 Your Conversation")
+
+    transcript = st.session_state.chat_earlier + list(st.session_state.chat_recent)
+    if transcript and chat_log.has_earlier(transcript[0]):
+        if st.button("⬆️ Load earlier messages", use_container_width=True):
+            older, _ = chat_log.earlier(transcript[0])
+            st.session_state.chat_earlier = older + st.session_state.chat_earlier
+            st.rerun()
+
+    # Display chat messages
+    chat_container = st.container()
+    with chat_container:
+        for message in transcript:
+            st.markdown(fragments.render('chat', message), unsafe_allow_html=True)
+
+    # Message input
+    st.markdown("---")
+    with st.form("chat_form", clear_on_submit=True):
+        user_message = st.text_area(
+            "Type your message here...",
+            placeholder="Share what's on your mind...",
+            height=100,
+            key="chat_input"
+        )
+
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            submitted = st.form_submit_button("📤 Send Message", use_container_width=True)
+        with col2:
+            quick_help = st.form_submit_button("🚨 Crisis Help", use_container_width=True)
+        with col3:
+            clear_chat = st.form_submit_button("🗑️ Clear Chat", use_container_width=True)
+
+        if submitted and user_message.strip():
+            # Add user message
+            add_chat_message('user', user_message.strip())
+
+            # Generate AI response based on user input
+            response = generate_chat_response(user_message.strip())
+            add_chat_message('assistant', response)
+            st.rerun()
+
+        if quick_help:
+            crisis_message = "I'm here to help. If you're in crisis, please call 988 (Suicide & Crisis Lifeline) or text HOME to 741741 (Crisis Text Line). You can also go to your nearest emergency room. You're not alone, and help is available 24/7."
+            add_chat_message('assistant', crisis_message)
+            st.rerun()
+
+        if clear_chat:
+            chat_log.clear()
+            st.session_state.chat_recent = chat_log.recent()
+            st.session_state.chat_earlier = []
+            st.rerun()
+
+    # Quick action buttons
+    st.markdown("---")
+    st.markdown("### 🛠️ Quick Support Options")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        if st.button("🌟 Coping Strategies", use_container_width=True):
+            coping_response = "Here are some quick coping strategies:\n\n1. **Deep Breathing**: Inhale for 4 counts, hold for 4, exhale for 4\n2. **Grounding**: Name 5 things you see, 4 you can touch, 3 you hear, 2 you smell, 1 you taste\n3. **Progressive Relaxation**: Tense and release each muscle group\n4. **Positive Affirmation**: 'I am safe. I am strong. This feeling will pass.'\n\nWhich one would you like to try?"
+            add_chat_message('assistant', coping_response)
+            st.rerun()
+
+    with col2:
+        if st.button("😊 Mood Check", use_container_width=True):
+            mood_response = "Let's check in on your mood. On a scale of 1-10 (1 being very low, 10 being great), how are you feeling right now? What emotions are you experiencing? Remember, all feelings are valid and it's okay to feel this way."
+            add_chat_message('assistant', mood_response)
+            st.rerun()
+
+    with col3:
+        if st.button("🎯 Goal Support", use_container_width=True):
+            goal_response = "Goals are an important part of mental wellness! What goal are you working on right now? Or would you like help breaking down a larger goal into smaller, manageable steps? Remember, progress is more important than perfection."
+            add_chat_message('assistant', goal_response)
+            st.rerun()
+
+    with col4:
+        if st.button("📞 Professional Help", use_container_width=True):
+            help_response = "If you're looking for professional support, here are some options:\n\n• **988 Suicide & Crisis Lifeline**: Call or text 988\n• **Crisis Text Line**: Text HOME to 741741\n• **Find a Therapist**: Use our Professional Support section\n• **Emergency Services**: Call 911 for immediate danger\n\nWould you like me to help you find specific resources?"
+            add_chat_message('assistant', help_response)
+            st.rerun()
+
+    # Chat guidelines
+    st.markdown("---")
+    with st.expander("💡 Chat Guidelines", expanded=False):
+        st.markdown("""
+        **What I can help with:**
+        - Providing coping strategies and relaxation techniques
+        - Offering emotional support and validation
+        - Helping you identify and express your feelings
+        - Suggesting self-care activities
+        - Guiding you toward professional resources
+
+        **Important notes:**
+        - I'm an AI assistant, not a licensed therapist
+        - I cannot provide medical advice or diagnosis
+        - For crisis situations, please contact emergency services
+        - All conversations are private and confidential
+        - If you need professional help, please consult a licensed mental health provider
+        """)
@@ -0,0 +1,82 @@
+"""Helpers shared by more than one page, and the section isolation wrapper."""
+import functools
+import uuid
+from datetime import date, datetime
+
+import streamlit as st
+
+import cache
+import counters
+import dose_store
+import metrics
+import mood_store
+import storage
+
+
+def isolated(func):
+    """Let a page section rerun on its own when only its own widgets change
+
+    Uses ``st.fragment`` (or the older ``st.experimental_fragment``) when this
+    Streamlit has it; otherwise the section is an ordinary call that reruns
+    with its page. A fragment rerun skips app.py, so the user scope is set
+    again from the ``user`` the section was called with.
+    """
+    fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if fragment is None:
+        return func
+
+    @functools.wraps(func)
+    def scoped(user, *args, **kwargs):
+        storage.use(user['id'])
+        return func(user, *args, **kwargs)
+    return fragment(scoped)
+
+
+@metrics.timed
+def add_mood(mood_value, mood_label, mood_emoji):
+    mood_store.add({
+        'id': str(uuid.uuid4()),
+        'date': datetime.now().strftime('%Y-%m-%d'),
+        'datetime': datetime.now(),
+        'value': mood_value,
+        'label': mood_label,
+        'emoji': mood_emoji
+    })
+    counters.engine().mood_added(mood_value)
+    st.success(f"Mood logged: {mood_emoji} {mood_label}")
+    st.rerun()
+
+
+@metrics.timed
+def toggle_goal(user_id, goal_id):
+    # Used as a checkbox's on_change callback; the rerun that follows a
+    # callback shows the change, so there is no st.rerun() here. Callbacks
+    # run before app.py sets the user scope, so it is set here
+    storage.use(user_id)
+    completed = storage.toggle('goals', goal_id, 'completed')
+    if completed is not None:
+        counters.engine().goal_toggled(completed)
+
+
+def show_reminders(due):
+    for reminder in due:
+        icon = '💊' if reminder['kind'] == 'medication' else '📅'
+        when = reminder['at'].strftime('%I:%M %p')
+        if reminder['status'] == 'overdue':
+            st.error(f"{icon} **Overdue since {when}**: {reminder['title']} ({reminder['detail']})")
+        else:
+            st.warning(f"{icon} **Due {when}**: {reminder['title']} ({reminder['detail']})")
+
+
+@cache.versioned('medications', 'dose_events')
+def adherence_history(days, today):
+    # Read from the daily dose rollups and shared until the next dose or
+    # medication change (or the next day, since `today` is part of the key)
+    return dose_store.history(storage.fetch('medications'), days, date.fromisoformat(today))
+
+
+def medication_adherence(days=30):
+    """Average adherence over the last ``days`` days as a whole percentage, or None"""
+    history = adherence_history(days, datetime.now().date().isoformat())
+    rates = [d['adherence'] for d in history if d['adherence'] is not None]
+    return round(100 * sum(rates) / len(rates)) if rates else None
@@ -0,0 +1,99 @@
+"""Community: sharing posts and the paged peer support feed."""
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+import feed
+import fragments
+import metrics
+import storage
+import users
+
+FEED_SORTS = ["🕒 Newest", "🔥 Top"]
+ANONYMOUS = "Anonymous"
+
+
+def reset_feed(sort):
+    # Top scores are frozen at the time the feed was opened so pages don't shift
+    st.session_state.feed = {'sort': sort, 'now': datetime.now(), 'cursors': [None]}
+
+
+@metrics.timed
+def add_post(content, author):
+    storage.insert('community_posts', {
+        'id': str(uuid.uuid4()),
+        'author': author,
+        'content': content,
+        'likes': 0,
+        'timestamp': datetime.now(),
+        'tags': []
+    })
+    # Back to the first page, ranked as of now
+    st.session_state.pop('feed', None)
+    st.success("📮 Post shared with the community!")
+    st.rerun()
+
+
+def render(user):
+    st.title("👥 Peer Support Community")
+    st.markdown("Share your experiences, offer support, and connect with others on similar journeys.")
+    
+    with st.expander("📝 Share with the community", expanded=True):
+        with st.form("post_form", clear_on_submit=True):
+            post_content = st.text_area(
+                "What's on your mind?",
+                placeholder="Share your experience, offer support, or ask for advice...",
+                height=100
+            )
+            # Posts go out under a pseudonym unless the user opts in to their name
+            pseudonym = st.text_input("Post as", placeholder=ANONYMOUS, max_chars=40, key="post_pseudonym")
+            use_name = st.checkbox("Post with my first name instead", key="post_use_name")
+            submitted = st.form_submit_button("📮 Post", use_container_width=True)
+            
+            if submitted and post_content:
+                add_post(post_content, users.first_name(user) if use_name else pseudonym.strip() or ANONYMOUS)
+    
+    st.markdown("---")
+    st.markdown("### Community Posts")
+
+    # Only one page of the feed is read and rendered; the cursor stack allows
+    # stepping back to earlier pages
+    sort = st.selectbox("Sort posts by", FEED_SORTS, key="feed_sort")
+    if 'feed' not in st.session_state or st.session_state.feed['sort'] != sort:
+        reset_feed(sort)
+    feed_state = st.session_state.feed
+    cursor = feed_state['cursors'][-1]
+    if sort == "🔥 Top":
+        posts, next_cursor = feed.top(feed_state['now'], cursor)
+    else:
+        posts, next_cursor = feed.newest(cursor)
+    liked = feed.liked_by(user['id'], [post['id'] for post in posts])
+
+    for post in posts:
+        with st.container():
+            st.markdown(fragments.render('post', post), unsafe_allow_html=True)
+
+            col_like, col_reply = st.columns([1, 9])
+            with col_like:
+                heart = "❤️" if post['id'] in liked else "🤍"
+                if st.button(f"{heart} {post['likes']}", key=f"like_{post['id']}"):
+                    feed.toggle_like(post['id'], user['id'])
+                    st.rerun()
+            with col_reply:
+                st.button(f"💬 Reply", key=f"reply_{post['id']}")
+        
+        st.markdown("---")
+
+    if not posts:
+        st.info("No posts yet. Be the first to share!" if cursor is None else "No more posts.")
+
+    col_prev, col_next = st.columns(2)
+    with col_prev:
+        if st.button("⬅️ Previous", disabled=len(feed_state['cursors']) == 1, use_container_width=True):
+            feed_state['cursors'].pop()
+            st.rerun()
+    with col_next:
+        if st.button("Next ➡️", disabled=next_cursor is None, use_container_width=True):
+            feed_state['cursors'].append(next_cursor)
+            st.rerun()
@@ -0,0 +1,21 @@
+"""Coping Strategies from the content catalog."""
+import streamlit as st
+
+import catalog
+
+
+def render(user):
+    st.title("🌟 Coping Strategies")
+    st.markdown("Evidence-based techniques to help manage depression and improve well-being.")
+    
+    col1, col2 = st.columns(2)
+
+    for idx, strategy in enumerate(catalog.catalog()['coping_strategies']):
+        with col1 if idx % 2 == 0 else col2:
+            with st.container():
+                st.markdown(strategy['card_html'], unsafe_allow_html=True)
+                
+                if st.button(f"Start {strategy['title']}", key=strategy['key'], use_container_width=True):
+                    st.success(f"✨ Great! Take a moment to practice {strategy['title']}")
+                
+                st.markdown("<br>", unsafe_allow_html=True)
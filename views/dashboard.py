@@ -0,0 +1,122 @@
+"""Dashboard: overview metrics, mood trend, appointments and symptom insights."""
+from datetime import datetime
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+import appointments
+import cache
+import counters
+import mood_analytics
+import symptom_store
+from views.charts import plot_mood_trend
+from views.common import medication_adherence
+
+
+@cache.versioned('symptoms', 'moods')
+def build_symptom_trends(window):
+    rolling = symptom_store.rolling(window)
+    if rolling is None:
+        return None
+    rolling = rolling.loc[rolling.index[-1] - pd.Timedelta(days=89):]
+    fig = go.Figure()
+    for name in rolling.columns:
+        fig.add_trace(go.Scatter(x=rolling.index, y=rolling[name], mode='lines', name=name,
+                                 connectgaps=True))
+    mood = mood_analytics.daily()
+    if mood is not None:
+        # Mood is 1-5 with 5 best; drawn on its own axis so both read upwards as "more"
+        mood = mood.rolling(window, min_periods=1).mean().loc[rolling.index[0]:]
+        fig.add_trace(go.Scatter(x=mood.index, y=mood, mode='lines', name='Mood', yaxis='y2',
+                                 line=dict(color='#9333ea', width=3, dash='dot'), connectgaps=True))
+    fig.update_layout(
+        xaxis_title='Date',
+        yaxis=dict(title=f'Severity ({window}-day avg)', range=[0, 10.5]),
+        yaxis2=dict(title='Mood', range=[0, 5.5], overlaying='y', side='right', showgrid=False),
+        hovermode='x unified',
+        template='plotly_white',
+        height=400,
+        legend=dict(orientation='h', y=-0.2)
+    )
+    return fig
+
+
+def render(user):
+    st.title("📊 Mental Health Dashboard")
+
+    # Overview metrics
+    st.markdown("### 📈 Your Progress Overview")
+
+    overview = counters.engine().snapshot()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        avg_mood = overview['mood_avg_7'] or 0
+        delta = overview['mood_avg_delta']
+        st.metric("7-Day Avg Mood", f"{avg_mood:.1f}/5", f"{delta:+.1f}" if delta is not None else None)
+    with col2:
+        completed_goals = overview['goals_completed']
+        st.metric("Goals Completed", f"{completed_goals}/{overview['goals_total']}", f"{completed_goals} total")
+    with col3:
+        adherence = medication_adherence(30)
+        this_week = medication_adherence(7)
+        st.metric("Med Adherence", f"{adherence}%" if adherence is not None else "—",
+                  f"{this_week - adherence:+d}% this week" if adherence is not None and this_week is not None else None)
+    with col4:
+        streak = overview['journal_streak']
+        st.metric("Journal Streak", f"{streak} day{'s' if streak != 1 else ''}", f"{overview['journal_total']} entries")
+
+    # Mood trend chart
+    st.markdown("### 📊 Mood Trends (Last 30 Days)")
+    plot_mood_trend(days=30)
+
+    # Upcoming appointments
+    st.markdown("### 📅 Upcoming Appointments")
+    upcoming = appointments.index().upcoming(3)
+
+    if upcoming:
+        for appt in upcoming:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"**{appt['title']}**")
+                repeats = f" • 🔁 {appt['repeat']}" if appt['repeat'] else ""
+                st.caption(f"{appt['datetime'].strftime('%B %d, %Y at %I:%M %p')} • {appt['location']} • {appt['duration']} min{repeats}")
+            with col2:
+                days_until = (appt['datetime'] - datetime.now()).days
+                if days_until == 0:
+                    st.success("Today")
+                elif days_until == 1:
+                    st.info("Tomorrow")
+                else:
+                    st.info(f"In {days_until} days")
+    else:
+        st.info("No upcoming appointments scheduled.")
+    today = datetime.now()
+    this_month = appointments.index().month(today.year, today.month)
+    st.caption(f"{len(this_month)} appointment{'s' if len(this_month) != 1 else ''} in {today.strftime('%B')}")
+
+    # Symptom tracking
+    st.markdown("### 📋 Current Symptoms")
+    for symptom in symptom_store.latest():
+        col1, col2, col3 = st.columns([2, 1, 3])
+        with col1:
+            st.write(f"**{symptom['name']}**")
+        with col2:
+            severity = symptom['severity']
+            color = "🟢" if severity <= 3 else "🟡" if severity <= 6 else "🔴"
+            st.write(f"{color} {severity}/10")
+        with col3:
+            st.caption(symptom['notes'])
+
+    st.markdown("### 🔬 Symptom Insights")
+    fig = build_symptom_trends(7)
+    if fig is None:
+        st.info("Save a symptom check-in on the Home page to start building your history.")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
+        for name, (lag, r) in symptom_store.strongest_links().items():
+            if abs(r) < 0.3:
+                continue
+            when = "the same day" if lag == 0 else "the next day" if lag == 1 else f"{lag} days later"
+            direction = "lower" if r < 0 else "higher"
+            st.caption(f"**{name}**: worse days tend to come with {direction} mood {when} (r = {r:+.2f})")
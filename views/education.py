@@ -0,0 +1,18 @@
+"""Education resources from the content catalog."""
+import streamlit as st
+
+import catalog
+
+
+def render(user):
+    st.title("📚 Educational Resources")
+    st.markdown("Learn about depression, its causes, symptoms, and evidence-based treatments.")
+    
+    col1, col2 = st.columns(2)
+    
+    for idx, resource in enumerate(catalog.catalog()['education_resources']):
+        with col1 if idx % 2 == 0 else col2:
+            st.markdown(resource['card_html'], unsafe_allow_html=True)
+            
+            if st.button(resource['action'], key=resource['key'], use_container_width=True):
+                st.success(f"Opening: {resource['title']}")
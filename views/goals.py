@@ -0,0 +1,128 @@
+"""Goals: adding, completing and removing personal goals."""
+import uuid
+from datetime import datetime
+
+import streamlit as st
+
+import counters
+import metrics
+import storage
+from views.common import toggle_goal
+
+
+@metrics.timed
+def add_goal(goal_text):
+    storage.insert('goals', {
+        'id': str(uuid.uuid4()),
+        'text': goal_text,
+        'completed': False,
+        'created': datetime.now()
+    })
+    counters.engine().goal_added()
+    st.success("✅ Goal added!")
+    st.rerun()
+
+
+@metrics.timed
+def delete_goal(goal_id):
+    goal = storage.get('goals', goal_id)
+    if goal:
+        storage.delete('goals', goal_id)
+        counters.engine().goal_deleted(goal['completed'])
+    st.rerun()
+
+
+def render(user):
+    st.title("🎯 Wellness Goals")
+    st.markdown("Set and track your personal wellness goals.")
+
+    # Simple goal creation
+    st.markdown("### ➕ Add New Goal")
+    with st.form("simple_goal_form", clear_on_submit=True):
+        goal_text = st.text_input(
+            "What would you like to achieve?",
+            placeholder="e.g., Practice deep breathing for 5 minutes daily",
+            help="Be specific about what you want to accomplish"
+        )
+        submitted = st.form_submit_button("🚀 Add Goal", use_container_width=True, type="primary")
+
+        if submitted and goal_text.strip():
+            add_goal(goal_text.strip())
+
+    st.markdown("---")
+
+    # Display goals in simple list
+    st.markdown("### 📋 Your Goals")
+
+    goals = storage.fetch('goals')
+    if goals:
+        # Separate active and completed goals
+        active_goals = [g for g in goals if not g['completed']]
+        completed_goals = [g for g in goals if g['completed']]
+
+        # Show active goals first
+        if active_goals:
+            st.markdown("#### 🎯 Active Goals")
+            for goal in active_goals:
+                with st.container():
+                    col1, col2, col3 = st.columns([0.1, 0.7, 0.2])
+
+                    with col1:
+                        st.checkbox("", key=f"complete_{goal['id']}", value=False, label_visibility="hidden",
+                                    on_change=toggle_goal, args=(user['id'], goal['id']))
+
+                    with col2:
+                        st.write(f"**{goal['text']}**")
+                        st.caption(f"Added {goal['created'].strftime('%B %d, %Y')}")
+
+                    with col3:
+                        if st.button("🗑️", key=f"delete_{goal['id']}", help="Delete this goal"):
+                            delete_goal(goal['id'])
+
+                st.markdown("---")
+
+        # Show completed goals
+        if completed_goals:
+            st.markdown("#### ✅ Completed Goals")
+            for goal in completed_goals:
+                with st.container():
+                    col1, col2, col3 = st.columns([0.1, 0.7, 0.2])
+
+                    with col1:
+                        st.checkbox("", key=f"uncomplete_{goal['id']}", value=True, label_visibility="hidden",
+                                    on_change=toggle_goal, args=(user['id'], goal['id']))
+
+                    with col2:
+                        st.write(f"~~{goal['text']}~~")
+                        st.caption(f"Completed • Added {goal['created'].strftime('%B %d, %Y')}")
+
+                    with col3:
+                        if st.button("🗑️", key=f"delete_completed_{goal['id']}", help="Delete this goal"):
+                            delete_goal(goal['id'])
+
+                st.markdown("---")
+
+        # Simple progress summary
+        total_goals = len(goals)
+        completed_count = len(completed_goals)
+        active_count = len(active_goals)
+
+        st.markdown("### 📊 Progress Summary")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Total Goals", total_goals)
+
+        with col2:
+            st.metric("Completed", completed_count)
+
+        with col3:
+            st.metric("Active", active_count)
+
+    else:
+        st.info("🎯 No goals yet! Add your first goal above to start your wellness journey.")
+
+    # Simple motivational message
+    st.markdown("---")
+    st.markdown("### 💡 Remember")
+    st.info("Small steps lead to big changes. Celebrate your progress and be kind to yourself along the way.")
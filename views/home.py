@@ -0,0 +1,225 @@
+"""Home: greeting, quick stats, mood and symptom check-ins and today's focus."""
+import html
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+import appointments
+import counters
+import metrics
+import reminders
+import storage
+import symptom_store
+import users
+from views.common import add_mood, isolated, show_reminders, toggle_goal
+
+
+@metrics.timed
+def save_check_in(severities):
+    symptom_store.record(severities, notes='Home check-in')
+    st.success("📊 Check-in saved!")
+    st.rerun()
+
+
+@isolated
+def symptom_check(user):
+    # Moving a slider only reruns this section, not the whole Home page
+    st.markdown("### 📊 Symptom Check")
+    severities = {}
+    for symptom in symptom_store.CHECK_IN:
+        severity = st.slider(f"{symptom}", 1, 10, 5, key=f"symptom_{symptom.lower().replace(' ', '_')}")
+        severities[symptom] = severity
+        if severity <= 3:
+            st.success(f"✅ {symptom}: Good")
+        elif severity <= 7:
+            st.warning(f"⚠️ {symptom}: Moderate")
+        else:
+            st.error(f"🚨 {symptom}: High - Consider reaching out")
+    if st.button("💾 Save Check-in", key="save_check_in", use_container_width=True):
+        save_check_in(severities)
+
+
+def render(user):
+    # Personalized welcome with dynamic content
+    user_name = html.escape(users.first_name(user))
+    current_hour = datetime.now().hour
+
+    # Dynamic greeting based on time of day
+    if current_hour < 12:
+        greeting = "Good morning"
+        emoji = "🌅"
+    elif current_hour < 17:
+        greeting = "Good afternoon"
+        emoji = "☀️"
+    else:
+        greeting = "Good evening"
+        emoji = "🌙"
+
+    # Get recent activity
+    overview = counters.engine().snapshot()
+    avg_recent_mood = overview['mood_avg_7'] or 3
+
+    # Personalized message based on recent mood
+    if avg_recent_mood >= 4:
+        encouragement = "You're doing great! Keep up the positive momentum."
+    elif avg_recent_mood >= 2.5:
+        encouragement = "Remember that every day is a new opportunity for growth."
+    else:
+        encouragement = "Be gentle with yourself. Small steps lead to big changes."
+
+    st.markdown(f"""
+        <div style='background: linear-gradient(135deg, #9333ea 0%, #ec4899 100%);
+                    padding: 40px; border-radius: 20px; text-align: center; margin-bottom: 30px;'>
+            <h1 style='color: white; margin: 0; font-size: 2.5em;'>{emoji} {greeting}, {user_name}!</h1>
+            <p style='color: rgba(255,255,255,0.9); margin-top: 10px; font-size: 1.1em;'>
+                {encouragement}
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    # Quick Stats Row
+    # The coming week's sessions, bisected out of the sorted appointment index
+    upcoming = appointments.index().between(datetime.now(), datetime.now() + timedelta(days=8))
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Meds Today", f"{overview['meds_scheduled_taken']}/{overview['meds_scheduled']}")
+    with col2:
+        st.metric("Goals Done", f"{overview['goals_completed']}/{overview['goals_total']}")
+    with col3:
+        streak = overview['journal_streak']
+        st.metric("Journal Streak", f"{streak} day{'s' if streak != 1 else ''}")
+    with col4:
+        st.metric("Upcoming Appts", len(upcoming))
+
+    st.markdown("---")
+
+    # Main content columns
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        # Mood Check-in
+        st.markdown("### 💜 Daily Mood Check-in")
+
+        # Show last 3 days mood trend
+        recent_moods = storage.fetch('moods', descending=True, limit=3)
+        if recent_moods:
+            st.markdown("**Recent Mood Trend:**")
+            for mood in recent_moods:
+                days_ago = (datetime.now() - mood['datetime']).days
+                day_label = "Today" if days_ago == 0 else f"{days_ago} day{'s' if days_ago > 1 else ''} ago"
+                st.caption(f"{day_label}: {mood['emoji']} {mood['label']}")
+
+        st.markdown("**How are you feeling right now?**")
+        mood_options = [
+            (5, "Great", "😊"),
+            (4, "Good", "🙂"),
+            (3, "Okay", "😐"),
+            (2, "Low", "😔"),
+            (1, "Very Low", "😢")
+        ]
+
+        cols = st.columns(5)
+        for idx, (value, label, emoji) in enumerate(mood_options):
+            with cols[idx]:
+                if st.button(f"{emoji}\n{label}", key=f"mood_home_{value}", use_container_width=True):
+                    add_mood(value, label, emoji)
+
+        # Symptom Quick Check
+        symptom_check(user)
+
+    with col2:
+        # Today's Focus
+        st.markdown("### 🎯 Today's Focus")
+
+        # Reminders that have fallen due, straight from the scheduler's heap
+        show_reminders(reminders.scheduler().due())
+
+        # Upcoming appointments
+        if not upcoming:
+            upcoming = appointments.index().upcoming(1)
+        if upcoming:
+            next_appt = upcoming[0]
+            days_until = (next_appt['datetime'] - datetime.now()).days
+            if days_until == 0:
+                st.success(f"📅 **Today**: {next_appt['title']} at {next_appt['datetime'].strftime('%I:%M %p')}")
+            elif days_until == 1:
+                st.info(f"📅 **Tomorrow**: {next_appt['title']} at {next_appt['datetime'].strftime('%I:%M %p')}")
+            else:
+                st.info(f"📅 **In {days_until} days**: {next_appt['title']}")
+
+        # Active goals
+        st.markdown("### 📋 Active Goals")
+        incomplete_goals = storage.fetch('goals', 'completed = 0', limit=4)
+        if incomplete_goals:
+            for goal in incomplete_goals[:4]:  # Show up to 4 goals
+                col_check, col_text = st.columns([0.15, 0.85])
+                with col_check:
+                    st.checkbox("", key=f"home_goal_{goal['id']}", value=goal['completed'], label_visibility="hidden",
+                                on_change=toggle_goal, args=(user['id'], goal['id']))
+                with col_text:
+                    category_emoji = {
+                        'Mindfulness': '🧘',
+                        'Exercise': '🏃',
+                        'Journaling': '📝',
+                        'Social': '👥',
+                        'Nutrition': '🥗',
+                        'Therapy': '💬'
+                    }.get(goal.get('category', ''), '🎯')
+                    st.write(f"{category_emoji} {goal['text']}")
+        else:
+            st.success("🎉 All goals completed! Add new ones to keep growing.")
+
+        if st.button("➕ Manage All Goals", use_container_width=True):
+            st.session_state.page = "🎯 Goals"
+            st.rerun()
+
+    st.markdown("---")
+
+    # Quick Actions with enhanced functionality
+    st.markdown("### 🚀 Quick Actions")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        if st.button("🌟 Coping Tools", use_container_width=True, key="quick_coping"):
+            st.session_state.page = "🌟 Coping Strategies"
+            st.rerun()
+        st.caption("Access breathing exercises and mindfulness techniques")
+
+    with col2:
+        if st.button("📞 Get Support", use_container_width=True, key="quick_support"):
+            st.session_state.page = "📞 Professional Support"
+            st.rerun()
+        st.caption("Find therapists and crisis resources")
+
+    with col3:
+        if st.button("📔 Write Journal", use_container_width=True, key="quick_journal"):
+            st.session_state.page = "📔 Journal"
+            st.rerun()
+        st.caption("Document your thoughts and feelings")
+
+    with col4:
+        if st.button("👥 Community", use_container_width=True, key="quick_community"):
+            st.session_state.page = "👥 Community"
+            st.rerun()
+        st.caption("Connect with others on similar journeys")
+
+    # Personalized tip based on user activity
+    st.markdown("---")
+
+    # Determine tip based on user patterns
+    last_journal_day = overview['journal_last_day']
+    last_journal_days = (datetime.now().date() - last_journal_day).days if last_journal_day else 999
+    meds_taken_today = overview['meds_taken']
+
+    if last_journal_days > 3:
+        tip = "💡 **Tip**: Journaling can help process emotions. Try writing for just 5 minutes today."
+    elif meds_taken_today == 0 and overview['meds_total']:
+        tip = "💊 **Reminder**: Don't forget to take your medications if you haven't already."
+    elif not incomplete_goals:
+        tip = "🎯 **Great job!** Consider setting a new goal to maintain your progress."
+    else:
+        tip = "🌟 **Remember**: Progress isn't linear. Every small step counts toward your wellness journey."
+
+    st.info(tip)
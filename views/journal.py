@@ -0,0 +1,96 @@
+"""Journal: writing entries and browsing them a window at a time."""
+import uuid
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+import counters
+import fragments
+import journal_enrichment
+import metrics
+import storage
+
+JOURNAL_PAGE_SIZE = 10
+
+
+@metrics.timed
+def add_journal_entry(content):
+    entry = storage.insert('journal_entries', {
+        'id': str(uuid.uuid4()),
+        'content': content,
+        'timestamp': datetime.now()
+    })
+    counters.engine().journal_added(entry['timestamp'])
+    # Tags, sentiment and mood are filled in on a worker; the save doesn't wait
+    journal_enrichment.submit(entry)
+    # Show the newest window so the new entry is visible
+    st.session_state.journal_cursor = (None, 'older')
+    st.success("📝 Journal entry saved!")
+    st.rerun()
+
+
+def show_enrichment(entry):
+    if entry.get('sentiment') is None:
+        st.caption("⏳ Analyzing tags and mood…")
+        return
+    tags = ' '.join(f"#{tag}" for tag in entry.get('tags') or [])
+    tone = "positive" if entry['sentiment'] >= 0.2 else "negative" if entry['sentiment'] <= -0.2 else "neutral"
+    st.caption(f"{tags or 'No tags'} • Mood {entry['mood']}/5 • Tone: {tone}")
+
+
+def render(user):
+    st.title("📔 Private Journal")
+    st.markdown("A safe, private space to document your thoughts and feelings.")
+    
+    with st.expander("✍️ Write New Entry", expanded=True):
+        with st.form("journal_form", clear_on_submit=True):
+            entry_content = st.text_area(
+                "How are you feeling?",
+                placeholder="Write your thoughts and feelings... This is a safe, private space.",
+                height=200
+            )
+            submitted = st.form_submit_button("📝 Save Entry", use_container_width=True)
+            
+            if submitted and entry_content:
+                add_journal_entry(entry_content)
+    
+    st.markdown("---")
+    st.markdown("### Past Entries")
+
+    # Only one window of entries is read and rendered; the cursor is the
+    # (timestamp, id) key the window starts from
+    if 'journal_cursor' not in st.session_state:
+        st.session_state.journal_cursor = (None, 'older')
+
+    jump_date = st.date_input("Jump to date", value=None, key="journal_jump")
+    if jump_date and jump_date != st.session_state.get('journal_jumped_to'):
+        st.session_state.journal_jumped_to = jump_date
+        next_day = datetime.combine(jump_date + timedelta(days=1), datetime.min.time())
+        st.session_state.journal_cursor = ((next_day.isoformat(), ''), 'older')
+
+    # Entries written before enrichment existed are analyzed in the background
+    journal_enrichment.ensure_backfilled()
+
+    cursor, direction = st.session_state.journal_cursor
+    window = storage.page('journal_entries', cursor, direction, limit=JOURNAL_PAGE_SIZE)
+    journal_entries = window['rows']
+    if journal_entries:
+        for entry in journal_entries:
+            with st.container():
+                st.caption(entry['timestamp'].strftime('%B %d, %Y at %I:%M %p'))
+                st.markdown(fragments.render('journal', entry), unsafe_allow_html=True)
+                show_enrichment(entry)
+
+        col_newer, col_older = st.columns(2)
+        with col_newer:
+            if st.button("⬅️ Newer", disabled=window['newer'] is None, use_container_width=True):
+                st.session_state.journal_cursor = (window['newer'], 'newer')
+                st.rerun()
+        with col_older:
+            if st.button("Older ➡️", disabled=window['older'] is None, use_container_width=True):
+                st.session_state.journal_cursor = (window['older'], 'older')
+                st.rerun()
+    elif cursor:
+        st.info("No entries on or before that date.")
+    else:
+        st.info("No journal entries yet. Start writing above!")
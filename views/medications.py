@@ -0,0 +1,165 @@
+"""Medications: reminders, the medication list and adherence history."""
+import uuid
+from datetime import datetime
+
+import streamlit as st
+import plotly.graph_objects as go
+
+import cache
+import counters
+import dose_store
+import metrics
+import reminders
+import storage
+from views.common import adherence_history, isolated, show_reminders
+
+ADHERENCE_SPANS = {'Last 7 Days': 7, 'Last 30 Days': 30, 'Last 90 Days': 90}
+
+
+@metrics.timed
+def add_medication(name, time, dosage='N/A', frequency='Daily', purpose='N/A'):
+    med = storage.insert('medications', {
+        'id': str(uuid.uuid4()),
+        'name': name,
+        'dosage': dosage,
+        'time': time,
+        'frequency': frequency,
+        'purpose': purpose,
+        'created': datetime.now()
+    })
+    counters.engine().medication_added(frequency)
+    reminders.scheduler().refresh_medication(med['id'])
+    st.success("💊 Medication reminder added!")
+    st.rerun()
+
+
+@metrics.timed
+def take_dose(med_id):
+    med = storage.get('medications', med_id)
+    if med:
+        taken_before = dose_store.taken_now([med])[med_id]
+        dose_store.record(med_id, True)
+        reminders.scheduler().refresh_medication(med_id)
+        counters.engine().dose_taken(med['frequency'], taken_before)
+    st.rerun()
+
+
+@metrics.timed
+def undo_dose(med_id):
+    med = storage.get('medications', med_id)
+    if med:
+        taken_before = dose_store.taken_now([med])[med_id]
+        if dose_store.undo(med):
+            reminders.scheduler().refresh_medication(med_id)
+            counters.engine().dose_undone(med['frequency'], taken_before)
+    st.rerun()
+
+
+@cache.versioned('medications', 'dose_events')
+def build_adherence_chart(days, today):
+    history = adherence_history(days, today)
+    if all(d['adherence'] is None for d in history):
+        return None
+    values = [None if d['adherence'] is None else round(100 * d['adherence']) for d in history]
+    fig = go.Figure(go.Bar(
+        x=[d['date'] for d in history],
+        y=values,
+        marker_color=['#10b981' if v is not None and v >= 80 else '#f59e0b' if v is not None and v >= 50 else '#ef4444'
+                      for v in values],
+        hovertemplate='%{x}: %{y}%<extra></extra>'
+    ))
+    fig.update_layout(
+        xaxis_title='Date',
+        yaxis_title='Doses Taken (%)',
+        yaxis=dict(range=[0, 105]),
+        template='plotly_white',
+        height=350,
+        margin=dict(t=20)
+    )
+    return fig
+
+
+@isolated
+def adherence_section(user):
+    # Changing the span only redraws this chart
+    span = st.session_state.get('adherence_span', next(iter(ADHERENCE_SPANS)))
+    history_days = ADHERENCE_SPANS[span]
+    st.markdown(f"### 📊 Adherence History ({span})")
+    st.selectbox("Show", list(ADHERENCE_SPANS), key="adherence_span")
+    fig = build_adherence_chart(history_days, datetime.now().date().isoformat())
+    if fig is None:
+        st.info("Mark scheduled medications as taken to see your adherence history here.")
+    else:
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def render(user):
+    st.title("💊 Medication Management")
+
+    # Today's medications summary
+    medications = storage.fetch('medications')
+    overview = counters.engine().snapshot()
+    taken_today = overview['meds_scheduled_taken']
+    total_today = overview['meds_scheduled']
+
+    if total_today > 0:
+        st.metric("Today's Adherence", f"{taken_today}/{total_today}", f"{(taken_today/total_today*100):.0f}%")
+
+    show_reminders([r for r in reminders.scheduler().due() if r['kind'] == 'medication'])
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.markdown("### ➕ Add Medication")
+        with st.form("med_form", clear_on_submit=True):
+            med_name = st.text_input("Medication Name", placeholder="e.g., Sertraline")
+            med_dosage = st.text_input("Dosage", placeholder="e.g., 50mg")
+            med_time = st.time_input("Time to Take")
+            med_frequency = st.selectbox("Frequency", ["Daily", "Twice Daily", "As needed (PRN)", "Weekly"])
+            med_purpose = st.text_input("Purpose", placeholder="e.g., Anxiety/Depression")
+
+            submitted = st.form_submit_button("➕ Add Medication", use_container_width=True)
+
+            if submitted and med_name:
+                add_medication(med_name, med_time.strftime('%I:%M %p'), med_dosage or 'N/A',
+                               'PRN' if med_frequency == 'As needed (PRN)' else med_frequency, med_purpose or 'N/A')
+
+    with col2:
+        st.markdown("### 📋 Your Medications")
+
+        if medications:
+            taken = dose_store.taken_now(medications)
+            for med in medications:
+                with st.container():
+                    col_icon, col_info, col_status = st.columns([0.5, 6, 2])
+
+                    with col_icon:
+                        st.markdown("<p style='font-size: 2em; margin: 0;'>💊</p>", unsafe_allow_html=True)
+
+                    with col_info:
+                        st.markdown(f"**{med['name']}** ({med.get('dosage', 'N/A')})")
+                        st.caption(f"⏰ {med['time']} • {med.get('frequency', 'Daily')} • {med.get('purpose', 'N/A')}")
+
+                    with col_status:
+                        # Each scheduled dose of the current period is marked on its own
+                        due = dose_store.doses_due(med['frequency'])
+                        done = taken[med['id']]
+                        if med['frequency'] == 'PRN':
+                            st.info("💡 As needed")
+                        elif done >= due:
+                            st.success("✅ Taken This Week" if med['frequency'] == 'Weekly' else "✅ Taken Today")
+                        else:
+                            label = "Mark Taken" if due == 1 else f"Mark Dose {done + 1} of {due}"
+                            if st.button(label, key=f"med_{med['id']}", use_container_width=True):
+                                take_dose(med['id'])
+                        if med['frequency'] != 'PRN' and done:
+                            if st.button("↩️ Undo", key=f"undo_{med['id']}", use_container_width=True):
+                                undo_dose(med['id'])
+
+                st.markdown("---")
+        else:
+            st.info("No medications added yet. Add your first medication above!")
+
+    # Medication history/adherence chart
+    adherence_section(user)
+    st.caption("Medication adherence tracking helps monitor treatment effectiveness. Consult your healthcare provider for any changes.")
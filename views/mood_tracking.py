@@ -0,0 +1,78 @@
+"""Mood Tracking: logging a mood, the mood trend and the weekly pattern."""
+import html
+
+import streamlit as st
+import plotly.graph_objects as go
+
+import cache
+import mood_analytics
+import storage
+from views.charts import plot_mood_trend
+from views.common import add_mood
+
+
+@cache.versioned('moods')
+def build_weekday_pattern():
+    profile = mood_analytics.weekday_profile()
+    if profile is None or profile.isna().all():
+        return None
+    fig = go.Figure(go.Bar(
+        x=profile.index,
+        y=profile.round(2),
+        marker_color=['#10b981' if v >= 0 else '#f59e0b' for v in profile.fillna(0)],
+        hovertemplate='%{x}: %{y:+.2f}<extra></extra>'
+    ))
+    fig.update_layout(
+        yaxis_title='vs. Your Average',
+        template='plotly_white',
+        height=250,
+        margin=dict(t=20)
+    )
+    return fig
+
+
+def render(user):
+    st.title("😊 Mood Tracking")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("### Log Your Mood")
+        mood_options = [
+            (5, "Great", "😊"),
+            (4, "Good", "🙂"),
+            (3, "Okay", "😐"),
+            (2, "Low", "😔"),
+            (1, "Very Low", "😢")
+        ]
+        
+        for value, label, emoji in mood_options:
+            if st.button(f"{emoji} {label}", key=f"mood_log_{value}", use_container_width=True):
+                add_mood(value, label, emoji)
+    
+    with col2:
+        st.markdown("### Mood Trends")
+        plot_mood_trend()
+        weekday_fig = build_weekday_pattern()
+        if weekday_fig is not None:
+            st.markdown("### Weekly Pattern")
+            st.plotly_chart(weekday_fig, use_container_width=True)
+    
+    st.markdown("---")
+    st.markdown("### Recent Mood History")
+    
+    recent_moods = storage.fetch('moods', descending=True, limit=10)
+    if recent_moods:
+        for mood in recent_moods:
+            col1, col2, col3 = st.columns([0.5, 2, 1])
+            with col1:
+                st.markdown(f"<h1 style='margin: 0;'>{html.escape(mood['emoji'] or '')}</h1>", unsafe_allow_html=True)
+            with col2:
+                st.write(f"**{mood['label']}**")
+                st.caption(mood['datetime'].strftime('%B %d, %Y at %I:%M %p'))
+            with col3:
+                # Progress bar
+                progress = mood['value'] / 5
+                st.progress(progress)
+    else:
+        st.info("No mood entries yet. Start tracking above!")
@@ -0,0 +1,251 @@
+"""Professional Support: crisis lines, the therapist finder and resources."""
+import streamlit as st
+
+import catalog
+import therapists
+from views.common import isolated
+
+
+@isolated
+def search_filters(user):
+    # Picking filters only reruns this column; results change on Search
+    st.markdown("#### Search Criteria")
+
+    # Search filters
+    specialty = st.multiselect(
+        "Specialties:",
+        ["Anxiety", "Depression", "Trauma/PTSD", "Bipolar Disorder", "OCD", "Eating Disorders",
+         "Substance Use", "Relationship Issues", "LGBTQ+ Issues", "Grief & Loss", "Stress Management"],
+        key="specialty_filter"
+    )
+
+    therapy_types = st.multiselect(
+        "Therapy Types:",
+        ["Cognitive Behavioral (CBT)", "Dialectical Behavior (DBT)", "Psychodynamic", "Humanistic",
+         "Family Systems", "EMDR", "Mindfulness-Based", "Solution-Focused", "Art Therapy", "Group Therapy"],
+        key="therapy_filter"
+    )
+
+    insurance = st.multiselect(
+        "Insurance Accepted:",
+        ["Aetna", "Blue Cross Blue Shield", "Cigna", "UnitedHealthcare", "Medicare", "Medicaid",
+         "Self-Pay", "Sliding Scale"],
+        key="insurance_filter"
+    )
+
+    session_format = st.multiselect(
+        "Session Format:",
+        ["In-Person", "Video", "Phone", "Text/Chat"],
+        default=["Video"],
+        key="format_filter"
+    )
+
+    max_cost = st.slider("Maximum Cost per Session ($):", 50, 300, 150, key="cost_filter")
+
+    location = st.text_input("Location (City, State):", placeholder="e.g., New York, NY", key="location_filter")
+
+    if st.button("🔍 Search Therapists", use_container_width=True):
+        st.session_state.search_query = {
+            'specialties': specialty,
+            'approaches': therapy_types,
+            'insurance': insurance,
+            'formats': session_format,
+            'max_cost': max_cost,
+            'location': location,
+        }
+        st.session_state.search_page = 0
+        st.rerun()
+
+
+def render(user):
+    st.title("📞 Professional Support & Resources")
+
+    # Initialize provider search state
+    if 'search_query' not in st.session_state:
+        st.session_state.search_query = None
+        st.session_state.search_page = 0
+    if 'selected_provider' not in st.session_state:
+        st.session_state.selected_provider = None
+
+    # Crisis Support Section
+    st.markdown("### 🆘 Immediate Crisis Support")
+    st.markdown("*If you're in crisis or having thoughts of self-harm, please reach out immediately. Help is available 24/7 and confidential.*")
+
+    for resource in catalog.catalog()['crisis_resources']:
+        with st.container():
+            col1, col2, col3 = st.columns([0.5, 2, 1])
+            with col1:
+                st.markdown(resource['icon_html'], unsafe_allow_html=True)
+            with col2:
+                st.markdown(f"**{resource['name']}**")
+                st.markdown(f"*{resource['contact']}*")
+                st.caption(resource['description'])
+            with col3:
+                st.markdown(f"**{resource['availability']}**")
+                if st.button("Contact", key=resource['key'], use_container_width=True):
+                    st.success(f"Opening contact for {resource['name']}")
+
+    st.markdown("---")
+
+    # Therapist Finder
+    st.markdown("### 🔍 Find a Therapist")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        search_filters(user)
+
+    with col2:
+        st.markdown("#### Search Results")
+
+        search_results, total_matches = [], 0
+        if st.session_state.search_query is not None:
+            search_results, total_matches = therapists.directory().search(
+                page=st.session_state.search_page, **st.session_state.search_query)
+            st.caption(f"{total_matches} therapist{'s' if total_matches != 1 else ''} found")
+
+        if search_results:
+            for provider in search_results:
+                with st.container():
+                    # Provider header
+                    col_name, col_rating = st.columns([3, 1])
+                    with col_name:
+                        st.markdown(f"**{provider['name']}**")
+                        st.caption(f"⭐ {provider['rating']} ({provider['reviews']} reviews)")
+                    with col_rating:
+                        st.markdown(f"**{provider['availability']}**")
+
+                    # Specialties and approaches
+                    specialties_str = ", ".join(provider['specialties'][:3])
+                    if len(provider['specialties']) > 3:
+                        specialties_str += f" +{len(provider['specialties'])-3} more"
+                    st.caption(f"🎯 {specialties_str}")
+
+                    approaches_str = ", ".join(provider['approaches'][:2])
+                    if len(provider['approaches']) > 2:
+                        approaches_str += f" +{len(provider['approaches'])-2} more"
+                    st.caption(f"🛠️ {approaches_str}")
+
+                    # Cost and insurance
+                    col_cost, col_format = st.columns([1, 1])
+                    with col_cost:
+                        st.caption(f"💰 {provider['cost']}")
+                    with col_format:
+                        formats_str = ", ".join(provider['formats'])
+                        st.caption(f"📱 {formats_str}")
+
+                    # Action buttons
+                    col_view, col_book = st.columns([1, 1])
+                    with col_view:
+                        if st.button("View Profile", key=f"view_{provider['id']}", use_container_width=True):
+                            st.session_state.selected_provider = provider
+                            st.rerun()
+                    with col_book:
+                        if st.button("Book Consultation", key=f"book_{provider['id']}", use_container_width=True):
+                            st.success(f"📅 Consultation request sent to {provider['name'].split(',')[0]}!")
+
+                st.markdown("---")
+
+            last_page = (total_matches - 1) // therapists.PAGE_SIZE
+            col_prev, col_page, col_next = st.columns([1, 1, 1])
+            with col_prev:
+                if st.button("⬅️ Previous", disabled=st.session_state.search_page == 0, use_container_width=True):
+                    st.session_state.search_page -= 1
+                    st.rerun()
+            with col_page:
+                st.caption(f"Page {st.session_state.search_page + 1} of {last_page + 1}")
+            with col_next:
+                if st.button("Next ➡️", disabled=st.session_state.search_page >= last_page, use_container_width=True):
+                    st.session_state.search_page += 1
+                    st.rerun()
+        elif st.session_state.search_query is not None:
+            st.info("No therapists match those filters. Try widening your search.")
+        else:
+            st.info("Use the filters on the left to search for therapists in your area.")
+
+    # Selected Provider Details
+    if st.session_state.selected_provider:
+        provider = st.session_state.selected_provider
+        st.markdown("---")
+        st.markdown(f"### 👤 {provider['name']}")
+
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.markdown(f"**⭐ {provider['rating']}** ({provider['reviews']} reviews)")
+            st.markdown(f"**📍 {provider['location']}**")
+            st.markdown(f"**💼 {provider['credentials']}**")
+            st.markdown(f"**⏰ {provider['experience']} experience**")
+
+            st.markdown("**Specialties:**")
+            for specialty in provider['specialties']:
+                st.markdown(f"• {specialty}")
+
+            st.markdown("**Therapy Approaches:**")
+            for approach in provider['approaches']:
+                st.markdown(f"• {approach}")
+
+        with col2:
+            st.markdown("**Accepted Insurance:**")
+            for ins in provider['insurance']:
+                st.markdown(f"• {ins}")
+
+            st.markdown(f"**Session Formats:** {', '.join(provider['formats'])}")
+            st.markdown(f"**Cost:** {provider['cost']}")
+
+            if st.button("📞 Schedule Consultation", use_container_width=True):
+                st.success("Consultation request sent! You'll receive a confirmation email shortly.")
+
+            if st.button("❌ Close Profile", use_container_width=True):
+                st.session_state.selected_provider = None
+                st.rerun()
+
+    st.markdown("---")
+
+    # Additional Resources
+    st.markdown("### 📚 Additional Resources")
+
+    for resource in catalog.catalog()['support_resources']:
+        with st.container():
+            col_icon, col_content, col_link = st.columns([0.5, 3, 1])
+            with col_icon:
+                st.markdown(resource['icon_html'], unsafe_allow_html=True)
+            with col_content:
+                st.markdown(f"**{resource['title']}**")
+                st.caption(resource['description'])
+            with col_link:
+                if st.button("Visit", key=resource['key'], use_container_width=True):
+                    st.success(f"Opening {resource['link']}")
+
+    # Insurance & Cost Information
+    st.markdown("---")
+    st.markdown("### 💳 Insurance & Cost Information")
+
+    with st.expander("Understanding Therapy Costs & Insurance", expanded=False):
+        st.markdown("""
+        **Average Therapy Costs (2024):**
+        - Individual therapy: $100-200 per session
+        - Couples therapy: $150-250 per session
+        - Group therapy: $50-80 per session
+
+        **Insurance Coverage:**
+        - Most major insurers cover mental health treatment
+        - Deductibles and co-pays may apply
+        - Some plans require referrals from primary care
+        - Out-of-network providers may cost more
+
+        **Financial Assistance Options:**
+        - Sliding scale fees based on income
+        - Low-cost clinics and community centers
+        - Employee assistance programs (EAP)
+        - State-funded mental health services
+        """)
+
+    # Tips for Finding the Right Therapist
+    st.markdown("---")
+    st.markdown("### 💡 Tips for Finding the Right Therapist")
+
+    for tip in catalog.catalog()['therapist_tips']:
+        st.markdown(f"- {tip}")
+
+    st.info("**Remember**: Finding the right therapist may take time. It's okay to try a few before finding the best fit for your needs.")
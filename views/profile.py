@@ -0,0 +1,117 @@
+"""Profile: account summary, progress and data export/import."""
+import tempfile
+import zipfile
+from datetime import datetime
+
+import streamlit as st
+
+import counters
+import journal_enrichment
+import transfer
+from views.common import medication_adherence
+
+EXPORT_FORMATS = {
+    "JSON Lines (.jsonl)": ('jsonl', 'application/x-ndjson'),
+    "CSV (.zip)": ('zip', 'application/zip'),
+}
+
+
+def prepare_export(export_format, out):
+    """Write the archive to the binary file ``out``, a chunk at a time; returns its name and mime type"""
+    suffix, mime = EXPORT_FORMATS[export_format]
+    if suffix == 'jsonl':
+        for text in transfer.iter_jsonl():
+            out.write(text.encode('utf-8'))
+    else:
+        transfer.write_csv_zip(out)
+    out.seek(0)
+    return f"mindcare-{datetime.now().strftime('%Y%m%d')}.{suffix}", mime
+
+
+def import_archive(upload):
+    try:
+        report = transfer.import_records(transfer.read(upload, upload.name))
+    except (ValueError, zipfile.BadZipFile) as e:
+        st.error(f"Couldn't read {upload.name}: {e}")
+        return
+    # Imported journal entries are tagged and scored in the background
+    if report['imported'].get('journal_entries'):
+        journal_enrichment.backfill()
+    imported = sum(report['imported'].values())
+    st.success(f"📥 Imported {imported} record{'s' if imported != 1 else ''}"
+               + (f", skipped {report['skipped']} already here" if report['skipped'] else ""))
+    if report['errors']:
+        st.warning(f"{report['errors']} record{'s' if report['errors'] != 1 else ''} couldn't be imported")
+        st.caption("\n\n".join(report['problems'][:10]))
+
+
+def render(user):
+    st.title("👤 My Profile")
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.markdown("### 👤 Personal Information")
+        overview = counters.engine().snapshot()
+        adherence = medication_adherence(30)
+
+        st.markdown(f"**Name:** {user['name']}")
+        st.markdown(f"**Age:** {user['age'] or '—'}")
+        st.markdown(f"**Diagnosis:** {user['diagnosis'] or '—'}")
+        st.markdown(f"**Therapist:** {user['therapist'] or '—'}")
+        st.markdown(f"**Emergency Contact:** {user['emergency_contact'] or '—'}")
+        st.markdown(f"**Member Since:** {user['joined'].strftime('%B %Y')}")
+
+    with col2:
+        st.markdown("### 🏆 Achievements & Milestones")
+
+        achievements = [
+            ("🎯 Goal Setter", f"Completed {overview['goals_completed']} wellness goals"),
+            ("📝 Journal Keeper", f"{overview['journal_total']} journal entries written"),
+            ("💊 Medication Hero", f"{adherence if adherence is not None else 0}% adherence rate"),
+            ("🧘 Therapy Attendee", f"{user['therapy_sessions']} sessions completed"),
+            ("🌅 Recovery Journey", f"{user['days_sober']} days of progress"),
+        ]
+
+        for icon, desc in achievements:
+            st.markdown(f"{icon} {desc}")
+
+    st.markdown("---")
+    st.markdown("### 📊 Progress Metrics")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Therapy Sessions", user['therapy_sessions'])
+        st.metric("Journal Entries", overview['journal_total'])
+
+    with col2:
+        st.metric("Goals Completed", overview['goals_completed'])
+        st.metric("Days of Progress", user['days_sober'])
+
+    with col3:
+        st.metric("Med Adherence", f"{adherence}%" if adherence is not None else "—")
+        streak = overview['journal_streak']
+        st.metric("Current Streak", f"{streak} day{'s' if streak != 1 else ''}")
+
+    st.markdown("---")
+    st.markdown("### 📦 Your Data")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Export**")
+        export_format = st.selectbox("Format", list(EXPORT_FORMATS), key="export_format")
+        # Built on request only, a Profile rerun shouldn't read every collection.
+        # The archive is streamed to a temporary file and handed straight to
+        # the download button, so it is never kept in the session's state
+        if st.button("📦 Prepare Export", key="prepare_export", use_container_width=True):
+            with tempfile.TemporaryFile() as archive:
+                name, mime = prepare_export(export_format, archive)
+                st.download_button(f"⬇️ Download {name}", archive.read(), file_name=name, mime=mime,
+                                   use_container_width=True)
+
+    with col2:
+        st.markdown("**Import**")
+        upload = st.file_uploader("JSONL file or zip of CSVs", type=['jsonl', 'zip'], key="import_file")
+        if upload is not None and st.button("📥 Import", key="run_import", use_container_width=True):
+            import_archive(upload)